@@ -0,0 +1,76 @@
+"""
+Benchmark: carga del catálogo en JSON con indent=2 (formato antiguo) frente
+al cache binario de catalog_cache.py, con 100, 1k y 10k proyectos.
+
+Uso: python benchmarks/bench_catalog_cache.py
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from catalog_cache import write_catalog_cache, read_catalog_cache, read_catalog_cache_header
+
+SIZES = [100, 1000, 10000]
+REPEATS = 20
+
+
+def make_catalog(count):
+    proyectos = []
+    for i in range(count):
+        proyectos.append({
+            "id_proyecto": f"proyecto-{i:05d}",
+            "titulo": f"Juego traducido número {i}",
+            "descripcion": "Traducción al español de una novela visual hecha en Ren'Py. " * 3,
+            "custom_desc": "Parche de traducción completo, incluye menús y textos del juego.",
+            "imagen_portada": f"https://traduction-club.live/media/portadas/proyecto-{i:05d}.png",
+            "icon": f"https://traduction-club.live/media/iconos/proyecto-{i:05d}.png",
+            "url_descarga": f"https://traduction-club.live/descargas/proyecto-{i:05d}.zip",
+            "nombre_ejecutable": "Juego.exe",
+            "version": f"1.{i % 10}",
+            "tamano_gb": round(0.5 + (i % 40) / 10, 1),
+        })
+    return {"version_catalogo": "2024.10.01", "proyectos": proyectos}
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    meta = {"etag": '"abc123"', "last_modified": "Tue, 01 Oct 2024 10:00:00 GMT"}
+    print(f"{'proyectos':>10} {'json KB':>9} {'bin KB':>8} {'json ms':>9} {'bin ms':>8} {'x':>6} {'ver json ms':>12} {'ver bin ms':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in SIZES:
+            data = make_catalog(count)
+            json_path = os.path.join(tmp, f"catalogo_{count}.json")
+            bin_path = os.path.join(tmp, f"catalogo_{count}.bin")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_catalog_cache(data, meta, bin_path)
+
+            def load_json():
+                with open(json_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+
+            def version_json():
+                return load_json().get("version_catalogo")
+
+            assert read_catalog_cache(bin_path)[1] == load_json()
+            json_ms = best_of(load_json)
+            bin_ms = best_of(lambda: read_catalog_cache(bin_path))
+            ver_json_ms = best_of(version_json)
+            ver_bin_ms = best_of(lambda: read_catalog_cache_header(bin_path))
+            print(f"{count:>10} {os.path.getsize(json_path) / 1024:>9.0f} {os.path.getsize(bin_path) / 1024:>8.0f} "
+                  f"{json_ms:>9.2f} {bin_ms:>8.2f} {json_ms / bin_ms:>6.1f} {ver_json_ms:>12.2f} {ver_bin_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
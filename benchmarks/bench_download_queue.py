@@ -0,0 +1,132 @@
+"""
+Benchmark: instalar un lote de juegos todos a la vez frente a una cola con
+pocas instalaciones simultáneas (la política de download_queue.py).
+
+Se levanta un servidor HTTP local cuyo ancho de banda total está limitado
+y se reparte entre todas las conexiones abiertas, como una línea doméstica.
+Cada instalación descarga su zip con downloader.download_file y lo extrae
+con zip_install.extract_archive. Se mide cuándo queda listo cada juego y
+cuánto tarda el lote completo.
+
+Lo que mejora la cola es la espera por juego (el primero y la media), no
+el total: la línea es el cuello de botella y va llena en todos los casos,
+así que el lote tarda lo mismo con cualquier número de simultáneas. Con
+6 juegos de 12 MB y 16 MB/s, por ejemplo: todas a la vez, primer juego
+4.5 s y lote 4.6 s; de una en una, primer juego 0.8 s, media 2.7 s y
+lote 4.7 s.
+
+Uso: python benchmarks/bench_download_queue.py [juegos] [MB por juego]
+"""
+import io
+import os
+import sys
+import time
+import zipfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from downloader import download_file
+from zip_install import extract_archive
+
+LINK_MBPS = 16.0  # MB/s de toda la línea
+BLOCK = 64 * 1024
+CONCURRENCY = [0, 1, 2, 3]  # 0 = todas a la vez
+
+
+class SharedLink:
+    """Cubo de tokens compartido por todas las conexiones del servidor."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.lock = threading.Lock()
+        self.next_free = time.perf_counter()
+
+    def take(self, n):
+        with self.lock:
+            now = time.perf_counter()
+            self.next_free = max(self.next_free, now) + n / self.rate
+            wait = self.next_free - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+class SharedLinkHandler(BaseHTTPRequestHandler):
+    archives = {}
+    link = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        data = self.archives[self.path.lstrip("/")]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        try:
+            for offset in range(0, len(data), BLOCK):
+                block = data[offset:offset + BLOCK]
+                self.link.take(len(block))
+                self.wfile.write(block)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def build_archive(size_mb):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zip_ref:
+        for i in range(size_mb):
+            # Mitad datos aleatorios (no comprimen), mitad repetidos
+            chunk = os.urandom(1024 * 1024) if i % 2 else bytes(1024 * 1024)
+            zip_ref.writestr(f"datos/{i:04d}.bin", chunk)
+    return buffer.getvalue()
+
+
+def install(url, name, tmp, started):
+    dest = os.path.join(tmp, name)
+    os.makedirs(dest)
+    zip_path = os.path.join(dest, "juego.zip")
+    download_file(url, zip_path)
+    extract_archive(zip_path, dest)
+    os.remove(zip_path)
+    return time.perf_counter() - started
+
+
+def run_batch(base_url, names, concurrency, tmp):
+    workers = concurrency or len(names)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(install, f"{base_url}/{name}", f"{concurrency}_{name}", tmp, started)
+            for name in names
+        ]
+        ready = sorted(future.result() for future in futures)
+    return ready
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    archive = build_archive(size_mb)
+    names = [f"juego{i}.zip" for i in range(games)]
+    SharedLinkHandler.archives = {name: archive for name in names}
+    SharedLinkHandler.link = SharedLink(LINK_MBPS * 1024 * 1024)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SharedLinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    print(f"{games} juegos de {len(archive) / (1024 * 1024):.0f} MB, línea de {LINK_MBPS} MB/s compartida")
+    print(f"{'simultáneas':>12} {'primer juego':>13} {'media':>8} {'lote':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for concurrency in CONCURRENCY:
+            ready = run_batch(base_url, names, concurrency, tmp)
+            label = "todas" if concurrency == 0 else str(concurrency)
+            print(f"{label:>12} {ready[0]:>12.2f}s {sum(ready) / len(ready):>7.2f}s {ready[-1]:>7.2f}s")
+    print("El lote dura lo que la línea tarda en bajarlo todo; la cola solo adelanta cada juego.")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
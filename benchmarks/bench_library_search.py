@@ -0,0 +1,75 @@
+"""
+Benchmark: búsqueda instantánea de la biblioteca (CatalogSearchIndex de
+launcher_pyqt6.py) con 100, 1k y 10k proyectos.
+
+Se mide cuánto tarda en construirse el catálogo con su índice y lo que
+cuesta cada pulsación al escribir una consulta letra a letra: la búsqueda
+en el índice más el filtrado del modelo de la biblioteca. El objetivo es
+quedar muy por debajo de un frame (~16 ms) con 10k proyectos.
+
+Uso: python benchmarks/bench_library_search.py
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from launcher_pyqt6 import ProjectCatalog, LibraryListModel
+
+SIZES = [100, 1000, 10000]
+REPEATS = 5
+FRAME_MS = 16
+QUERIES = ["traduccion", "novela visual", "juego 42", "aventura espacial", "zzz"]
+WORDS = ["aventura", "misterio", "romance", "terror", "escuela", "verano", "espacial",
+         "fantasía", "detective", "ciudad", "isla", "dragón", "academia", "noche"]
+
+
+def make_catalog(count):
+    rng = random.Random(count)
+    proyectos = []
+    for i in range(count):
+        tema = " ".join(rng.sample(WORDS, 3))
+        proyectos.append({
+            "id_proyecto": f"proyecto-{i:05d}",
+            "titulo": f"Juego {i} {tema.title()}",
+            "descripcion": f"Traducción al español de una novela visual de {tema}. " * 2,
+            "nombre_ejecutable": "Juego.exe",
+            "version": f"1.{i % 10}",
+        })
+    return {"version_catalogo": "2024.10.01", "proyectos": proyectos}
+
+
+def keystrokes(query):
+    return [query[:n] for n in range(1, len(query) + 1)]
+
+
+def main():
+    print(f"{'proyectos':>10} {'índice ms':>10} {'media ms':>9} {'p99 ms':>8} {'peor ms':>8} {'< frame':>8}")
+    for count in SIZES:
+        data = make_catalog(count)
+        build_ms = float("inf")
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            # Sin bibliotecas: el estado de instalación no interesa aquí
+            catalog = ProjectCatalog(data, libraries=[])
+            build_ms = min(build_ms, (time.perf_counter() - start) * 1000)
+
+            model = LibraryListModel(prefetcher=None)
+            model.set_catalog(catalog)
+            for query in QUERIES:
+                for text in keystrokes(query):
+                    start = time.perf_counter()
+                    model.set_filter(catalog.search(text))
+                    timings.append((time.perf_counter() - start) * 1000)
+                model.set_filter(None)
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        mean = sum(timings) / len(timings)
+        print(f"{count:>10} {build_ms:>10.1f} {mean:>9.3f} {p99:>8.3f} {timings[-1]:>8.3f} "
+              f"{'sí' if timings[-1] < FRAME_MS else 'no':>8}")
+
+
+if __name__ == "__main__":
+    main()
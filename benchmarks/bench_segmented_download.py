@@ -0,0 +1,110 @@
+"""
+Benchmark: descarga de un archivo grande con una conexión frente a la
+descarga segmentada de downloader.py con 2, 4 y 8 conexiones.
+
+Se levanta un servidor HTTP local con soporte de Range que limita el ancho
+de banda de cada conexión y añade latencia a cada petición, como un enlace
+lejano donde una sola conexión no llena la línea. En el escenario "lenta"
+una de cada cuatro conexiones va a un cuarto de velocidad, para ver el
+efecto del reequilibrio de segmentos.
+
+Uso: python benchmarks/bench_segmented_download.py
+"""
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from downloader import download_file
+
+FILE_MB = 64
+CONNECTION_MBPS = 4.0  # MB/s por conexión
+LATENCY = 0.05  # segundos por petición
+CONNECTIONS = [1, 2, 4, 8]
+BLOCK = 64 * 1024
+
+
+class ThrottledRangeHandler(BaseHTTPRequestHandler):
+    data = b""
+    slow_every = 0  # 0 = todas las conexiones a la misma velocidad
+    _count = 0
+    _count_lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with ThrottledRangeHandler._count_lock:
+            ThrottledRangeHandler._count += 1
+            number = ThrottledRangeHandler._count
+        rate = CONNECTION_MBPS * 1024 * 1024
+        if self.slow_every and number % self.slow_every == 0:
+            rate /= 4
+        time.sleep(LATENCY)
+
+        size = len(self.data)
+        start, end, status = 0, size - 1, 200
+        range_header = self.headers.get("Range")
+        if range_header:
+            first, last = range_header.split("=", 1)[1].split("-")
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("ETag", '"bench"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+
+        began = time.perf_counter()
+        sent = 0
+        try:
+            for offset in range(start, end + 1, BLOCK):
+                block = self.data[offset:min(offset + BLOCK, end + 1)]
+                self.wfile.write(block)
+                sent += len(block)
+                ahead = sent / rate - (time.perf_counter() - began)
+                if ahead > 0:
+                    time.sleep(ahead)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def run_scenario(url, expected_digest, connections, tmp):
+    dest = os.path.join(tmp, f"juego_{connections}.zip")
+    start = time.perf_counter()
+    download_file(url, dest, connections=connections)
+    seconds = time.perf_counter() - start
+    with open(dest, "rb") as f:
+        assert hashlib.sha256(f.read()).hexdigest() == expected_digest
+    os.remove(dest)
+    return seconds
+
+
+def main():
+    ThrottledRangeHandler.data = os.urandom(FILE_MB * 1024 * 1024)
+    expected_digest = hashlib.sha256(ThrottledRangeHandler.data).hexdigest()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledRangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/juego.zip"
+
+    print(f"Archivo de {FILE_MB} MB, {CONNECTION_MBPS} MB/s por conexión, {LATENCY * 1000:.0f} ms de latencia")
+    print(f"{'escenario':>10} {'conexiones':>11} {'segundos':>9} {'MB/s':>7} {'x':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scenario, slow_every in (("uniforme", 0), ("lenta", 4)):
+            ThrottledRangeHandler.slow_every = slow_every
+            baseline = None
+            for connections in CONNECTIONS:
+                seconds = run_scenario(url, expected_digest, connections, tmp)
+                baseline = baseline or seconds
+                print(f"{scenario:>10} {connections:>11} {seconds:>9.2f} {FILE_MB / seconds:>7.1f} {baseline / seconds:>6.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: extracción de un zip sintético grande con zipfile.extractall
+(un hilo, como antes) frente a zip_install.extract_archive con 1, 2, 4 y 8
+hilos.
+
+El archivo imita un juego de Ren'Py: unos pocos .rpa grandes y muchos
+archivos pequeños, mitad datos comprimibles y mitad aleatorios.
+
+Uso: python benchmarks/bench_zip_extract.py [MB]   (por defecto 2048)
+"""
+import os
+import sys
+import time
+import shutil
+import zipfile
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from zip_install import extract_archive
+
+ARCHIVE_MB = 2048
+WORKERS = [1, 2, 4, 8]
+BLOCK = 1024 * 1024
+
+
+def write_entry(zip_ref, name, size_mb, compressible):
+    text = b"label start:\n    e \"Hola, esto es una prueba de traduccion.\"\n" * 16384
+    info = zipfile.ZipInfo(name)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with zip_ref.open(info, "w", force_zip64=True) as f:
+        for i in range(size_mb):
+            f.write(text[:BLOCK] if compressible and i % 4 != 3 else os.urandom(BLOCK))
+
+
+def make_archive(path, total_mb):
+    big = max(1, total_mb // 8)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        # 6 archivos grandes (archive.rpa, images.rpa...) y el resto en archivos de 1 MB
+        for i in range(6):
+            write_entry(zip_ref, f"juego/game/archive{i}.rpa", big, compressible=i % 2 == 0)
+        for i in range(total_mb - 6 * big):
+            write_entry(zip_ref, f"juego/game/images/img{i:05d}.png", 1, compressible=i % 2 == 0)
+    return total_mb
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    total_mb = int(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVE_MB
+    with tempfile.TemporaryDirectory() as tmp:
+        zip_path = os.path.join(tmp, "juego.zip")
+        print(f"Generando zip de {total_mb} MB...")
+        make_archive(zip_path, total_mb)
+        print(f"zip: {os.path.getsize(zip_path) / 1024 / 1024:.0f} MB comprimido, {os.cpu_count()} núcleos")
+        print(f"{'método':>22} {'segundos':>9} {'MB/s':>7} {'x':>6}")
+
+        def run(label, fn):
+            out = os.path.join(tmp, "out")
+            seconds = timed(lambda: fn(out))
+            shutil.rmtree(out)
+            return seconds
+
+        baseline = run("extractall", lambda out: zipfile.ZipFile(zip_path).extractall(out))
+        print(f"{'extractall':>22} {baseline:>9.2f} {total_mb / baseline:>7.0f} {1.0:>6.1f}")
+        for workers in WORKERS:
+            seconds = run(workers, lambda out: extract_archive(zip_path, out, workers=workers))
+            print(f"{f'extract_archive x{workers}':>22} {seconds:>9.2f} {total_mb / seconds:>7.0f} {baseline / seconds:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import json
+import marshal
+import struct
+
+# =============================================================================
+# CACHE BINARIO DEL CATÁLOGO
+# =============================================================================
+#
+# Formato del archivo:
+#   [4 bytes]  firma CATALOG_CACHE_MAGIC
+#   [4 bytes]  longitud de la cabecera (uint32, little endian)
+#   [N bytes]  cabecera JSON: version_catalogo, etag, last_modified, marshal_version
+#   [resto]    catálogo completo serializado con marshal
+#
+# La cabecera permite consultar la versión y los validadores HTTP leyendo
+# unos pocos bytes, sin deserializar el catálogo.
+
+CATALOG_CACHE_MAGIC = b"TCC1"
+CATALOG_CACHE_PREFIX = struct.Struct("<4sI")
+
+
+def write_catalog_cache(data, meta, filepath):
+    """Guardar el catálogo y sus validadores en el cache binario."""
+    meta = meta or {}
+    header = {
+        "version_catalogo": data.get("version_catalogo"),
+        "etag": meta.get("etag"),
+        "last_modified": meta.get("last_modified"),
+        "marshal_version": marshal.version,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(CATALOG_CACHE_PREFIX.pack(CATALOG_CACHE_MAGIC, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(marshal.dumps(data))
+        os.replace(tmp_path, filepath)
+        return True
+    except (IOError, OSError, ValueError) as e:
+        print(f"Error al guardar el cache del catálogo: {e}")
+        return False
+
+
+def _read_header(f):
+    prefix = f.read(CATALOG_CACHE_PREFIX.size)
+    if len(prefix) != CATALOG_CACHE_PREFIX.size:
+        return None
+    magic, header_len = CATALOG_CACHE_PREFIX.unpack(prefix)
+    if magic != CATALOG_CACHE_MAGIC:
+        return None
+    header_bytes = f.read(header_len)
+    if len(header_bytes) != header_len:
+        return None
+    return json.loads(header_bytes.decode("utf-8"))
+
+
+def read_catalog_cache_header(filepath):
+    """Leer solo la cabecera (versión y validadores) del cache binario."""
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, "rb") as f:
+            return _read_header(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def read_catalog_cache(filepath):
+    """Leer el cache binario completo. Devuelve (cabecera, datos) o (None, None)."""
+    if not os.path.exists(filepath):
+        return None, None
+    try:
+        with open(filepath, "rb") as f:
+            header = _read_header(f)
+            # marshal no garantiza compatibilidad entre versiones de Python
+            if not header or header.get("marshal_version") != marshal.version:
+                return None, None
+            data = marshal.loads(f.read())
+        if not isinstance(data, dict):
+            return None, None
+        return header, data
+    except (IOError, OSError, ValueError, EOFError, TypeError):
+        return None, None
@@ -0,0 +1,220 @@
+import os
+import json
+import shutil
+import zipfile
+from urllib.parse import quote, urljoin
+import requests
+from http_client import client
+from downloader import (
+    download_file, download_resumable, DownloadStopped, IntegrityError, DOWNLOAD_TIMEOUT,
+    discard_partial, file_sha256
+)
+from zip_install import safe_member_path, extract_archive
+from preflight import check_space
+
+# =============================================================================
+# ACTUALIZACIONES POR ARCHIVO A PARTIR DE UN MANIFIESTO POR VERSIÓN
+# =============================================================================
+#
+# El catálogo puede indicar "url_manifiesto" para un proyecto. El manifiesto
+# describe la versión publicada:
+#   {
+#     "version": "1.3",
+#     "url_archivos": "https://.../juego/1.3/",      archivos sueltos
+#     "archivos": {"ruta/relativa": {"tamano": bytes, "sha256": "..."}},
+#     "parches": {"1.2": {"url": "...zip", "tamano": bytes, "sha256": "..."}}
+#   }
+# La actualización compara la carpeta instalada con el manifiesto y solo
+# descarga lo que cambió: el parche desde la versión instalada si existe y,
+# si no (o le falta algo), cada archivo suelto. Todo se deja primero en una
+# carpeta de preparación y solo se mueve al juego cuando está completo y
+# verificado, así una actualización a medias no rompe la instalación.
+#
+# Tras instalar o actualizar se guarda el manifiesto aplicado junto al juego
+# con el mtime de cada archivo: la siguiente comparación solo hashea los
+# archivos que cambiaron en disco desde entonces.
+
+INSTALLED_MANIFEST_FILE = ".manifiesto_instalado.json"
+# Carpeta de preparación dentro de la del juego (mismo disco: os.replace)
+STAGING_DIR = ".actualizacion"
+PATCH_FILENAME = "parche.zip"
+# Archivos del launcher que no forman parte del juego
+LAUNCHER_FILES = ("version.txt", INSTALLED_MANIFEST_FILE)
+
+
+class DeltaUnavailable(Exception):
+    """No hay manifiesto utilizable: hay que reinstalar el zip completo."""
+
+
+def fetch_manifest(url):
+    """Descargar y validar el manifiesto de una versión."""
+    try:
+        response = client.get(url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        manifest = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        raise DeltaUnavailable(f"No se pudo obtener el manifiesto {url}: {e}")
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("archivos"), dict):
+        raise DeltaUnavailable(f"Manifiesto sin lista de archivos: {url}")
+    return manifest
+
+
+def load_installed_manifest(game_dir):
+    path = os.path.join(game_dir, INSTALLED_MANIFEST_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (IOError, OSError, json.JSONDecodeError):
+        return None
+    return manifest if isinstance(manifest.get("archivos"), dict) else None
+
+
+def save_installed_manifest(game_dir, manifest):
+    """
+    Guardar el manifiesto aplicado con el mtime actual de cada archivo.
+    Solo se anotan los archivos cuyo tamaño en disco coincide; el resto se
+    hasheará en la próxima comparación.
+    """
+    files = {}
+    for path, info in manifest["archivos"].items():
+        try:
+            st = os.stat(safe_member_path(game_dir, path))
+        except OSError:
+            continue
+        if st.st_size != info.get("tamano"):
+            continue
+        files[path] = {"tamano": st.st_size, "sha256": info.get("sha256", "").lower(), "mtime": st.st_mtime}
+    record = {"version": manifest.get("version"), "archivos": files}
+    tmp_path = os.path.join(game_dir, INSTALLED_MANIFEST_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f)
+    os.replace(tmp_path, os.path.join(game_dir, INSTALLED_MANIFEST_FILE))
+
+
+def _local_sha256(path, st, known):
+    # El hash anotado vale mientras el archivo no cambie de tamaño ni de mtime
+    if known and known.get("tamano") == st.st_size and known.get("mtime") == st.st_mtime:
+        return known.get("sha256")
+    return file_sha256(path)
+
+
+def plan_update(game_dir, manifest, installed=None, should_stop=None):
+    """
+    Comparar la carpeta instalada con el manifiesto. Devuelve un dict con
+    "changed" (rutas nuevas o distintas), "removed" (rutas del manifiesto
+    instalado que ya no existen en el nuevo) y "bytes" (tamaño a descargar).
+    Sin manifiesto instalado no se borra nada: no se sabe qué archivos son
+    del juego y cuáles del usuario (partidas guardadas, configuración).
+    """
+    known_files = installed["archivos"] if installed else {}
+    changed = []
+    total = 0
+    for path, info in manifest["archivos"].items():
+        # Sin hashes anotados se lee el juego entero: pausar y cancelar no esperan
+        reason = should_stop() if should_stop else None
+        if reason:
+            raise DownloadStopped(reason)
+        local = safe_member_path(game_dir, path)
+        try:
+            st = os.stat(local)
+        except OSError:
+            st = None
+        if st is None or st.st_size != info["tamano"] or \
+                _local_sha256(local, st, known_files.get(path)) != info["sha256"].lower():
+            changed.append(path)
+            total += info["tamano"]
+    removed = [
+        path for path in known_files
+        if path not in manifest["archivos"] and path not in LAUNCHER_FILES
+    ]
+    return {"changed": changed, "removed": removed, "bytes": total}
+
+
+def _staged_ok(staging, path, info):
+    staged = safe_member_path(staging, path)
+    try:
+        if os.path.getsize(staged) != info["tamano"]:
+            return False
+    except OSError:
+        return False
+    return file_sha256(staged) == info["sha256"].lower()
+
+
+def _apply_patch(patch, staging, progress, should_stop):
+    """Descargar y extraer el parche en la carpeta de preparación."""
+    patch_path = os.path.join(staging, PATCH_FILENAME)
+    expected = {"size": patch.get("tamano"), "sha256": patch.get("sha256")}
+    download_file(patch["url"], patch_path, progress=progress, should_stop=should_stop, expected=expected)
+    extract_archive(patch_path, staging, should_stop=should_stop)
+    os.remove(patch_path)
+
+
+def apply_update(manifest, game_dir, installed_version=None, progress=None, should_stop=None):
+    """
+    Llevar game_dir a la versión del manifiesto descargando solo lo que
+    cambió. progress(bytes, total) y should_stop() funcionan como en
+    downloader.download_file; lo ya preparado se conserva al pausar y al
+    reanudar no se vuelve a descargar. Devuelve el plan aplicado.
+    """
+    installed = load_installed_manifest(game_dir)
+    plan = plan_update(game_dir, manifest, installed, should_stop)
+    print(
+        f"Actualización a {manifest.get('version')}: {len(plan['changed'])} archivos "
+        f"({plan['bytes'] / (1024 * 1024):.1f} MB), {len(plan['removed'])} a borrar."
+    )
+    # Lo cambiado se prepara aparte antes de reemplazar: ocupa su tamaño entero
+    check_space(game_dir, plan["bytes"])
+    staging = os.path.join(game_dir, STAGING_DIR)
+    os.makedirs(staging, exist_ok=True)
+    files = manifest["archivos"]
+    pending = [path for path in plan["changed"] if not _staged_ok(staging, path, files[path])]
+
+    patch = (manifest.get("parches") or {}).get(str(installed_version)) if installed_version else None
+    if patch and pending:
+        try:
+            _apply_patch(patch, staging, progress, should_stop)
+        except (requests.exceptions.RequestException, IntegrityError, zipfile.BadZipFile, OSError) as e:
+            print(f"No se pudo aplicar el parche, se descargan los archivos sueltos: {e}")
+            discard_partial(os.path.join(staging, PATCH_FILENAME))
+        pending = [path for path in pending if not _staged_ok(staging, path, files[path])]
+
+    if pending and not manifest.get("url_archivos"):
+        raise DeltaUnavailable("El manifiesto no indica de dónde bajar los archivos sueltos.")
+    total = sum(files[path]["tamano"] for path in pending)
+    done = 0
+    for path in pending:
+        info = files[path]
+        staged = safe_member_path(staging, path)
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+        if info["tamano"] == 0:
+            open(staged, "wb").close()
+            continue
+        url = urljoin(manifest["url_archivos"], quote(path))
+        download_resumable(
+            url, staged,
+            (lambda n, _, base=done: progress(base + n, total)) if progress else None,
+            should_stop, {"size": info["tamano"], "sha256": info["sha256"]}
+        )
+        done += info["tamano"]
+
+    reason = should_stop() if should_stop else None
+    if reason:
+        raise DownloadStopped(reason)
+    # Todo está preparado y verificado: se mueve a su sitio
+    for path in plan["changed"]:
+        target = safe_member_path(game_dir, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(safe_member_path(staging, path), target)
+    for path in plan["removed"]:
+        try:
+            os.remove(safe_member_path(game_dir, path))
+        except OSError:
+            pass
+    shutil.rmtree(staging, ignore_errors=True)
+    save_installed_manifest(game_dir, manifest)
+    return plan
+
+
+def discard_update(game_dir):
+    """Borrar lo preparado de una actualización cancelada."""
+    shutil.rmtree(os.path.join(game_dir, STAGING_DIR), ignore_errors=True)
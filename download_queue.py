@@ -0,0 +1,147 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# =============================================================================
+# COLA DE DESCARGAS
+# =============================================================================
+#
+# Las instalaciones no arrancan todas a la vez: se encolan y solo corren
+# max_active simultáneas. Varias descargas compitiendo por la misma línea y
+# el mismo disco terminan todas tarde; en cola, la primera queda lista
+# cuanto antes y mientras una se extrae la siguiente ya está descargando.
+# El lote completo no acaba antes (la línea va llena igual): lo que mejora
+# es cuánto se espera por cada juego (benchmarks/bench_download_queue.py).
+#
+# La cola solo decide el orden: cuando hay un hueco emite start_requested
+# con la entrada y la interfaz crea el worker. Todo se usa desde el hilo de
+# la interfaz.
+
+# Descargas simultáneas por defecto (ajustable con "max_concurrent_downloads")
+MAX_CONCURRENT_DOWNLOADS = 2
+
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 1  # "jugar a continuación": adelanta a todas las normales
+
+
+class DownloadQueue(QObject):
+    """
+    Cola ordenada de instalaciones pendientes. Cada entrada es un dict con
+    "project_id", "project_data", "library", "update", "priority" y
+    "paused" (las pausadas se quedan en la cola pero no arrancan).
+    """
+    changed = pyqtSignal()
+    start_requested = pyqtSignal(object)  # entrada que debe empezar
+
+    def __init__(self, max_active=MAX_CONCURRENT_DOWNLOADS):
+        super().__init__()
+        self.max_active = max(1, max_active)
+        self._entries = []
+        self._running = set()
+
+    def set_max_active(self, max_active):
+        self.max_active = max(1, max_active)
+        self.schedule()
+
+    def entries(self):
+        return list(self._entries)
+
+    def get(self, project_id):
+        for entry in self._entries:
+            if entry["project_id"] == project_id:
+                return entry
+        return None
+
+    def position(self, project_id):
+        """Posición (desde 1) entre las entradas que esperan, o None."""
+        for index, entry in enumerate(self._entries):
+            if entry["project_id"] == project_id:
+                return index + 1
+        return None
+
+    def is_running(self, project_id):
+        return project_id in self._running
+
+    def enqueue(self, project_data, library, update=False, priority=PRIORITY_NORMAL, paused=False, front=False):
+        """Añadir una instalación (si ya estaba en la cola solo se actualiza)."""
+        project_id = project_data["id_proyecto"]
+        entry = self.get(project_id)
+        if entry is None:
+            entry = {"project_id": project_id}
+        else:
+            self._entries.remove(entry)
+        entry.update(project_data=project_data, library=library, update=update,
+                     priority=priority, paused=paused)
+        self._insert(entry, front)
+        self.changed.emit()
+        self.schedule()
+
+    def _insert(self, entry, front=False):
+        # Las de mayor prioridad van siempre delante; dentro de la misma
+        # prioridad, al final (o al principio con front)
+        index = 0
+        for index, other in enumerate(self._entries):
+            if other["priority"] < entry["priority"] or (front and other["priority"] == entry["priority"]):
+                break
+        else:
+            index = len(self._entries)
+        self._entries.insert(index, entry)
+
+    def remove(self, project_id):
+        entry = self.get(project_id)
+        if entry is not None:
+            self._entries.remove(entry)
+            self.changed.emit()
+        return entry
+
+    def move(self, project_id, offset):
+        """Subir (offset < 0) o bajar una entrada sin saltarse la prioridad."""
+        entry = self.get(project_id)
+        if entry is None:
+            return
+        index = self._entries.index(entry)
+        target = max(0, min(len(self._entries) - 1, index + offset))
+        if self._entries[target]["priority"] != entry["priority"]:
+            return
+        self._entries.insert(target, self._entries.pop(index))
+        self.changed.emit()
+
+    def play_next(self, project_id):
+        """Poner una entrada la primera, por delante de las normales."""
+        entry = self.get(project_id)
+        if entry is None:
+            return
+        self._entries.remove(entry)
+        entry["priority"] = PRIORITY_HIGH
+        entry["paused"] = False
+        self._insert(entry, front=True)
+        self.changed.emit()
+        self.schedule()
+
+    def pause(self, project_id):
+        entry = self.get(project_id)
+        if entry is not None and not entry["paused"]:
+            entry["paused"] = True
+            self.changed.emit()
+
+    def resume(self, project_id):
+        entry = self.get(project_id)
+        if entry is not None and entry["paused"]:
+            entry["paused"] = False
+            self.changed.emit()
+            self.schedule()
+
+    def job_finished(self, project_id):
+        """Una descarga terminó, falló o se pausó: su hueco queda libre."""
+        if project_id in self._running:
+            self._running.discard(project_id)
+            self.changed.emit()
+        self.schedule()
+
+    def schedule(self):
+        while len(self._running) < self.max_active:
+            entry = next((entry for entry in self._entries if not entry["paused"]), None)
+            if entry is None:
+                return
+            self._entries.remove(entry)
+            self._running.add(entry["project_id"])
+            self.start_requested.emit(entry)
+            self.changed.emit()
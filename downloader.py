@@ -0,0 +1,642 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import requests
+from throttle import bandwidth
+from http_client import client
+
+# =============================================================================
+# DESCARGAS REANUDABLES (HTTP RANGE + ARCHIVOS .part)
+# =============================================================================
+#
+# Mientras se descarga, los bytes van a "<destino>.part" y junto a él se
+# guarda "<destino>.part.json" con la URL, el tamaño total y los validadores
+# (ETag / Last-Modified). Si la descarga se pausa, falla o se cierra el
+# launcher, la siguiente vez se continúa desde el tamaño del .part con una
+# petición Range + If-Range; si el archivo cambió en el servidor, este
+# responde con el archivo completo y se empieza de cero.
+
+PART_SUFFIX = ".part"
+SIDECAR_SUFFIX = ".part.json"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 30
+# Descarga segmentada: por debajo de este tamaño no compensa abrir varias conexiones
+SEGMENTED_MIN_SIZE = 16 * 1024 * 1024
+# Un segmento solo se parte para reequilibrar si le queda al menos esto
+SEGMENT_MIN_SPLIT = 2 * 1024 * 1024
+# Cada cuánto se guarda el progreso de los segmentos en el sidecar
+SEGMENT_STATE_INTERVAL = 1.0
+
+
+class DownloadStopped(Exception):
+    """La descarga se detuvo a petición del usuario; reason es "pause" o "cancel"."""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class IntegrityError(Exception):
+    """Lo descargado no coincide con el tamaño o los hashes esperados."""
+
+
+# =============================================================================
+# VERIFICACIÓN DE INTEGRIDAD DURANTE LA DESCARGA
+# =============================================================================
+#
+# expected es un dict opcional con lo que publica el catálogo:
+#   "size"          tamaño exacto en bytes
+#   "sha256"        hash del archivo completo
+#   "block_size"    tamaño de bloque de los hashes parciales
+#   "block_sha256"  lista con el hash de cada bloque
+# Los hashes se calculan sobre los mismos bloques que se escriben, sin
+# volver a leer el archivo. Con hashes por bloque cada segmento se verifica
+# por su cuenta y un bloque dañado solo obliga a repetir ese bloque.
+
+class BlockHashes:
+    """Hashes por bloque de un archivo de tamaño conocido."""
+
+    def __init__(self, block_size, hashes, size):
+        self.block_size = block_size
+        self.hashes = [h.lower() for h in hashes]
+        self.size = size
+
+    @classmethod
+    def from_expected(cls, expected, size):
+        if not expected or not expected.get("block_size") or not expected.get("block_sha256"):
+            return None
+        return cls(int(expected["block_size"]), expected["block_sha256"], size)
+
+    def align(self, offset):
+        """Primer inicio de bloque en offset o después."""
+        return -(-offset // self.block_size) * self.block_size
+
+    def stream(self, pos, part=None):
+        """
+        Verificador para bytes que llegan en orden desde pos. Si pos cae a
+        mitad de un bloque (reanudación), el principio del bloque se lee del .part.
+        """
+        return _BlockStream(self, pos, part)
+
+
+class _BlockStream:
+
+    def __init__(self, blocks, pos, part):
+        self.blocks = blocks
+        self.index = pos // blocks.block_size
+        self.hasher = hashlib.sha256()
+        self.filled = pos - self.index * blocks.block_size
+        if self.filled and part:
+            with open(part, "rb") as f:
+                f.seek(self.index * blocks.block_size)
+                self.hasher.update(f.read(self.filled))
+
+    def block_start(self):
+        return self.index * self.blocks.block_size
+
+    def update(self, data):
+        view = memoryview(data)
+        block_size = self.blocks.block_size
+        while view:
+            block_len = min(block_size, self.blocks.size - self.block_start())
+            take = view[:block_len - self.filled]
+            self.hasher.update(take)
+            self.filled += len(take)
+            view = view[len(take):]
+            if self.filled == block_len:
+                if self.index >= len(self.blocks.hashes) or self.hasher.hexdigest() != self.blocks.hashes[self.index]:
+                    raise IntegrityError(f"El bloque {self.index} de la descarga está dañado.")
+                self.index += 1
+                self.hasher = hashlib.sha256()
+                self.filled = 0
+
+
+def check_expected_size(expected, size):
+    if expected and expected.get("size") and size and int(expected["size"]) != size:
+        raise IntegrityError(
+            f"El servidor anuncia {size} bytes y el catálogo {expected['size']}."
+        )
+
+
+def _check_sha256(expected, digest):
+    if expected and expected.get("sha256") and digest != expected["sha256"].lower():
+        raise IntegrityError("El hash SHA-256 de la descarga no coincide con el del catálogo.")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE * 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def part_path(dest_path):
+    return dest_path + PART_SUFFIX
+
+
+def sidecar_path(dest_path):
+    return dest_path + SIDECAR_SUFFIX
+
+
+def load_partial_state(dest_path):
+    """
+    Estado de una descarga a medias ({"url", "size", "etag", "last_modified",
+    "downloaded"} y "segments" si es segmentada) o None. Las instalaciones que
+    extraen mientras descargan (zip_install) no tienen .part y guardan
+    "mode": "stream" con los archivos ya extraídos.
+    """
+    try:
+        with open(sidecar_path(dest_path), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("mode") == "stream":
+            return state
+        part_size = os.path.getsize(part_path(dest_path))
+    except (IOError, OSError, ValueError):
+        return None
+    if "segments" in state:
+        # El .part está preasignado: lo descargado es lo que no queda pendiente
+        pending = sum(end - pos + 1 for pos, end in state["segments"])
+        state["downloaded"] = state["size"] - pending
+    else:
+        state["downloaded"] = part_size
+    return state
+
+
+def save_partial_state(dest_path, state):
+    """Guardar el sidecar de forma atómica."""
+    tmp_path = sidecar_path(dest_path) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, sidecar_path(dest_path))
+
+
+def discard_partial(dest_path):
+    """Borrar el .part y su sidecar (cancelar definitivamente)."""
+    for path in (part_path(dest_path), sidecar_path(dest_path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"No se pudo borrar {path}: {e}")
+
+
+def find_partial_downloads(directory):
+    """Rutas de destino de las descargas a medias dentro de una carpeta."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return [
+        os.path.join(directory, name[:-len(SIDECAR_SUFFIX)])
+        for name in names if name.endswith(SIDECAR_SUFFIX)
+    ]
+
+
+def _total_size(response, offset):
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return 0
+
+
+def _range_start(response):
+    # "bytes 1000-1999/5000" -> 1000
+    try:
+        return int(response.headers["Content-Range"].split()[1].split("-")[0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def download_resumable(url, dest_path, progress=None, should_stop=None, expected=None):
+    """
+    Descargar url en dest_path continuando desde un .part previo si existe.
+
+    progress(descargados, total) se llama por cada bloque (total es 0 si el
+    servidor no lo indica). should_stop() devuelve None para seguir, o
+    "pause" / "cancel" para detener la descarga con DownloadStopped; el .part
+    se conserva en ambos casos y también si hay un error de red, así que
+    llamar de nuevo continúa donde se quedó. Con expected se verifica el
+    tamaño y los hashes mientras se escribe (IntegrityError si no coinciden).
+    """
+    part = part_path(dest_path)
+    state = load_partial_state(dest_path)
+    if not state or state.get("url") != url or "segments" in state or "mode" in state:
+        discard_partial(dest_path)
+        state = None
+    offset = state["downloaded"] if state else 0
+
+    headers = {}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        validator = state.get("etag") or state.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+
+    response = client.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT)
+    with response:
+        if response.status_code == 416 and state and state.get("size") == offset:
+            # El .part ya estaba completo
+            os.replace(part, dest_path)
+            discard_partial(dest_path)
+            return dest_path
+        response.raise_for_status()
+        if offset and (response.status_code != 206 or _range_start(response) != offset):
+            # El servidor no acepta Range o el archivo cambió: se empieza de cero
+            print(f"No se puede reanudar {url}, se descarga completo.")
+            offset = 0
+        if offset:
+            print(f"Reanudando descarga de {url} desde {offset} bytes.")
+        else:
+            state = {
+                "url": url,
+                "size": _total_size(response, 0),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            save_partial_state(dest_path, state)
+        total = state.get("size") or _total_size(response, offset)
+        try:
+            check_expected_size(expected, total)
+        except IntegrityError:
+            discard_partial(dest_path)
+            raise
+
+        digest = None
+        if expected and expected.get("sha256"):
+            # Al reanudar hay que pasar por el hash lo que ya estaba en el .part
+            digest = hashlib.sha256()
+            if offset:
+                with open(part, "rb") as f:
+                    for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE * 16), b""):
+                        digest.update(block)
+        blocks = BlockHashes.from_expected(expected, total)
+        block_stream = blocks.stream(offset, part) if blocks else None
+
+        downloaded = offset
+        with open(part, "ab" if offset else "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                reason = should_stop() if should_stop else None
+                if reason:
+                    raise DownloadStopped(reason)
+                bandwidth.consume(len(chunk))
+                if block_stream:
+                    try:
+                        block_stream.update(chunk)
+                    except IntegrityError:
+                        # Se conserva lo verificado: al reintentar se repite solo este bloque.
+                        # Si el trozo traía bloques buenos antes del dañado se escriben
+                        # primero; truncar más allá del final rellenaría el .part con ceros
+                        verified = block_stream.block_start() - downloaded
+                        if verified > 0:
+                            f.write(chunk[:verified])
+                        f.truncate(block_stream.block_start())
+                        raise
+                f.write(chunk)
+                if digest:
+                    digest.update(chunk)
+                downloaded += len(chunk)
+                if progress:
+                    progress(downloaded, total)
+
+    if total and downloaded != total:
+        # Conexión cortada sin error: el .part se queda para reanudar
+        raise requests.exceptions.ConnectionError(
+            f"Descarga incompleta: {downloaded} de {total} bytes."
+        )
+    if digest:
+        try:
+            _check_sha256(expected, digest.hexdigest())
+        except IntegrityError:
+            discard_partial(dest_path)
+            raise
+    os.replace(part, dest_path)
+    discard_partial(dest_path)
+    return dest_path
+
+
+# =============================================================================
+# DESCARGA SEGMENTADA (VARIAS CONEXIONES)
+# =============================================================================
+
+class _Segment:
+    """Rango pendiente [pos, end] (ambos incluidos) que descarga un hilo."""
+
+    def __init__(self, pos, end):
+        self.pos = pos
+        self.end = end
+        self.started = None
+        self.received = 0
+
+    def remaining(self):
+        return self.end - self.pos + 1
+
+    def rate(self, now):
+        if not self.started or not self.received:
+            return None
+        return self.received / max(now - self.started, 1e-6)
+
+    def eta(self, now, default_rate):
+        # Segundos que le quedan a este segmento a su velocidad actual
+        rate = self.rate(now) or default_rate
+        return self.remaining() / rate if rate else float("inf")
+
+
+class SegmentedDownload:
+    """
+    Descarga un archivo en varios rangos de bytes a la vez sobre un .part
+    preasignado. Cuando una conexión termina y no quedan rangos libres, se
+    queda con la mitad del segmento que más tardaría en acabar, así una
+    conexión lenta no retrasa el final. Los rangos pendientes se guardan en
+    el sidecar para poder reanudar.
+
+    Con hashes por bloque en expected, los segmentos y los puntos de corte se
+    alinean a los bloques y cada segmento verifica los suyos al recibirlos.
+    Si solo hay hash del archivo completo, se comprueba con una lectura final
+    (los segmentos llegan desordenados y no se pueden encadenar en un hash),
+    salvo con una sola conexión y un único segmento hasta el final del
+    archivo: los bytes llegan en orden y se hashean al escribirlos, como en
+    download_resumable.
+    """
+
+    def __init__(self, url, dest_path, connections, progress=None, should_stop=None, expected=None,
+                 on_phase=None):
+        self.url = url
+        self.dest_path = dest_path
+        self.connections = connections
+        self.progress = progress
+        self.should_stop = should_stop
+        self.expected = expected
+        self.on_phase = on_phase
+        self.blocks = None
+        self.digest = None  # hash incremental del archivo completo (una conexión)
+        self.state = None
+        self._lock = threading.Lock()
+        self._pending = []  # segmentos sin conexión asignada
+        self._active = []  # segmentos descargándose
+        self._downloaded = 0
+        self._stop = threading.Event()
+        self._stop_reason = None
+        self._error = None
+        self._last_save = 0.0
+
+    def start(self, state):
+        """Prepara el .part y los segmentos (nuevos o los del sidecar) para run()."""
+        part = part_path(self.dest_path)
+        check_expected_size(self.expected, state["size"])
+        self.blocks = BlockHashes.from_expected(self.expected, state["size"])
+        if self.blocks:
+            state["block_size"] = self.blocks.block_size
+        self.state = state
+        if state.get("segments") and os.path.exists(part):
+            segments = [_Segment(pos, end) for pos, end in state["segments"]]
+        else:
+            with open(part, "wb") as f:
+                f.truncate(state["size"])
+            step = -(-state["size"] // self.connections)
+            if self.blocks:
+                step = self.blocks.align(step)
+            segments = [
+                _Segment(start, min(start + step, state["size"]) - 1)
+                for start in range(0, state["size"], step)
+            ]
+        self._pending = segments
+        if self.expected and self.expected.get("sha256") and not self.blocks and self.connections == 1 \
+                and len(segments) == 1 and segments[0].end == state["size"] - 1:
+            # Lo anterior al segmento ya está en el .part: se pasa por el hash una vez
+            self.digest = hashlib.sha256()
+            with open(part, "rb") as f:
+                remaining = segments[0].pos
+                while remaining:
+                    block = f.read(min(remaining, DOWNLOAD_CHUNK_SIZE * 16))
+                    if not block:
+                        break
+                    self.digest.update(block)
+                    remaining -= len(block)
+        self._downloaded = state["size"] - sum(seg.remaining() for seg in segments)
+        self._save_state(force=True)
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self._worker, name=f"segment-{i}", daemon=True)
+            for i in range(self.connections)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._save_state(force=True)
+        if self._stop_reason:
+            raise DownloadStopped(self._stop_reason)
+        if self._error:
+            raise self._error
+        if self._pending:
+            raise requests.exceptions.ConnectionError("Quedaron segmentos sin descargar.")
+        if self.expected and self.expected.get("sha256") and not self.blocks:
+            if self.digest:
+                digest = self.digest.hexdigest()
+            else:
+                if self.on_phase:
+                    self.on_phase("verify")
+                digest = file_sha256(part_path(self.dest_path))
+            try:
+                _check_sha256(self.expected, digest)
+            except IntegrityError:
+                discard_partial(self.dest_path)
+                raise
+        os.replace(part_path(self.dest_path), self.dest_path)
+        discard_partial(self.dest_path)
+        return self.dest_path
+
+    def _next_segment(self):
+        with self._lock:
+            if self._pending:
+                segment = self._pending.pop(0)
+            else:
+                # Reequilibrar: partir el segmento activo que más tardaría
+                now = time.monotonic()
+                candidates = [seg for seg in self._active if seg.remaining() >= SEGMENT_MIN_SPLIT]
+                if not candidates:
+                    return None
+                # Un segmento recién empezado se estima con la velocidad media
+                rates = [rate for rate in (seg.rate(now) for seg in self._active) if rate]
+                default_rate = sum(rates) / len(rates) if rates else None
+                slowest = max(candidates, key=lambda seg: (seg.eta(now, default_rate), seg.remaining()))
+                # Se deja al menos un bloque al dueño: puede estar escribiéndolo ahora
+                middle = slowest.pos + DOWNLOAD_CHUNK_SIZE + (slowest.remaining() - DOWNLOAD_CHUNK_SIZE) // 2
+                if self.blocks:
+                    middle = self.blocks.align(middle)
+                    if middle > slowest.end:
+                        return None
+                segment = _Segment(middle, slowest.end)
+                slowest.end = middle - 1
+            self._active.append(segment)
+            return segment
+
+    def _worker(self):
+        # Cada hilo usa su propia conexión del pool del cliente compartido
+        while not self._stop.is_set():
+            segment = self._next_segment()
+            if segment is None:
+                return
+            try:
+                self._download_segment(segment)
+            except Exception as e:
+                with self._lock:
+                    if self._error is None:
+                        self._error = e
+                    self._stop.set()
+            finally:
+                with self._lock:
+                    self._active.remove(segment)
+                    if segment.remaining() > 0:
+                        self._pending.append(segment)
+
+    def _download_segment(self, segment):
+        headers = {"Range": f"bytes={segment.pos}-{segment.end}"}
+        validator = self.state.get("etag") or self.state.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+        with client.get(self.url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            if response.status_code != 206 or _range_start(response) != segment.pos:
+                raise requests.exceptions.ContentDecodingError(
+                    "El archivo cambió en el servidor durante la descarga."
+                )
+            segment.started = time.monotonic()
+            part = part_path(self.dest_path)
+            block_stream = self.blocks.stream(segment.pos, part) if self.blocks else None
+            with open(part, "r+b", buffering=0) as f:
+                f.seek(segment.pos)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    reason = self.should_stop() if self.should_stop else None
+                    if reason or self._stop.is_set():
+                        with self._lock:
+                            self._stop_reason = self._stop_reason or reason
+                            self._stop.set()
+                        return
+                    bandwidth.consume(len(chunk))
+                    with self._lock:
+                        # El final pudo acortarse al reequilibrar
+                        chunk = chunk[:segment.remaining()]
+                    if block_stream:
+                        try:
+                            block_stream.update(chunk)
+                        except IntegrityError:
+                            # El segmento sigue desde el inicio del bloque dañado; los
+                            # bloques buenos del trozo anteriores a él se escriben
+                            with self._lock:
+                                start = block_stream.block_start()
+                                if start > segment.pos:
+                                    f.write(chunk[:start - segment.pos])
+                                self._downloaded += start - segment.pos
+                                segment.pos = start
+                            raise
+                    if chunk:
+                        f.write(chunk)
+                        if self.digest:
+                            self.digest.update(chunk)
+                    with self._lock:
+                        written = min(len(chunk), segment.remaining())
+                        segment.pos += written
+                        segment.received += written
+                        self._downloaded += written
+                        downloaded = self._downloaded
+                        done = segment.remaining() <= 0
+                    if self.progress:
+                        self.progress(downloaded, self.state["size"])
+                    self._save_state()
+                    if done:
+                        return
+        if segment.remaining() > 0:
+            raise requests.exceptions.ConnectionError(
+                f"Segmento incompleto: faltan {segment.remaining()} bytes."
+            )
+
+    def _save_state(self, force=False):
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_save < SEGMENT_STATE_INTERVAL:
+                return
+            self._last_save = now
+            segments = [
+                [seg.pos, seg.end] for seg in self._pending + self._active if seg.remaining() > 0
+            ]
+            state = dict(self.state, segments=segments)
+            state.pop("downloaded", None)
+            try:
+                save_partial_state(self.dest_path, state)
+            except (IOError, OSError) as e:
+                print(f"No se pudo guardar el progreso de la descarga: {e}")
+
+
+def _probe_ranges(url):
+    """Tamaño total y validadores si el servidor acepta Range, o None."""
+    headers = {"Range": "bytes=0-0"}
+    with client.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            return None
+        size = _total_size(response, 0)
+        if not size:
+            return None
+        return {
+            "url": url,
+            "size": size,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+
+def download_file(url, dest_path, connections=1, progress=None, should_stop=None, expected=None,
+                  on_phase=None, preallocate=False):
+    """
+    Descargar url en dest_path. Con connections > 1 se usa la descarga
+    segmentada si el servidor acepta Range y el archivo es grande; si no, una
+    sola conexión reanudable. Una descarga segmentada a medias se continúa
+    siempre en modo segmentado. expected (tamaño y hashes del catálogo) se
+    verifica durante la descarga; si no coincide se lanza IntegrityError.
+    on_phase("verify") avisa si hace falta una lectura final para el hash.
+
+    Con preallocate el .part se reserva entero antes de empezar (también con
+    una conexión, que entonces usa la descarga segmentada con un solo
+    segmento, cuyo progreso no depende del tamaño del .part).
+    """
+    state = load_partial_state(dest_path)
+    segmented_partial = bool(state and state.get("url") == url and "segments" in state)
+    # Una descarga secuencial a medias sigue siéndolo: su progreso es el tamaño del .part
+    preallocate = preallocate and state is None
+    if connections <= 1 and not segmented_partial and not preallocate:
+        return download_resumable(url, dest_path, progress, should_stop, expected)
+
+    probe = _probe_ranges(url)
+    if probe is None or (probe["size"] < SEGMENTED_MIN_SIZE and not preallocate):
+        if segmented_partial:
+            discard_partial(dest_path)
+        if probe is None:
+            print(f"El servidor no acepta rangos para {url}, se usa una sola conexión.")
+        return download_resumable(url, dest_path, progress, should_stop, expected)
+
+    # Los segmentos de una descarga sin hashes por bloque no están alineados a ellos
+    block_size = expected.get("block_size") if expected and expected.get("block_sha256") else None
+    if segmented_partial and (probe["size"], probe["etag"], probe["last_modified"], block_size) == (
+            state["size"], state.get("etag"), state.get("last_modified"), state.get("block_size")):
+        print(f"Reanudando descarga segmentada de {url} ({state['downloaded']} bytes ya descargados).")
+        probe["segments"] = state["segments"]
+    else:
+        discard_partial(dest_path)
+    download = SegmentedDownload(url, dest_path, max(connections, 1), progress, should_stop, expected, on_phase)
+    try:
+        download.start(probe)
+    except IntegrityError:
+        discard_partial(dest_path)
+        raise
+    return download.run()
@@ -0,0 +1,147 @@
+import re
+import time
+import random
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+# =============================================================================
+# CLIENTE HTTP COMPARTIDO
+# =============================================================================
+#
+# Todas las peticiones del launcher pasan por un único requests.Session:
+# las conexiones (TCP + TLS) se reutilizan por host en lugar de abrirse en
+# cada llamada. Las respuestas 429 / 5xx y los fallos de conexión se
+# reintentan con espera exponencial con jitter, y cada endpoint lleva sus
+# contadores de latencia para ver dónde se va el tiempo.
+
+DEFAULT_TIMEOUT = 10
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # segundos antes del primer reintento
+BACKOFF_MAX = 8.0
+RETRY_STATUS = frozenset((429, 500, 502, 503, 504))
+# Con estos códigos el servidor no procesó la petición: se puede repetir un POST
+RETRY_STATUS_UNSAFE = frozenset((429, 503))
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# Hosts distintos con conexiones guardadas y conexiones guardadas por host
+POOL_HOSTS = 10
+POOL_PER_HOST = 16
+
+
+def endpoint_name(url):
+    """Host y ruta sin parámetros, con los ids numéricos agrupados."""
+    parts = urlsplit(url)
+    return parts.netloc + re.sub(r"/\d+(?=/|$)", "/:id", parts.path)
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Espera antes del reintento attempt (desde 0): exponencial con jitter."""
+    if retry_after is not None:
+        return min(BACKOFF_MAX, retry_after)
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(delay / 2, delay)
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
+class HTTPClient:
+    """
+    Session compartida con pool de conexiones, timeout por defecto y
+    reintentos. get/post/request aceptan los mismos argumentos que requests
+    y lanzan las mismas excepciones, así que sustituyen a requests.get /
+    requests.post sin cambiar el manejo de errores de quien llama.
+
+    Los reintentos son para los hilos de trabajo: lo que se llama desde el
+    hilo de la interfaz pasa retries=0 para no bloquear la ventana varias
+    veces el timeout.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES):
+        self.timeout = timeout
+        self.retries = retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_PER_HOST)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self._stats = {}  # {endpoint: {"count", "errors", "retries", "total_ms", "max_ms"}}
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, retries=None, **kwargs):
+        """
+        Hacer la petición reintentando 429 / 5xx y errores de conexión.
+        Los métodos no idempotentes (POST) solo se repiten cuando el
+        servidor no llegó a procesarlos (429, 503 o conexión rechazada).
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.retries if retries is None else retries
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_status = RETRY_STATUS if idempotent else RETRY_STATUS_UNSAFE
+        endpoint = endpoint_name(url)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._record(endpoint, start, error=True)
+                safe = idempotent or isinstance(e, requests.exceptions.ConnectTimeout)
+                if attempt >= retries or not safe:
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                failed = response.status_code in RETRY_STATUS
+                self._record(endpoint, start, error=failed)
+                if not failed or response.status_code not in retry_status or attempt >= retries:
+                    return response
+                delay = backoff_delay(attempt, _retry_after(response))
+                response.close()
+            with self._lock:
+                self._stats[endpoint]["retries"] += 1
+            time.sleep(delay)
+            attempt += 1
+
+    def _record(self, endpoint, start, error=False):
+        # Con stream=True mide hasta las cabeceras, no el cuerpo
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"count": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def stats(self):
+        """Copia de los contadores por endpoint, con la latencia media."""
+        with self._lock:
+            return {
+                endpoint: dict(stats, avg_ms=stats["total_ms"] / stats["count"])
+                for endpoint, stats in self._stats.items()
+            }
+
+    def report(self):
+        """Imprimir los endpoints ordenados por tiempo total."""
+        stats = self.stats()
+        if not stats:
+            return
+        print("Peticiones HTTP por endpoint:")
+        for endpoint, s in sorted(stats.items(), key=lambda item: -item[1]["total_ms"]):
+            print(
+                f"  {endpoint}: {s['count']} peticiones, media {s['avg_ms']:.0f} ms, "
+                f"máx {s['max_ms']:.0f} ms, {s['errors']} errores, {s['retries']} reintentos"
+            )
+
+
+# Cliente que usan todos los módulos
+client = HTTPClient()
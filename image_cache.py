@@ -0,0 +1,407 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import urlparse
+import requests
+from http_client import client
+
+# =============================================================================
+# CACHÉ DE IMÁGENES EN DISCO CON LÍMITE Y EXPULSIÓN LRU
+# =============================================================================
+
+INDEX_FILENAME = "index.json"
+URLS_FILENAME = "urls.json"
+BLOBS_DIRNAME = "blobs"
+# Límites por defecto del caché en disco
+DEFAULT_MAX_MB = 512
+DEFAULT_MAX_ENTRIES = 5000
+# Cada cuánto se revalida una imagen con su servidor (GET condicional)
+REVALIDATE_INTERVAL = 24 * 3600
+
+
+class ImageCacheIndex:
+    """
+    Índice de último acceso de los archivos de la carpeta de caché de imágenes.
+    Cuando la carpeta supera max_bytes o max_entries se borran los archivos
+    usados hace más tiempo, en un hilo aparte para no bloquear la interfaz.
+    """
+
+    def __init__(self, cache_dir, max_bytes, max_entries):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries = {}  # {ruta relativa: [tamaño, último acceso]}
+        self._total_bytes = 0
+        self._dirty = False
+        self._evicting = False
+        self._loaded = False
+
+    def start(self):
+        """Carga el índice y lo reconcilia con la carpeta en segundo plano."""
+        threading.Thread(target=self._load_and_scan, name="image-cache-scan", daemon=True).start()
+
+    def configure(self, max_bytes=None, max_entries=None):
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if max_entries is not None:
+            self.max_entries = max_entries
+        self._maybe_evict()
+
+    def _relpath(self, path):
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.cache_dir))
+
+    def _load_and_scan(self):
+        saved = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (IOError, OSError, ValueError):
+            pass
+        found = {}
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                full_path = os.path.join(root, name)
+                rel = self._relpath(full_path)
+                if rel in (INDEX_FILENAME, URLS_FILENAME) or name.endswith(".tmp"):
+                    continue
+                try:
+                    st = os.stat(full_path)
+                except OSError:
+                    continue
+                last_access = saved.get(rel, [None, st.st_mtime])[1]
+                found[rel] = [st.st_size, last_access]
+        with self._lock:
+            # Los accesos registrados mientras se escaneaba tienen prioridad
+            for rel, entry in self._entries.items():
+                if rel in found:
+                    found[rel][1] = max(found[rel][1], entry[1])
+            self._entries = found
+            self._total_bytes = sum(entry[0] for entry in found.values())
+            self._dirty = True
+            self._loaded = True
+        self._maybe_evict()
+
+    def touch(self, path):
+        """Registrar un acceso a un archivo del caché."""
+        rel = self._relpath(path)
+        with self._lock:
+            entry = self._entries.get(rel)
+            if entry is not None:
+                entry[1] = time.time()
+                self._dirty = True
+                return
+        # Archivo que no estaba en el índice (por ejemplo, escrito por el overlay)
+        self.add(path)
+
+    def add(self, path):
+        """Registrar un archivo recién escrito y expulsar si se superan los límites."""
+        rel = self._relpath(path)
+        if rel.startswith(".."):
+            return
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            old = self._entries.get(rel)
+            if old:
+                self._total_bytes -= old[0]
+            self._entries[rel] = [size, time.time()]
+            self._total_bytes += size
+            self._dirty = True
+        self._maybe_evict()
+
+    def _over_limits(self):
+        return self._total_bytes > self.max_bytes or len(self._entries) > self.max_entries
+
+    def _maybe_evict(self):
+        with self._lock:
+            # Sin el índice completo no se sabe qué es lo menos usado
+            if not self._loaded or self._evicting or not self._over_limits():
+                return
+            self._evicting = True
+        threading.Thread(target=self._evict, name="image-cache-evict", daemon=True).start()
+
+    def _evict(self):
+        try:
+            with self._lock:
+                victims = sorted(self._entries.items(), key=lambda item: item[1][1])
+                # Se baja al 90% de los límites para no expulsar en cada escritura
+                target_bytes = int(self.max_bytes * 0.9)
+                target_entries = int(self.max_entries * 0.9)
+                total_bytes = self._total_bytes
+                count = len(self._entries)
+                to_delete = []
+                for rel, (size, _) in victims:
+                    if total_bytes <= target_bytes and count <= target_entries:
+                        break
+                    to_delete.append(rel)
+                    total_bytes -= size
+                    count -= 1
+            removed = 0
+            for rel in to_delete:
+                try:
+                    os.remove(os.path.join(self.cache_dir, rel))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"No se pudo borrar {rel} del caché de imágenes: {e}")
+                    continue
+                with self._lock:
+                    entry = self._entries.pop(rel, None)
+                    if entry:
+                        self._total_bytes -= entry[0]
+                        self._dirty = True
+                removed += 1
+            if removed:
+                print(f"Caché de imágenes: {removed} archivos expulsados.")
+            self.flush()
+        finally:
+            with self._lock:
+                self._evicting = False
+
+    def flush(self):
+        """Guardar el índice en disco si cambió."""
+        with self._flush_lock:
+            with self._lock:
+                # Un proceso que no escaneó la carpeta (el overlay) no pisa el índice
+                if not self._loaded or not self._dirty:
+                    return
+                snapshot = {rel: list(entry) for rel, entry in self._entries.items()}
+                self._dirty = False
+            tmp_path = self.index_path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.index_path)
+            except (IOError, OSError) as e:
+                print(f"Error al guardar el índice del caché de imágenes: {e}")
+
+
+# =============================================================================
+# CACHÉ DE IMÁGENES DIRECCIONADO POR CONTENIDO
+# =============================================================================
+
+class _InFlightFetch:
+    """Descarga en curso de una URL; los demás hilos que la piden esperan aquí."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class ImageCache:
+    """
+    Caché de imágenes compartido por el launcher y el overlay.
+    Cada URL se identifica por el hash de la URL completa y apunta a un blob
+    nombrado por el SHA-256 de su contenido, así que los bytes idénticos
+    (por ejemplo, el avatar por defecto) se guardan una sola vez. Cada
+    REVALIDATE_INTERVAL se revalida en segundo plano con ETag / Last-Modified.
+    Las peticiones simultáneas de una misma URL comparten una sola descarga.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_MB * 1024 * 1024,
+                 max_entries=DEFAULT_MAX_ENTRIES, revalidate_interval=REVALIDATE_INTERVAL):
+        self.cache_dir = cache_dir
+        self.blobs_dir = os.path.join(cache_dir, BLOBS_DIRNAME)
+        self.urls_path = os.path.join(cache_dir, URLS_FILENAME)
+        self.revalidate_interval = revalidate_interval
+        self.index = ImageCacheIndex(cache_dir, max_bytes, max_entries)
+        self._lock = threading.Lock()
+        self._urls = None  # {hash de la URL: {"url", "blob", "etag", "last_modified", "checked_at"}}
+        self._urls_changed = set()  # claves modificadas por este proceso desde el último flush
+        self._save_timer = None
+        self._revalidating = set()
+        self._in_flight = {}  # {url: _InFlightFetch}
+        self.shared_fetches = 0  # peticiones que esperaron una descarga ya en curso
+
+    def start(self):
+        """Arranca el mantenimiento del caché (índice LRU y expulsión)."""
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        self.index.start()
+
+    @staticmethod
+    def url_key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _load_urls(self):
+        if self._urls is None:
+            try:
+                with open(self.urls_path, "r", encoding="utf-8") as f:
+                    self._urls = json.load(f)
+            except (IOError, OSError, ValueError):
+                self._urls = {}
+        return self._urls
+
+    def _entry(self, url):
+        with self._lock:
+            entry = self._load_urls().get(self.url_key(url))
+            return dict(entry) if entry else None
+
+    def _blob_path(self, entry):
+        return os.path.join(self.blobs_dir, entry["blob"])
+
+    def lookup(self, url):
+        """
+        Ruta local de la imagen si está en caché, sin esperar a la red. Si la
+        entrada está vencida se revalida en segundo plano.
+        """
+        if not url:
+            return None
+        entry = self._entry(url)
+        if not entry:
+            return None
+        path = self._blob_path(entry)
+        if not os.path.exists(path):
+            return None
+        self.index.touch(path)
+        if time.time() - entry.get("checked_at", 0) > self.revalidate_interval:
+            self._revalidate_in_background(url)
+        return path
+
+    def fetch(self, url):
+        """Ruta local de la imagen, descargándola si no está en caché."""
+        if not url:
+            return None
+        return self.lookup(url) or self._fetch_once(url)
+
+    def _fetch_once(self, url):
+        with self._lock:
+            flight = self._in_flight.get(url)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[url] = _InFlightFetch()
+            else:
+                self.shared_fetches += 1
+        if not leader:
+            flight.done.wait()
+            return flight.result
+        try:
+            flight.result = self._download(url)
+        finally:
+            with self._lock:
+                del self._in_flight[url]
+            flight.done.set()
+        return flight.result
+
+    def _revalidate_in_background(self, url):
+        with self._lock:
+            if url in self._revalidating:
+                return
+            self._revalidating.add(url)
+
+        def revalidate():
+            try:
+                self._download(url, self._entry(url))
+            finally:
+                with self._lock:
+                    self._revalidating.discard(url)
+
+        threading.Thread(target=revalidate, name="image-revalidate", daemon=True).start()
+
+    def _download(self, url, entry=None):
+        headers = {}
+        if entry and os.path.exists(self._blob_path(entry)):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            entry = None
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        # Nombre único por proceso e hilo: el overlay comparte la carpeta
+        tmp_path = os.path.join(self.blobs_dir, f"{self.url_key(url)}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            # La conexión vuelve al pool compartido al salir, también en 304 y errores
+            with client.get(url, headers=headers, stream=True, timeout=15) as response:
+                if response.status_code == 304 and entry:
+                    entry["checked_at"] = time.time()
+                    self._store_entry(url, entry)
+                    return self._blob_path(entry)
+                response.raise_for_status()
+                digest = hashlib.sha256()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(8192):
+                        digest.update(chunk)
+                        f.write(chunk)
+        except (requests.exceptions.RequestException, IOError, OSError) as e:
+            print(f"Error al descargar imagen {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return self._blob_path(entry) if entry else None
+
+        ext = os.path.splitext(urlparse(url).path)[1].lower()[:5]
+        blob = digest.hexdigest() + ext
+        blob_path = os.path.join(self.blobs_dir, blob)
+        if os.path.exists(blob_path):
+            # Mismo contenido ya guardado (otra URL o sin cambios)
+            os.remove(tmp_path)
+            self.index.touch(blob_path)
+        else:
+            try:
+                # El blob solo aparece completo: nunca se sirve una imagen a medias
+                os.replace(tmp_path, blob_path)
+            except OSError as e:
+                # Otro proceso pudo escribir el mismo blob a la vez
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                if not os.path.exists(blob_path):
+                    print(f"Error al guardar imagen {url}: {e}")
+                    return self._blob_path(entry) if entry else None
+            self.index.add(blob_path)
+        self._store_entry(url, {
+            "url": url,
+            "blob": blob,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        })
+        return blob_path
+
+    def _store_entry(self, url, entry):
+        with self._lock:
+            key = self.url_key(url)
+            self._load_urls()[key] = entry
+            self._urls_changed.add(key)
+            # Agrupa las escrituras de urls.json durante las ráfagas de descargas
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(2.0, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Guardar urls.json y el índice LRU si cambiaron."""
+        with self._lock:
+            self._save_timer = None
+            changed = {key: self._urls[key] for key in self._urls_changed}
+            self._urls_changed = set()
+        if changed:
+            # El overlay comparte la carpeta: se parte del mapa en disco y solo
+            # se escriben las entradas de este proceso para no pisar las suyas
+            try:
+                with open(self.urls_path, "r", encoding="utf-8") as f:
+                    merged = json.load(f)
+            except (IOError, OSError, ValueError):
+                merged = {}
+            merged.update(changed)
+            tmp_path = f"{self.urls_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f)
+                os.replace(tmp_path, self.urls_path)
+            except (IOError, OSError) as e:
+                print(f"Error al guardar el mapa de URLs del caché de imágenes: {e}")
+            with self._lock:
+                # Las entradas nuevas del otro proceso también sirven aquí
+                for key, entry in merged.items():
+                    self._urls.setdefault(key, entry)
+        self.index.flush()
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+# =============================================================================
+# DECODIFICACIÓN Y ESCALADO DE IMÁGENES FUERA DEL HILO DE LA INTERFAZ
+# =============================================================================
+
+# Hilos dedicados a decodificar y escalar imágenes
+DEFAULT_DECODE_WORKERS = 4
+
+
+def load_scaled_image(path, width=None, height=None,
+                      aspect=Qt.AspectRatioMode.KeepAspectRatio,
+                      transform=Qt.TransformationMode.SmoothTransformation):
+    """
+    Decodifica la imagen en un QImage (escalado si se indica tamaño).
+    Solo usa QImage, así que se puede llamar desde cualquier hilo.
+    Devuelve None si el archivo no se puede leer.
+    """
+    if not path:
+        return None
+    image = QImage(path)
+    if image.isNull():
+        return None
+    if width and height:
+        image = image.scaled(width, height, aspect, transform)
+    return image
+
+
+class ImageLoader(QObject):
+    """
+    Ejecuta trabajos de imagen (descarga, decodificación, escalado,
+    composición sobre QImage) en un pool de hilos y entrega el resultado en
+    el hilo de la interfaz. Cada trabajo pertenece a un QObject dueño: si el
+    dueño se destruye, o se llama a cancel(dueño), sus trabajos pendientes se
+    descartan y el callback no se llama.
+    """
+    job_done = pyqtSignal(int, object)  # id del trabajo, resultado
+
+    def __init__(self, max_workers=DEFAULT_DECODE_WORKERS):
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-decode")
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._jobs = {}  # {id del trabajo: (clave del dueño, callback)}
+        self._owner_jobs = {}  # {clave del dueño: set(ids de trabajos)}
+        self.job_done.connect(self._deliver)
+
+    def request(self, owner, work, callback):
+        """
+        Ejecuta work() en segundo plano y llama a callback(resultado) en el
+        hilo de la interfaz, salvo que el trabajo se cancele antes.
+        """
+        key = id(owner)
+        with self._lock:
+            self._next_id += 1
+            job_id = self._next_id
+            self._jobs[job_id] = (key, callback)
+            watched = key in self._owner_jobs
+            self._owner_jobs.setdefault(key, set()).add(job_id)
+        if not watched:
+            owner.destroyed.connect(lambda _=None, key=key: self._cancel_key(key, forget=True))
+        self._executor.submit(self._run, job_id, work)
+        return job_id
+
+    def cancel(self, owner):
+        """Descarta los trabajos pendientes de un dueño (por ejemplo, antes de vaciar una lista)."""
+        self._cancel_key(id(owner))
+
+    def _cancel_key(self, key, forget=False):
+        with self._lock:
+            job_ids = self._owner_jobs.pop(key, set()) if forget else self._owner_jobs.get(key, set())
+            for job_id in job_ids:
+                self._jobs.pop(job_id, None)
+            job_ids.clear()
+
+    def _run(self, job_id, work):
+        with self._lock:
+            if job_id not in self._jobs:
+                return  # cancelado antes de empezar
+        try:
+            result = work()
+        except Exception as e:
+            print(f"Error procesando imagen en segundo plano: {e}")
+            result = None
+        self.job_done.emit(job_id, result)
+
+    def _deliver(self, job_id, result):
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return
+            jobs = self._owner_jobs.get(job[0])
+            if jobs is not None:
+                jobs.discard(job_id)
+        job[1](result)
+
+    def shutdown(self):
+        with self._lock:
+            self._jobs.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -8,12 +8,14 @@ import subprocess
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QProgressBar, QScrollArea, QStackedWidget,
-    QFrame, QSizePolicy, QListWidget, QListWidgetItem, QSystemTrayIcon,
-    QFileDialog, QDialog, QGroupBox, QLineEdit
+    QFrame, QListWidget, QListWidgetItem, QSystemTrayIcon,
+    QFileDialog, QDialog, QGroupBox, QLineEdit, QCheckBox, QListView,
+    QStyledItemDelegate, QStyle, QSpinBox
 )
-from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QPainter
+from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QPainter, QColor, QPen, QFontMetrics
 from PyQt6.QtCore import (
-    Qt, QThread, QObject, pyqtSignal, QSize, QTimer
+    Qt, QThread, QObject, pyqtSignal, QSize, QTimer, QAbstractListModel,
+    QModelIndex, QRect, QRectF
 )
 from PyQt6.QtWidgets import QMessageBox
 from PyQt6.QtCore import QPropertyAnimation
@@ -26,7 +28,32 @@ import socket
 import webbrowser
 import functools
 import threading
+import hashlib
+from collections import OrderedDict
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+import re
+from bisect import bisect_left
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from catalog_cache import write_catalog_cache, read_catalog_cache
+from image_cache import ImageCache
+from image_loader import ImageLoader, load_scaled_image
+from downloader import (
+    download_file, DownloadStopped, IntegrityError, discard_partial, find_partial_downloads,
+    load_partial_state
+)
+from zip_install import stream_install, extract_archive, RangeNotSupported
+from download_queue import DownloadQueue, MAX_CONCURRENT_DOWNLOADS
+from throttle import bandwidth
+from http_client import client
+from telemetry import TransferTelemetry, append_install_log, format_rate, format_eta
+from preflight import (
+    InsufficientSpace, SPACE_MARGIN, check_space, free_space, format_size, installed_size, remote_zip_size,
+    space_needed
+)
+from delta_update import (
+    apply_update, discard_update, fetch_manifest, save_installed_manifest, DeltaUnavailable
+)
 
 # =============================================================================
 # CONFIGURACIÓN Y LÓGICA DE DATOS
@@ -34,18 +61,45 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 
 # URL del archivo JSON remoto
 JSON_URL = "https://traduction-club.live/api/winapp/proyectos.json"
-# Nombre del archivo JSON local para cache
+# URL de los cambios del catálogo desde una versión (?desde=<version_catalogo>)
+JSON_DELTA_URL = "https://traduction-club.live/api/winapp/proyectos_delta.json"
+# Cache binario del catálogo (cabecera con versión y validadores HTTP)
+LOCAL_CACHE_FILE = "proyectos_cache.bin"
+# Cache JSON antiguo, solo se lee si no existe el binario
 LOCAL_JSON_FILE = "proyectos_cache.json"
+# Validadores HTTP (ETag / Last-Modified) del cache JSON antiguo
+LOCAL_JSON_META_FILE = "proyectos_cache.meta.json"
 # Carpeta para guardar imágenes de portada
 IMAGE_CACHE_DIR = "image_cache"
-# Tiempo en segundos para considerar el cache como válido antes de re-verificar
-CACHE_EXPIRY_TIME = 3600  # 1 hora
+# Descargas de imágenes simultáneas del precargador
+IMAGE_PREFETCH_WORKERS = 8
+# Hilos que decodifican y escalan imágenes fuera del hilo de la interfaz
+IMAGE_DECODE_WORKERS = 4
+# Miniaturas ya escaladas (tarjetas de la biblioteca y vista de detalles)
+THUMBNAIL_CACHE_DIR = os.path.join(IMAGE_CACHE_DIR, "thumbs")
+CARD_IMAGE_SIZE = (192, 108)
+DETAIL_IMAGE_SIZE = (640, 360)
+# Límites por defecto del caché de imágenes en disco (ajustables con
+# "image_cache_max_mb" e "image_cache_max_entries")
+IMAGE_CACHE_MAX_MB = 512
+IMAGE_CACHE_MAX_ENTRIES = 5000
+# Presupuesto por defecto de la caché de pixmaps en memoria (ajustable con "pixmap_cache_mb")
+PIXMAP_CACHE_BUDGET_MB = 64
+# Conexiones simultáneas de la descarga segmentada (ajustable con
+# "segmented_downloads" y "download_connections")
+DOWNLOAD_CONNECTIONS = 4
+# Límites de ancho de banda por defecto en KB/s, 0 = sin límite (ajustables
+# con "bandwidth_limit_kbps" y "bandwidth_limit_playing_kbps")
+BANDWIDTH_LIMIT_KBPS = 0
+BANDWIDTH_PLAYING_KBPS = 512
 # Directorio para los juegos instalados
 GAMES_INSTALL_DIR = "installed_games"
 # Ubicación por defecto
 LIBRARIES_FILE = "libraries.json"
 # Archivo de configs
 SETTINGS_FILE = "settings.json"
+# Versión publicada del launcher
+UPDATE_INFO_URL = "https://traduction-club.live/api/winapp/launcher_update.json"
 
 # def send_overlay_rect(x, y, w, h, r, g, b, a):
 #     try:
@@ -109,7 +163,7 @@ def clear_token():
 def authenticate_user(username, password):
     url = "https://traduction-club.live/api/login/"
     try:
-        response = requests.post(url, json={"username": username, "password": password}, timeout=10)
+        response = client.post(url, json={"username": username, "password": password}, timeout=10, retries=0)
         if response.status_code == 200:
             data = response.json()
             return data.get("access"), data.get("username"), data.get("avatar_url")
@@ -137,80 +191,420 @@ def save_libraries(libraries):
     with open(LIBRARIES_FILE, "w", encoding="utf-8") as f:
         json.dump(libraries, f, indent=2)
 
-def download_json(url):
-    """Descargar el archivo JSON."""
+def find_partial_download(project_id, libraries=None):
+    """
+    Descarga a medias (pausada, fallida o interrumpida al cerrar) de un proyecto.
+    Devuelve (biblioteca, ruta del zip, estado) o None.
+    """
+    for library in libraries if libraries is not None else load_libraries():
+        for zip_filepath in find_partial_downloads(os.path.join(library, project_id)):
+            state = load_partial_state(zip_filepath)
+            if state:
+                return library, zip_filepath, state
+    return None
+
+def download_json_conditional(url, meta=None, replace_body=None):
+    """
+    Descargar el JSON enviando los validadores guardados (If-None-Match /
+    If-Modified-Since). Devuelve (status, data, meta): status 304 significa
+    que el cache local sigue siendo válido y data es None.
+
+    Con un 200, replace_body(meta nuevo) se llama antes de leer el cuerpo: si
+    devuelve datos se usan esos y el cuerpo se descarta sin descargarlo.
+    """
+    headers = {}
+    meta = meta or {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        with client.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304:
+                return 304, None, meta
+            response.raise_for_status()
+            new_meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            if replace_body:
+                data = replace_body(new_meta)
+                if data is not None:
+                    return response.status_code, data, new_meta
+            return response.status_code, response.json(), new_meta
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error al descargar el JSON: {e}")
+        return None, None, meta
+
+def download_catalog_delta(since_version):
+    """
+    Descargar los cambios del catálogo desde since_version. Devuelve un dict
+    {"version_base", "version_catalogo", "agregados", "modificados", "eliminados"}
+    o None si el servidor no ofrece delta para esa versión.
+    """
+    try:
+        response = client.get(JSON_DELTA_URL, params={"desde": since_version}, timeout=10)
+        if response.status_code != 200:
+            return None
+        delta = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error al descargar el delta del catálogo: {e}")
         return None
+    if not isinstance(delta, dict) or delta.get("version_base") != since_version:
+        return None
+    return delta
 
-def get_local_json_version(filepath):
-    """Obtener la versión del catálogo del archivo JSON local."""
+def apply_catalog_delta(data, delta):
+    """
+    Aplicar un delta al catálogo en cache. Los proyectos modificados se
+    reemplazan en su sitio, los agregados van al final y los eliminados
+    (lista de id_proyecto) se quitan.
+    """
+    replaced = {p["id_proyecto"]: p for p in delta.get("modificados", []) if p.get("id_proyecto")}
+    removed = set(delta.get("eliminados", []))
+    proyectos = []
+    for project in data.get("proyectos", []):
+        project_id = project.get("id_proyecto")
+        if project_id in removed:
+            continue
+        proyectos.append(replaced.pop(project_id, project))
+    # Modificados que no estaban en el cache se tratan como agregados
+    proyectos.extend(replaced.values())
+    existing = {p.get("id_proyecto") for p in proyectos}
+    proyectos.extend(p for p in delta.get("agregados", []) if p.get("id_proyecto") not in existing)
+    new_data = dict(data)
+    new_data["proyectos"] = proyectos
+    new_data["version_catalogo"] = delta.get("version_catalogo", data.get("version_catalogo"))
+    return new_data
+
+def load_cache_meta(filepath):
+    """Leer los validadores HTTP guardados junto al cache."""
     if os.path.exists(filepath):
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f).get("version_catalogo")
+                return json.load(f)
         except (json.JSONDecodeError, IOError):
-            return None
-    return None
+            return {}
+    return {}
 
-def save_json_local(data, filepath):
-    """Guardar los datos JSON en un archivo local."""
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except IOError as e:
-        print(f"Error al guardar el JSON local: {e}")
+def load_catalog_cache():
+    """
+    Cargar el catálogo en cache. Usa el formato binario y, si no existe o
+    no es legible, el JSON antiguo. Devuelve (datos, validadores).
+    """
+    header, data = read_catalog_cache(os.path.join(os.getcwd(), LOCAL_CACHE_FILE))
+    if data is not None:
+        return data, header
+    legacy_path = os.path.join(os.getcwd(), LOCAL_JSON_FILE)
+    if os.path.exists(legacy_path):
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data, load_cache_meta(os.path.join(os.getcwd(), LOCAL_JSON_META_FILE))
+        except (json.JSONDecodeError, IOError):
+            pass
+    return None, {}
 
 def load_projects_data():
-    """Cargar los datos de los proyectos, usando cache si es válido."""
-    local_path = os.path.join(os.getcwd(), LOCAL_JSON_FILE)
-    remote_data = download_json(JSON_URL)
+    """Cargar los datos de los proyectos, revalidando el cache con GET condicional."""
+    cache_path = os.path.join(os.getcwd(), LOCAL_CACHE_FILE)
+    # Los validadores solo se envían si el cuerpo en cache se pudo leer: con
+    # un cache ilegible (otra versión de marshal) un 304 serviría datos viejos
+    cached, meta = load_catalog_cache()
+    meta = meta or {}
+
+    def from_delta(new_meta):
+        # El catálogo cambió: con una versión en cache basta con los cambios
+        # desde esa versión, sin bajar el JSON completo
+        if cached is None or not meta.get("version_catalogo"):
+            return None
+        delta = download_catalog_delta(meta["version_catalogo"])
+        if delta is None:
+            return None
+        changes = len(delta.get("agregados", [])) + len(delta.get("modificados", [])) + len(delta.get("eliminados", []))
+        print(f"Aplicando delta del catálogo ({changes} cambios).")
+        return apply_catalog_delta(cached, delta)
+
+    # Primero se revalida: un catálogo sin cambios cuesta un 304 y el delta
+    # solo se pide si cambió. Los validadores del 200 describen la versión a
+    # la que lleva el delta, así que se guardan también en ese caso
+    status, remote_data, new_meta = download_json_conditional(JSON_URL, meta, from_delta)
+
+    if status == 304 and cached is not None:
+        print("Catálogo sin cambios (304). Usando cache local.")
+        if "marshal_version" in meta:
+            os.utime(cache_path)
+        else:
+            # Venía del JSON antiguo: se pasa al cache binario
+            write_catalog_cache(cached, new_meta, cache_path)
+        return cached
 
     if remote_data:
-        remote_version = remote_data.get("version_catalogo")
-        local_version = get_local_json_version(local_path)
-        if local_version and remote_version == local_version:
-            if (time.time() - os.path.getmtime(local_path)) < CACHE_EXPIRY_TIME:
-                print("Usando JSON local (caché válido).")
-                with open(local_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-
-        print("Usando JSON remoto (nuevo o actualizado).")
-        save_json_local(remote_data, local_path)
+        if remote_data.get("version_catalogo") == meta.get("version_catalogo"):
+            print("Usando JSON remoto (misma versión del catálogo).")
+        else:
+            print("Usando JSON remoto (nuevo o actualizado).")
+        write_catalog_cache(remote_data, new_meta, cache_path)
         return remote_data
     else:
         print("Fallo en descarga remota. Intentando cargar desde caché local.")
-        if os.path.exists(local_path):
-            with open(local_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        return cached
+
+def load_local_projects_data():
+    """Cargar el catálogo solo desde el cache local, sin tocar la red."""
+    data, _ = load_catalog_cache()
+    return data
+
+def find_installed_executable(project_data, libraries):
+    """Devuelve la ruta del ejecutable instalado del proyecto, o None."""
+    project_id = project_data.get("id_proyecto")
+    exe_name = project_data.get("nombre_ejecutable")
+    if not project_id or not exe_name:
         return None
+    for library in libraries:
+        executable_path = os.path.join(library, project_id, exe_name)
+        if os.path.exists(executable_path):
+            return executable_path
+    return None
 
-def download_and_cache_image(image_url, project_id):
-    """Descargar una imagen y la guarda en el caché si no existe."""
-    if not image_url or not project_id:
-        return None
-    
-    filename = f"{project_id}_{os.path.basename(image_url)}"
-    safe_filename = "".join(c for c in filename if c.isalnum() or c in ['.', '_', '-']).rstrip()
-    image_path = os.path.join(IMAGE_CACHE_DIR, safe_filename)
+def read_installed_version(project_id, libraries):
+    """Lee el version.txt del proyecto en la primera biblioteca que lo tenga."""
+    for library in libraries:
+        version_file = os.path.join(library, project_id, "version.txt")
+        if os.path.exists(version_file):
+            with open(version_file, "r", encoding="utf-8") as f:
+                return f.read().strip()
+    return None
+
+# =============================================================================
+# CATÁLOGO DE PROYECTOS EN MEMORIA
+# =============================================================================
+
+def tokenize_search_text(text):
+    """Minúsculas, sin acentos y partido en palabras alfanuméricas."""
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+class CatalogSearchIndex:
+    """
+    Índice invertido sobre titulo y descripcion. Cada palabra de la consulta
+    se trata como prefijo; el resultado es la intersección de todas.
+    """
+
+    PREFIX_CACHE_SIZE = 256
+
+    def __init__(self, projects):
+        self.postings = {}  # {palabra: {id_proyecto, ...}}
+        for project in projects:
+            text = f"{project.get('titulo') or ''} {project.get('descripcion') or ''}"
+            for token in set(tokenize_search_text(text)):
+                self.postings.setdefault(token, set()).add(project["id_proyecto"])
+        self.tokens = sorted(self.postings)
+        self._prefix_cache = {}
+
+    def _ids_for_prefix(self, prefix):
+        ids = self._prefix_cache.get(prefix)
+        if ids is not None:
+            return ids
+        ids = set()
+        index = bisect_left(self.tokens, prefix)
+        while index < len(self.tokens) and self.tokens[index].startswith(prefix):
+            ids |= self.postings[self.tokens[index]]
+            index += 1
+        if len(self._prefix_cache) >= self.PREFIX_CACHE_SIZE:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = ids
+        return ids
+
+    def search(self, query):
+        """Devuelve el conjunto de ids que coinciden, o None si la consulta está vacía."""
+        tokens = tokenize_search_text(query)
+        if not tokens:
+            return None
+        result = None
+        # Las palabras más largas suelen ser las más selectivas
+        for token in sorted(set(tokens), key=len, reverse=True):
+            ids = self._ids_for_prefix(token)
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result
+
+class ProjectCatalog:
+    """
+    Índice en memoria del catálogo, construido una vez por carga.
+    Búsqueda O(1) por id_proyecto y vistas precalculadas (instalados,
+    con actualización disponible y orden por título).
+    """
+
+    def __init__(self, projects_data, libraries=None, refresh=True):
+        self.data = projects_data or {}
+        self.projects = [p for p in (self.data.get("proyectos") or []) if p.get("id_proyecto")]
+        self.by_id = {p["id_proyecto"]: p for p in self.projects}
+        self.by_title = sorted(self.projects, key=lambda p: (p.get("titulo") or "").lower())
+        self.search_index = CatalogSearchIndex(self.projects)
+        self.installed = {}  # {id_proyecto: ruta del ejecutable}
+        self.installed_versions = {}  # {id_proyecto: versión en version.txt}
+        self.update_available = set()
+        if refresh:
+            self.refresh_install_state(libraries)
+
+    def updated(self, projects_data, libraries=None):
+        """
+        Construye el catálogo para projects_data reutilizando el estado de
+        instalación de los proyectos que no cambiaron. Devuelve
+        (catálogo, agregados, modificados, eliminados) como conjuntos de ids.
+        """
+        new_catalog = ProjectCatalog(projects_data, refresh=False)
+        added = new_catalog.by_id.keys() - self.by_id.keys()
+        removed = self.by_id.keys() - new_catalog.by_id.keys()
+        changed = {pid for pid in new_catalog.by_id.keys() & self.by_id.keys()
+                   if new_catalog.by_id[pid] != self.by_id[pid]}
+        for pid in new_catalog.by_id.keys() - added - changed:
+            if pid in self.installed:
+                new_catalog.installed[pid] = self.installed[pid]
+            if pid in self.installed_versions:
+                new_catalog.installed_versions[pid] = self.installed_versions[pid]
+            if pid in self.update_available:
+                new_catalog.update_available.add(pid)
+        libraries = load_libraries() if libraries is None else libraries
+        for pid in added | changed:
+            new_catalog.refresh_project(pid, libraries)
+        return new_catalog, added, changed, removed
+
+    def __len__(self):
+        return len(self.projects)
+
+    def __iter__(self):
+        return iter(self.projects)
+
+    def __contains__(self, project_id):
+        return project_id in self.by_id
+
+    def get(self, project_id):
+        return self.by_id.get(project_id)
+
+    def refresh_install_state(self, libraries=None):
+        """Recalcula el estado de instalación de todos los proyectos."""
+        libraries = load_libraries() if libraries is None else libraries
+        self.installed.clear()
+        self.installed_versions.clear()
+        self.update_available.clear()
+        for project in self.projects:
+            self._update_project_state(project, libraries)
+
+    def refresh_project(self, project_id, libraries=None):
+        """Recalcula el estado de instalación de un solo proyecto."""
+        project = self.by_id.get(project_id)
+        if not project:
+            return
+        libraries = load_libraries() if libraries is None else libraries
+        self.installed.pop(project_id, None)
+        self.installed_versions.pop(project_id, None)
+        self.update_available.discard(project_id)
+        self._update_project_state(project, libraries)
+
+    def _update_project_state(self, project, libraries):
+        project_id = project["id_proyecto"]
+        exe_path = find_installed_executable(project, libraries)
+        if not exe_path:
+            return
+        self.installed[project_id] = exe_path
+        installed_version = read_installed_version(project_id, libraries)
+        if installed_version:
+            self.installed_versions[project_id] = installed_version
+        remote_version = project.get("version")
+        if installed_version and remote_version and installed_version != str(remote_version):
+            self.update_available.add(project_id)
 
-    if os.path.exists(image_path):
-        return image_path
+    def exe_path(self, project_id):
+        return self.installed.get(project_id)
 
+    def installed_version(self, project_id):
+        return self.installed_versions.get(project_id)
+
+    def needs_update(self, project_id):
+        return project_id in self.update_available
+
+    def search(self, query, installed_only=False, update_only=False):
+        """
+        Ids que coinciden con la búsqueda y los filtros. Devuelve None si no
+        hay ningún criterio (se muestran todos).
+        """
+        result = self.search_index.search(query)
+        if installed_only:
+            result = set(self.installed) if result is None else result & self.installed.keys()
+        if update_only:
+            result = set(self.update_available) if result is None else result & self.update_available
+        return result
+
+    def installed_projects(self):
+        """Proyectos instalados, en el orden del catálogo."""
+        return [p for p in self.projects if p["id_proyecto"] in self.installed]
+
+    def update_available_projects(self):
+        return [p for p in self.projects if p["id_proyecto"] in self.update_available]
+
+image_cache = ImageCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_MB * 1024 * 1024, IMAGE_CACHE_MAX_ENTRIES)
+
+def cached_image(image_url):
+    """Ruta de la imagen si ya está en el caché, sin esperar a la red."""
+    return image_cache.lookup(image_url)
+
+def download_and_cache_image(image_url):
+    """Descargar una imagen y la guarda en el caché si no existe."""
+    return image_cache.fetch(image_url)
+
+def thumbnail_path(image_path, width, height, pad):
+    """
+    Ruta de la miniatura derivada. La clave combina la ruta, el tamaño y la
+    fecha de modificación del original, así que un original nuevo genera
+    otra miniatura.
+    """
     try:
-        response = requests.get(image_url, stream=True, timeout=15)
-        response.raise_for_status()
-        with open(image_path, 'wb') as f:
-            for chunk in response.iter_content(8192):
-                f.write(chunk)
-        return image_path
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar imagen {image_url}: {e}")
+        st = os.stat(image_path)
+    except OSError:
         return None
+    source = f"{os.path.abspath(image_path)}|{st.st_size}|{st.st_mtime_ns}"
+    source_hash = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    suffix = "p" if pad else ""
+    return os.path.join(THUMBNAIL_CACHE_DIR, f"{source_hash}_{width}x{height}{suffix}.png")
+
+def load_thumbnail(image_path, width, height, pad=False):
+    """
+    Devuelve un QImage de la imagen escalada a width x height (KeepAspectRatio).
+    Con pad=True se centra sobre un lienzo transparente del tamaño exacto.
+    La primera vez se guarda en disco; después solo se decodifica el archivo pequeño.
+    Solo trabaja con QImage, así que se puede llamar desde los hilos de image_loader.
+    """
+    thumb_path = thumbnail_path(image_path, width, height, pad)
+    if thumb_path is None:
+        return None
+    if os.path.exists(thumb_path):
+        image = QImage(thumb_path)
+        if not image.isNull():
+            image_cache.index.touch(thumb_path)
+            return image
+    source = QImage(image_path)
+    if source.isNull():
+        return None
+    image = source.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    if pad:
+        canvas = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        canvas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(canvas)
+        painter.drawImage((width - image.width()) // 2, (height - image.height()) // 2, image)
+        painter.end()
+        image = canvas
+    os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+    # Se escribe aparte y se renombra: otro hilo nunca lee una miniatura a medias
+    tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+    if image.save(tmp_path, "PNG"):
+        os.replace(tmp_path, thumb_path)
+        image_cache.index.add(thumb_path)
+    else:
+        print(f"No se pudo guardar la miniatura {thumb_path}")
+    return image
 
 def select_library_dialog(self):
     libraries = load_libraries()
@@ -232,13 +626,19 @@ class DownloadWorker(QObject):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
+    stats = pyqtSignal(object)  # foto de TransferTelemetry (velocidad, tiempo restante...)
     status = pyqtSignal(str)
+    paused = pyqtSignal()
 
-    def __init__(self, project_data, install_dir):
+    def __init__(self, project_data, install_dir, connections=1, stream=False, update=False):
         super().__init__()
         self.project_data = project_data
         self.install_dir = install_dir
-        self._cancelled = False
+        self.connections = connections
+        self.stream = stream  # extraer mientras se descarga, sin guardar el zip
+        self.update = update  # actualizar solo los archivos cambiados si hay manifiesto
+        self._stop_reason = None  # None, "pause" o "cancel"
+        self.telemetry = TransferTelemetry(project_data.get("id_proyecto"), "zip")
         # self.sidebar = QListWidget()
         # self.sidebar.setObjectName("sidebar")
         # self.sidebar.setFixedWidth(220)
@@ -247,7 +647,35 @@ class DownloadWorker(QObject):
         # self.sidebar.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
     def cancel(self):
-        self._cancelled = True
+        self._stop_reason = "cancel"
+
+    def pause(self):
+        self._stop_reason = "pause"
+
+    def _emit_progress(self, downloaded, total):
+        # Se llama por bloque (y desde varios hilos en la descarga
+        # segmentada); la interfaz solo recibe una foto cada UI_UPDATE_INTERVAL
+        if self.telemetry.update(downloaded, total):
+            stats = self.telemetry.snapshot()
+            self.stats.emit(stats)
+            self.progress.emit(stats["percent"])
+
+    def _expected_file(self):
+        """
+        Tamaño y hashes que publica el catálogo para el zip, todos opcionales:
+        "tamano_bytes", "sha256" y "hash_bloques" ({"tamano": bytes por
+        bloque, "sha256": [hash de cada bloque]}).
+        """
+        expected = {}
+        if self.project_data.get("tamano_bytes"):
+            expected["size"] = int(self.project_data["tamano_bytes"])
+        if self.project_data.get("sha256"):
+            expected["sha256"] = self.project_data["sha256"]
+        blocks = self.project_data.get("hash_bloques") or {}
+        if blocks.get("tamano") and blocks.get("sha256"):
+            expected["block_size"] = int(blocks["tamano"])
+            expected["block_sha256"] = blocks["sha256"]
+        return expected or None
 
     def run(self):
         project_id = self.project_data.get("id_proyecto")
@@ -261,41 +689,259 @@ class DownloadWorker(QObject):
         zip_filename = os.path.basename(download_url)
         zip_filepath = os.path.join(project_install_dir, zip_filename)
 
+        outcome = "error"
         try:
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            with open(zip_filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self._cancelled:
-                        self.error.emit("Descarga cancelada por el usuario.")
-                        try:
-                            f.close()
-                            os.remove(zip_filepath)
-                        except Exception:
-                            pass
-                        return
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
-                    if total_size > 0:
-                        progress_percentage = int((downloaded_size / total_size) * 100)
-                        self.progress.emit(progress_percentage)
-            self.progress.emit(100)
-            self.status.emit("Extrayendo...")
-            print(f"Extrayendo {zip_filepath}...")
-            with zipfile.ZipFile(zip_filepath, 'r') as zip_ref:
-                zip_ref.extractall(project_install_dir)
-            os.remove(zip_filepath)
-            print("Extracción completa.")
+            if self.update and self._delta_update(project_install_dir):
+                outcome = "ok"
+                executable_path = os.path.join(project_install_dir, self.project_data['nombre_ejecutable'])
+                self.finished.emit(executable_path)
+                return
+            # Una instalación a medias sigue en el modo en que empezó
+            state = load_partial_state(zip_filepath)
+            if state and state.get("url") == download_url:
+                stream = state.get("mode") == "stream"
+            else:
+                stream = self.stream
+            self._check_free_space(download_url, project_install_dir, stream, state)
+            installed = False
+            if stream:
+                self.telemetry.mode = "stream"
+                try:
+                    stream_install(
+                        download_url, zip_filepath, project_install_dir,
+                        self._emit_progress, lambda: self._stop_reason, self._expected_file()
+                    )
+                    installed = True
+                    print("Instalación completa (extraída durante la descarga).")
+                except RangeNotSupported:
+                    print("El servidor no acepta rangos: se descarga el zip completo.")
+                    self.telemetry.mode = "zip"
+            if not installed:
+                self._download_and_extract(download_url, zip_filepath, project_install_dir)
+            self._record_manifest(project_install_dir)
+            outcome = "ok"
             executable_path = os.path.join(project_install_dir, self.project_data['nombre_ejecutable'])
             self.finished.emit(executable_path)
+        except DownloadStopped as e:
+            outcome = e.reason
+            if e.reason == "cancel":
+                discard_partial(zip_filepath)
+                discard_update(project_install_dir)
+                self.error.emit("Descarga cancelada por el usuario.")
+            else:
+                self.paused.emit()
+        except InsufficientSpace as e:
+            self.error.emit(f"{e} Libera espacio o elige otra biblioteca.")
+        except IntegrityError as e:
+            self.error.emit(f"La descarga está dañada y no se instaló: {e} Vuelve a intentarlo.")
         except requests.exceptions.RequestException as e:
             self.error.emit(f"Error de descarga: {e}")
         except zipfile.BadZipFile:
             self.error.emit("Error: El archivo descargado no es un ZIP válido.")
         except Exception as e:
             self.error.emit(f"Error inesperado: {e}")
+        finally:
+            record = self.telemetry.finish(
+                outcome, version=self.project_data.get("version"), connections=self.connections
+            )
+            append_install_log(record)
+            print(f"Instalación de {project_id}: {record['outcome']} en {record['seconds']:.1f} s, fases {record['phases']}")
+
+    def _check_free_space(self, download_url, project_install_dir, stream, state):
+        """
+        Comprobar antes de descargar que caben el zip y lo extraído. El tamaño
+        descomprimido exacto sale del directorio central del zip remoto; si el
+        servidor no acepta rangos se estima con "tamano_gb" del catálogo.
+        """
+        self.status.emit("Comprobando espacio...")
+        resuming = bool(state) and state.get("url") == download_url
+        downloaded = state.get("downloaded", 0) if resuming else 0
+        try:
+            download_size, uncompressed = remote_zip_size(download_url)
+        except (RangeNotSupported, requests.exceptions.RequestException, zipfile.BadZipFile) as e:
+            try:
+                # Sin el directorio central se supone que lo extraído ocupa como el zip
+                download_size = uncompressed = int(float(self.project_data.get("tamano_gb")) * 1024 ** 3)
+            except (TypeError, ValueError):
+                print(f"No se pudo calcular el espacio necesario: {e}")
+                self.status.emit("Descargando...")
+                return
+        if resuming and "segments" in state:
+            # El .part segmentado está preasignado: ya ocupa el zip entero
+            downloaded = state["size"]
+        # Lo que ya hay en la carpeta (la versión anterior al actualizar o lo
+        # extraído antes de pausar) se sobrescribe al extraer: no cuenta dos veces
+        existing = installed_size(project_install_dir, os.path.basename(download_url))
+        uncompressed = max(0, uncompressed - existing)
+        if resuming and state.get("mode") == "stream":
+            downloaded = 0
+        required = space_needed(download_size, uncompressed, stream, downloaded)
+        free = check_space(project_install_dir, required)
+        if free is not None:
+            print(f"Espacio: hacen falta {format_size(required)}, hay {format_size(free)} libres.")
+        self.status.emit("Descargando...")
+
+    def _delta_update(self, project_install_dir):
+        """
+        Actualizar descargando solo los archivos que cambiaron según el
+        manifiesto de la nueva versión. Devuelve False si no hay manifiesto
+        utilizable y hay que reinstalar el zip completo.
+        """
+        manifest_url = self.project_data.get("url_manifiesto")
+        if not manifest_url:
+            return False
+        self.status.emit("Actualizando...")
+        self.telemetry.mode = "delta"
+        installed_version = None
+        version_file = os.path.join(project_install_dir, "version.txt")
+        if os.path.exists(version_file):
+            with open(version_file, "r", encoding="utf-8") as f:
+                installed_version = f.read().strip()
+        try:
+            manifest = fetch_manifest(manifest_url)
+            apply_update(
+                manifest, project_install_dir, installed_version,
+                self._emit_progress, lambda: self._stop_reason
+            )
+        except DeltaUnavailable as e:
+            print(f"{e} Se descarga el juego completo.")
+            # Lo que ya se hubiera preparado no sirve para el zip completo
+            discard_update(project_install_dir)
+            self.status.emit("Descargando...")
+            self.telemetry.mode = "zip"
+            self.telemetry.begin("connect")
+            return False
+        self.progress.emit(100)
+        return True
+
+    def _record_manifest(self, project_install_dir):
+        """Anotar el manifiesto de la versión recién instalada para futuras actualizaciones."""
+        manifest_url = self.project_data.get("url_manifiesto")
+        if not manifest_url:
+            return
+        try:
+            save_installed_manifest(project_install_dir, fetch_manifest(manifest_url))
+        except (DeltaUnavailable, IOError, OSError) as e:
+            print(f"No se pudo guardar el manifiesto instalado: {e}")
+
+    def _download_and_extract(self, download_url, zip_filepath, project_install_dir):
+        """Instalación en dos fases: descargar el zip completo y después extraerlo."""
+        # Los bytes van a un .part que sobrevive a pausas, errores y reinicios
+        # Tamaño y hashes se verifican mientras llegan los bytes, antes de extraer
+        # El zip se reserva entero en disco antes de descargar
+        download_file(
+            download_url, zip_filepath, self.connections, self._emit_progress, lambda: self._stop_reason,
+            self._expected_file(), self.telemetry.begin, preallocate=True
+        )
+        self.progress.emit(100)
+        self.telemetry.begin("extract")
+        self.status.emit("Extrayendo...")
+        print(f"Extrayendo {zip_filepath}...")
+        # Instalación nueva si en la carpeta solo está el zip
+        fresh = os.listdir(project_install_dir) == [os.path.basename(zip_filepath)]
+        start = time.perf_counter()
+        try:
+            # Durante la extracción solo se atiende cancelar: una pausa que
+            # llegue tarde no puede tirar el zip ya descargado y verificado
+            extract_archive(
+                zip_filepath, project_install_dir, progress=self._emit_progress,
+                should_stop=lambda: self._stop_reason if self._stop_reason == "cancel" else None,
+                remove_on_cancel=fresh
+            )
+        except DownloadStopped:
+            os.remove(zip_filepath)
+            raise
+        os.remove(zip_filepath)
+        print(f"Extracción completa en {time.perf_counter() - start:.1f} s.")
+
+
+class ImagePrefetcher(QObject):
+    """
+    Descarga portadas e iconos en paralelo con un pool de hilos acotado.
+    Emite image_ready por cada imagen y batch_finished cuando se vacía la cola.
+    """
+    image_ready = pyqtSignal(str, str, str)  # tipo ("cover" / "icon"), id_proyecto, ruta ("" si falló)
+    batch_finished = pyqtSignal(int, int, float)  # descargadas, fallidas, segundos
+
+    def __init__(self, max_workers=IMAGE_PREFETCH_WORKERS):
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-prefetch")
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._batch_start = None
+        self._fetched = 0
+        self._failed = 0
+        self.batch_finished.connect(self._report_batch)
+
+    def request(self, kind, project_id, image_url):
+        """Encola la descarga si la imagen no está ya pendiente."""
+        key = (kind, project_id)
+        with self._lock:
+            if key in self._pending:
+                return
+            if not self._pending:
+                self._batch_start = time.perf_counter()
+                self._fetched = 0
+                self._failed = 0
+            self._pending.add(key)
+        self._executor.submit(self._fetch, kind, project_id, image_url)
+
+    def _fetch(self, kind, project_id, image_url):
+        path = download_and_cache_image(image_url)
+        with self._lock:
+            self._pending.discard((kind, project_id))
+            if path:
+                self._fetched += 1
+            else:
+                self._failed += 1
+            done = not self._pending
+            stats = (self._fetched, self._failed, time.perf_counter() - self._batch_start)
+        self.image_ready.emit(kind, project_id, path or "")
+        if done:
+            self.batch_finished.emit(*stats)
+
+    def _report_batch(self, fetched, failed, seconds):
+        print(f"Precarga de imágenes: {fetched} descargadas, {failed} fallidas en {seconds:.2f} s.")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class StartupWorker(QObject):
+    """Avisos de red del arranque (estado en línea y actualizaciones) fuera del hilo de la interfaz."""
+    update_available = pyqtSignal(str, str)  # versión, url del instalador
+    finished = pyqtSignal()
+
+    def __init__(self, current_version):
+        super().__init__()
+        self.current_version = current_version
+
+    def run(self):
+        post_user_status("Conectado")
+        try:
+            latest_version, download_url = fetch_launcher_update_info()
+            if latest_version > self.current_version:
+                self.update_available.emit(latest_version, download_url)
+        except Exception as e:
+            print(f"No se pudo buscar actualizaciones: {e}")
+        self.finished.emit()
+
+
+class CatalogRefreshWorker(QObject):
+    """Revalida el catálogo remoto fuera del hilo de la interfaz."""
+    finished = pyqtSignal(object)
+
+    def run(self):
+        start = time.perf_counter()
+        data = load_projects_data()
+        print(f"Catálogo revalidado en {(time.perf_counter() - start) * 1000:.0f} ms.")
+        self.finished.emit(data)
+
+
+def fetch_launcher_update_info():
+    """Última versión publicada del launcher y la url de su instalador."""
+    info = client.get(UPDATE_INFO_URL, timeout=10, retries=0).json()
+    return info["version"], info["installer_url"]
 
 
 def refresh_access_token():
@@ -306,7 +952,7 @@ def refresh_access_token():
             if not refresh:
                 return False
             try:
-                resp = requests.post("https://traduction-club.live/api/token/refresh/", json={"refresh": refresh}, timeout=10)
+                resp = client.post("https://traduction-club.live/api/token/refresh/", json={"refresh": refresh}, timeout=10, retries=0)
                 if resp.status_code == 200:
                     new_access = resp.json().get("access")
                     if new_access:
@@ -318,16 +964,341 @@ def refresh_access_token():
                 print(f"Error refrescando token: {e}")
         return False
 
+def api_post(url, data=None):
+    """POST autenticado a la API; refresca el token si caducó. None si falla."""
+    try:
+        headers = get_auth_headers()
+        r = client.post(url, headers=headers, json=data, timeout=10, retries=0)
+        if r.status_code == 401:
+            if refresh_access_token():
+                headers = get_auth_headers()
+                r = client.post(url, headers=headers, json=data, timeout=10, retries=0)
+        r.raise_for_status()
+        return r.json()
+    except Exception as e:
+        print(f"API POST error: {e}")
+        return None
+
+def post_user_status(status, game=None):
+    """Publica el estado del usuario para sus amigos. Se puede llamar desde cualquier hilo."""
+    data = {"status": status}
+    if game:
+        data["game"] = game
+    api_post("https://traduction-club.live/api/friends/status/", data)
+
+
+# =============================================================================
+# CACHÉ DE PIXMAPS EN MEMORIA
+# =============================================================================
+
+class PixmapCache:
+    """
+    Caché LRU de QPixmap compartida por todo el proceso, con límite en bytes.
+    La clave es (ruta, mtime, ancho, alto, aspecto, transformación), así que
+    un archivo reemplazado en disco no devuelve el pixmap viejo.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # {clave: (QPixmap, bytes)}
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    @staticmethod
+    def _key(path, width, height, aspect, transform):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (OSError, TypeError):
+            mtime = None
+        return (path, mtime, width, height, aspect, transform)
+
+    def peek(self, path, width=None, height=None,
+             aspect=Qt.AspectRatioMode.KeepAspectRatio,
+             transform=Qt.TransformationMode.SmoothTransformation):
+        """Devuelve el pixmap si ya está en la caché, o None, sin decodificar nada."""
+        key = self._key(path, width, height, aspect, transform)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def insert(self, path, image, width=None, height=None,
+               aspect=Qt.AspectRatioMode.KeepAspectRatio,
+               transform=Qt.TransformationMode.SmoothTransformation):
+        """
+        Convierte un QImage ya decodificado (y escalado) en pixmap y lo guarda.
+        Es lo único que tiene que hacer el hilo de la interfaz.
+        """
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return pixmap
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        key = self._key(path, width, height, aspect, transform)
+        if cost <= self.budget_bytes and key not in self._entries:
+            self._entries[key] = (pixmap, cost)
+            self.used_bytes += cost
+            self._evict()
+        return pixmap
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and self._entries:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self.used_bytes -= cost
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+pixmap_cache = PixmapCache(PIXMAP_CACHE_BUDGET_MB * 1024 * 1024)
+
+image_loader = ImageLoader(IMAGE_DECODE_WORKERS)
+
+def request_pixmap(owner, image_url, width, height, callback,
+                   aspect=Qt.AspectRatioMode.KeepAspectRatio,
+                   transform=Qt.TransformationMode.SmoothTransformation):
+    """
+    Entrega a callback(QPixmap) la imagen de image_url escalada (un QPixmap
+    nulo si no se pudo obtener). Si no está en
+    la caché de pixmaps, la descarga, decodificación y escalado se hacen en
+    segundo plano y el callback se descarta si owner se destruye antes.
+    """
+    if not image_url:
+        return
+    image_path = cached_image(image_url)
+    if image_path:
+        pixmap = pixmap_cache.peek(image_path, width, height, aspect, transform)
+        if pixmap is not None:
+            callback(pixmap)
+            return
+
+    def work():
+        path = image_path or download_and_cache_image(image_url)
+        image = load_scaled_image(path, width, height, aspect, transform)
+        return (path, image) if image is not None else None
+
+    def done(result):
+        if result is None:
+            callback(QPixmap())
+            return
+        path, image = result
+        callback(pixmap_cache.insert(path, image, width, height, aspect, transform))
+
+    image_loader.request(owner, work, done)
+
+# =============================================================================
+# BIBLIOTECA VIRTUALIZADA (MODELO / DELEGADO)
+# =============================================================================
+
+class LibraryListModel(QAbstractListModel):
+    """
+    Modelo de la biblioteca: las filas son los proyectos del catálogo que
+    pasan el filtro actual. Las portadas se cargan solo cuando la vista
+    pinta la fila: si no están en caché se piden al precargador, y la
+    miniatura se decodifica en image_loader, nunca durante el pintado.
+    """
+    PROJECT_ROLE = Qt.ItemDataRole.UserRole
+    COVER_TEXT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, prefetcher, parent=None):
+        super().__init__(parent)
+        self._prefetcher = prefetcher
+        self._catalog = None
+        self._matches = None  # ids que pasan el filtro (None = todos)
+        self._rows = []
+        self._row_of = {}  # {id_proyecto: fila}
+        self._failed_covers = set()
+        self._decoding = set()  # ids con la miniatura decodificándose
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        project = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return project.get("titulo", "")
+        if role == self.PROJECT_ROLE:
+            return project
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._cover(project)
+        if role == self.COVER_TEXT_ROLE:
+            if not project.get("imagen_portada") or project["id_proyecto"] in self._failed_covers:
+                return "Sin imagen"
+            return "Cargando..."
+        return None
+
+    def _cover(self, project):
+        project_id = project["id_proyecto"]
+        url = project.get("imagen_portada")
+        if not url or project_id in self._failed_covers:
+            return None
+        image_path = cached_image(url)
+        if not image_path:
+            self._prefetcher.request("cover", project_id, url)
+            return None
+        thumb_path = thumbnail_path(image_path, *CARD_IMAGE_SIZE, pad=True)
+        if thumb_path is None:
+            return None
+        pixmap = pixmap_cache.peek(thumb_path)
+        if pixmap is None and project_id not in self._decoding:
+            self._decoding.add(project_id)
+            image_loader.request(
+                self,
+                functools.partial(load_thumbnail, image_path, *CARD_IMAGE_SIZE, pad=True),
+                functools.partial(self._cover_decoded, project_id, thumb_path),
+            )
+        return pixmap
+
+    def _cover_decoded(self, project_id, thumb_path, image):
+        self._decoding.discard(project_id)
+        if image is None:
+            self._failed_covers.add(project_id)
+        else:
+            pixmap_cache.insert(thumb_path, image)
+        self._emit_row_changed(project_id)
+
+    def _visible_projects(self):
+        if not self._catalog:
+            return []
+        if self._matches is None:
+            return list(self._catalog)
+        return [p for p in self._catalog if p["id_proyecto"] in self._matches]
+
+    def _reset_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._row_of = {p["id_proyecto"]: row for row, p in enumerate(rows)}
+        self.endResetModel()
+
+    def set_catalog(self, catalog):
+        self._catalog = catalog
+        self._failed_covers.clear()
+        self._decoding.clear()
+        image_loader.cancel(self)
+        self._reset_rows(self._visible_projects())
+
+    def update_catalog(self, catalog, project_ids):
+        """Aplica un catálogo nuevo avisando solo de las filas que cambiaron."""
+        self._catalog = catalog
+        self._failed_covers -= set(project_ids)
+        rows = self._visible_projects()
+        if [p["id_proyecto"] for p in rows] != [p["id_proyecto"] for p in self._rows]:
+            self._reset_rows(rows)
+            return
+        self._rows = rows
+        for pid in project_ids:
+            self._emit_row_changed(pid)
+
+    def set_filter(self, matches):
+        self._matches = matches
+        rows = self._visible_projects()
+        if [p["id_proyecto"] for p in rows] != [p["id_proyecto"] for p in self._rows]:
+            self._reset_rows(rows)
+
+    def cover_ready(self, project_id, image_path):
+        if not image_path:
+            self._failed_covers.add(project_id)
+        self._emit_row_changed(project_id)
+
+    def _emit_row_changed(self, project_id):
+        row = self._row_of.get(project_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class GameCardDelegate(QStyledItemDelegate):
+    """Pinta cada fila de la biblioteca con el aspecto de las tarjetas de juego."""
+    CARD_HEIGHT = 150
+    MARGIN_H = 10
+    MARGIN_V = 5
+    PADDING_H = 28
+    SPACING = 18
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT + 2 * self.MARGIN_V)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(self.MARGIN_H, self.MARGIN_V, -self.MARGIN_H, -self.MARGIN_V)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        # Fondo de la tarjeta
+        painter.setPen(QPen(QColor("#89b4fa" if hover else "#45475a"), 1))
+        painter.setBrush(QColor("#45475a" if hover else "#313244"))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        # Portada
+        image_w, image_h = CARD_IMAGE_SIZE
+        image_rect = QRect(rect.left() + self.PADDING_H, rect.center().y() - image_h // 2, image_w, image_h)
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None:
+            painter.drawPixmap(image_rect, pixmap)
+        else:
+            painter.setPen(QColor("#bac2de"))
+            painter.drawText(image_rect, Qt.AlignmentFlag.AlignCenter, index.data(LibraryListModel.COVER_TEXT_ROLE))
+
+        # Título y descripción, centrados en vertical
+        project = index.data(LibraryListModel.PROJECT_ROLE)
+        text_left = image_rect.right() + 1 + self.SPACING
+        text_width = max(0, rect.right() - self.PADDING_H - text_left)
+        title_font = QFont(option.font)
+        title_font.setPixelSize(16)
+        title_font.setBold(True)
+        desc_font = QFont(option.font)
+        desc_font.setPixelSize(13)
+        title_height = QFontMetrics(title_font).height()
+        max_desc_height = rect.height() - 20 - title_height - 6
+        desc_flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+        desc_bounds = QFontMetrics(desc_font).boundingRect(
+            QRect(0, 0, text_width, max_desc_height), desc_flags, project.get("descripcion", "")
+        )
+        desc_height = min(desc_bounds.height(), max_desc_height)
+        top = rect.center().y() - (title_height + 6 + desc_height) // 2
+
+        painter.setFont(title_font)
+        painter.setPen(QColor("#cdd6f4"))
+        title = QFontMetrics(title_font).elidedText(project.get("titulo", ""), Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(QRect(text_left, top, text_width, title_height), Qt.AlignmentFlag.AlignLeft, title)
+
+        painter.setFont(desc_font)
+        painter.setPen(QColor("#bac2de"))
+        painter.drawText(QRect(text_left, top + title_height + 6, text_width, desc_height), desc_flags, project.get("descripcion", ""))
+        painter.restore()
 
 # =============================================================================
 # INTERFAZ GRÁFICA (PyQt6)
 # =============================================================================
 
 class GameLauncherApp(QMainWindow):
+    first_painted = pyqtSignal()
+
     def __init__(self, projects_data):
         super().__init__()
         self.setWindowIcon(QIcon("icon.ico"))
         self.projects_data = projects_data
+        self.catalog = ProjectCatalog(projects_data)
+        self.image_prefetcher = ImagePrefetcher()
+        self.image_prefetcher.image_ready.connect(self.on_image_prefetched)
+        self.sidebar_items = {}  # {id_proyecto: QListWidgetItem}
         self.current_project_id_in_detail_view = None
         self.currently_running_project_id = None
         self.thread = None
@@ -336,6 +1307,14 @@ class GameLauncherApp(QMainWindow):
         self.rpc = None
         self.init_discord_rpc()
         self.settings = load_settings()
+        pixmap_cache.set_budget(int(self.settings.get("pixmap_cache_mb", PIXMAP_CACHE_BUDGET_MB)) * 1024 * 1024)
+        image_cache.index.configure(
+            max_bytes=int(self.settings.get("image_cache_max_mb", IMAGE_CACHE_MAX_MB)) * 1024 * 1024,
+            max_entries=int(self.settings.get("image_cache_max_entries", IMAGE_CACHE_MAX_ENTRIES)),
+        )
+        # Juegos abiertos desde el launcher: mientras haya alguno se usa el límite "jugando"
+        self.games_running = 0
+        self.apply_bandwidth_limit()
 
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(QIcon("icon.png"))
@@ -364,7 +1343,12 @@ class GameLauncherApp(QMainWindow):
         self.btn_friends.setObjectName("navbarButton")
         self.btn_friends.clicked.connect(self.show_friends)
 
+        self.btn_downloads = QPushButton("Descargas")
+        self.btn_downloads.setObjectName("navbarButton")
+        self.btn_downloads.clicked.connect(self.show_downloads)
+
         navbar_layout.addWidget(self.btn_library)
+        navbar_layout.addWidget(self.btn_downloads)
         navbar_layout.addWidget(self.btn_settings)
         navbar_layout.addWidget(self.btn_about)
         navbar_layout.addWidget(self.btn_friends)
@@ -401,12 +1385,9 @@ class GameLauncherApp(QMainWindow):
         self.user_btn.clicked.connect(self.show_account_details)
         username, avatar_url = load_user_info()
         if avatar_url:
-            # Descarga el avatar si es necesario
-            avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-            if avatar_path and os.path.exists(avatar_path):
-                pixmap = QPixmap(avatar_path).scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.user_btn.setIcon(QIcon(pixmap))
-                self.user_btn.setIconSize(QSize(32, 32))
+            # El avatar se descarga y escala en segundo plano
+            self.user_btn.setIconSize(QSize(32, 32))
+            request_pixmap(self.user_btn, avatar_url, 32, 32, lambda pixmap: self.user_btn.setIcon(QIcon(pixmap)))
         if username:
             self.user_btn.setText(f"  {username}")
         navbar_layout.addWidget(self.user_btn, alignment=Qt.AlignmentFlag.AlignRight)
@@ -421,13 +1402,22 @@ class GameLauncherApp(QMainWindow):
 
         self.stacked_widget = QStackedWidget()
 
+        # Para descargas activas
+        self.active_downloads = {}  # {id_proyecto: {"thread": QThread, "worker": DownloadWorker, "progress": int, "error": str, "exe_path": str, "status": str, "library": str, "update": bool, "project_data": dict}}
+        # Instalaciones en espera; arranca las siguientes cuando queda un hueco
+        self.download_queue = DownloadQueue(int(self.settings.get("max_concurrent_downloads", MAX_CONCURRENT_DOWNLOADS)))
+        self.download_queue.start_requested.connect(self._launch_download)
+
         # Páginas principales
         self.library_page = self._create_library_page()
         self.details_page = self._create_details_page()
         self.settings_page = self._create_settings_page()
         self.about_page = self._create_about_page()
         self.friends_page = self._create_friends_page()
+        self.downloads_page = self._create_downloads_page()
+        self.download_queue.changed.connect(self.refresh_downloads_page)
         self.stacked_widget.addWidget(self.friends_page)
+        self.stacked_widget.addWidget(self.downloads_page)
         self.stacked_widget.addWidget(self.library_page)
         self.stacked_widget.addWidget(self.details_page)
         self.stacked_widget.addWidget(self.settings_page)
@@ -450,43 +1440,115 @@ class GameLauncherApp(QMainWindow):
 
         self.setCentralWidget(central_widget)
 
-        # Para descargas activas
-        self.active_downloads = {}  # {id_proyecto: {"thread": QThread, "worker": DownloadWorker, "progress": int, "error": str, "exe_path": str}}
-
         self.setWindowTitle("Tradu-Launcher")
         self.setGeometry(100, 100, 1100, 700)
 
-
-        # Crear y añadir las dos vistas principales
-        self.library_page = self._create_library_page()
-        self.details_page = self._create_details_page()
-        self.stacked_widget.addWidget(self.library_page)
-        self.stacked_widget.addWidget(self.details_page)
-
         # Inicialmente, mostrar la biblioteca
         self.stacked_widget.setCurrentWidget(self.library_page)
 
         self.populate_sidebar()
 
-        # Renderizar la biblioteca con los proyectos
-        if self.projects_data and self.projects_data.get("proyectos"):
-            for project in self.projects_data["proyectos"]:
-                self._add_project_to_library(project)
-        else:
-            no_projects_label = QLabel("No se pudieron cargar los proyectos.")
-            self.library_layout.addWidget(no_projects_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        # Renderizar la biblioteca con los proyectos (del cache, si lo hay)
+        self.catalog_thread = None
+        self.catalog_worker = None
+        self.render_library("Cargando proyectos...")
+
+        # Estado en línea, actualizaciones y version.txt esperan al primer pintado
+        self.startup_thread = None
+        self.startup_worker = None
+        self._first_paint_done = False
+        self.first_painted.connect(self.start_startup_tasks)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            self.first_painted.emit()
+
+    def start_startup_tasks(self):
+        """Lo que el arranque no necesita para pintar: la red va a un hilo aparte."""
+        self.startup_thread = QThread()
+        self.startup_worker = StartupWorker(self.get_current_version())
+        self.startup_worker.moveToThread(self.startup_thread)
+        self.startup_thread.started.connect(self.startup_worker.run)
+        self.startup_worker.update_available.connect(self.offer_update)
+        self.startup_worker.finished.connect(self.startup_thread.quit)
+        self.startup_thread.finished.connect(self.startup_worker.deleteLater)
+        self.startup_thread.finished.connect(self.startup_thread.deleteLater)
+        self.startup_thread.finished.connect(self._on_startup_thread_finished)
+        self.startup_thread.start()
+        # Solo toca el disco, pero con varias bibliotecas no debe retrasar el pintado
+        QTimer.singleShot(0, self.migrate_installed_games_versions)
+
+    def _on_startup_thread_finished(self):
+        self.startup_thread = None
+        self.startup_worker = None
+
+    def render_library(self, empty_message="No se pudieron cargar los proyectos."):
+        """Carga el catálogo completo en el modelo de la biblioteca."""
+        self.library_model.set_catalog(self.catalog)
+        self.library_message.setText(empty_message)
+        self.library_message.setVisible(not self.catalog)
+        self.apply_library_filter()
+
+    def start_catalog_refresh(self):
+        """Revalida el catálogo en segundo plano (stale-while-revalidate)."""
+        if self.catalog_thread is not None:
+            return
+        self.catalog_thread = QThread()
+        self.catalog_worker = CatalogRefreshWorker()
+        self.catalog_worker.moveToThread(self.catalog_thread)
+        self.catalog_thread.started.connect(self.catalog_worker.run)
+        self.catalog_worker.finished.connect(self.on_catalog_refreshed)
+        self.catalog_worker.finished.connect(self.catalog_thread.quit)
+        self.catalog_worker.finished.connect(self.catalog_worker.deleteLater)
+        self.catalog_thread.finished.connect(self.catalog_thread.deleteLater)
+        self.catalog_thread.finished.connect(self._on_catalog_thread_finished)
+        self.catalog_thread.start()
+
+    def _on_catalog_thread_finished(self):
+        # Las referencias se sueltan cuando el hilo ya terminó: si Python
+        # recoge un QThread que sigue corriendo, Qt aborta el proceso
+        self.catalog_thread = None
+        self.catalog_worker = None
+
+    def on_catalog_refreshed(self, projects_data):
+        if not projects_data:
+            # Sin red: se queda el catálogo del cache
+            if not self.projects_data:
+                self.render_library()
+            return
+        if projects_data == self.projects_data:
+            return
+        self.apply_projects_data(projects_data)
 
-        # Buscar actualizaciones
-        self.check_for_updates()
+    def apply_projects_data(self, projects_data):
+        """
+        Aplica un catálogo nuevo a la biblioteca, la barra lateral y los detalles.
+        Solo se tocan las tarjetas y filas de los proyectos que cambiaron.
+        """
+        had_projects = bool(self.catalog)
+        self.projects_data = projects_data
+        self.catalog, added, changed, removed = self.catalog.updated(projects_data)
+        affected = added | changed | removed
+        print(f"Catálogo actualizado: {len(added)} nuevos, {len(changed)} modificados, {len(removed)} eliminados.")
+        if not had_projects or not self.catalog:
+            self.render_library()
+        else:
+            self.library_model.update_catalog(self.catalog, affected)
+            self.apply_library_filter()
         self.migrate_installed_games_versions()
-        self.update_my_status("Conectado")
-
+        self.update_sidebar_rows(affected)
+        current_pid = self.current_project_id_in_detail_view
+        if self.stacked_widget.currentWidget() is self.details_page and current_pid in affected:
+            project = self.catalog.get(current_pid)
+            if project:
+                self.show_project_details(project)
+            else:
+                self.show_library()
 
     def update_my_status(self, status, game=None):
-        data = {"status": status}
-        if game:
-            data["game"] = game
-        self.api_post("https://traduction-club.live/api/friends/status/", data)
+        post_user_status(status, game)
 
     def show_friends_window(self):
         friends = self.api_get("https://traduction-club.live/api/friends/list/")
@@ -501,6 +1563,8 @@ class GameLauncherApp(QMainWindow):
         dlg.exec()
 
     def refresh_friends_page(self):
+        image_loader.cancel(self.friends_requests_received)
+        image_loader.cancel(self.friends_requests_sent)
         self.friends_requests_received.clear()
         self.friends_requests_sent.clear()
 
@@ -511,9 +1575,7 @@ class GameLauncherApp(QMainWindow):
                 item = QListWidgetItem(username)
                 avatar_url = req["from_user"].get("avatar_url")
                 if avatar_url:
-                    avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-                    if avatar_path and os.path.exists(avatar_path):
-                        item.setIcon(QIcon(QPixmap(avatar_path).scaled(32, 32)))
+                    self._request_item_avatar(self.friends_requests_received, item, avatar_url)
                 accept_btn = QPushButton("Aceptar")
                 reject_btn = QPushButton("Rechazar")
                 accept_btn.clicked.connect(functools.partial(self.respond_request, req["id"], "accept"))
@@ -530,21 +1592,20 @@ class GameLauncherApp(QMainWindow):
                 item = QListWidgetItem(f"{username} (pendiente)")
                 avatar_url = req["to_user"].get("avatar_url")
                 if avatar_url:
-                    avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-                    if avatar_path and os.path.exists(avatar_path):
-                        item.setIcon(QIcon(QPixmap(avatar_path).scaled(32, 32)))
+                    self._request_item_avatar(self.friends_requests_sent, item, avatar_url)
                 self.friends_requests_sent.addItem(item)
     
     
 
     def api_get(self, url, params=None):
+        # Desde el hilo de la interfaz: sin reintentos, un fallo no puede congelar la ventana
         try:
             headers = get_auth_headers()
-            r = requests.get(url, headers=headers, params=params, timeout=10)
+            r = client.get(url, headers=headers, params=params, timeout=10, retries=0)
             if r.status_code == 401:
                 if refresh_access_token():
                     headers = get_auth_headers()
-                    r = requests.get(url, headers=headers, params=params, timeout=10)
+                    r = client.get(url, headers=headers, params=params, timeout=10, retries=0)
             r.raise_for_status()
             return r.json()
         except Exception as e:
@@ -552,20 +1613,10 @@ class GameLauncherApp(QMainWindow):
             return None
 
     def api_post(self, url, data=None):
-        try:
-            headers = get_auth_headers()
-            r = requests.post(url, headers=headers, json=data, timeout=10)
-            if r.status_code == 401:
-                if refresh_access_token():
-                    headers = get_auth_headers()
-                    r = requests.post(url, headers=headers, json=data, timeout=10)
-            r.raise_for_status()
-            return r.json()
-        except Exception as e:
-            print(f"API POST error: {e}")
-            return None
+        return api_post(url, data)
 
     def refresh_friends_page(self):
+        image_loader.cancel(self.friends_requests_sent)
         self.friends_requests_received.clear()
         self.friends_requests_sent.clear()
 
@@ -583,10 +1634,7 @@ class GameLauncherApp(QMainWindow):
                 # Avatar
                 avatar_label = QLabel()
                 if avatar_url:
-                    avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-                    if avatar_path and os.path.exists(avatar_path):
-                        pixmap = QPixmap(avatar_path).scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        avatar_label.setPixmap(pixmap)
+                    request_pixmap(avatar_label, avatar_url, 32, 32, avatar_label.setPixmap)
                 avatar_label.setFixedSize(36, 36)
                 layout.addWidget(avatar_label)
 
@@ -618,9 +1666,7 @@ class GameLauncherApp(QMainWindow):
                 avatar_url = req["to_user"].get("avatar_url")
                 item = QListWidgetItem(f"{username} (pendiente)")
                 if avatar_url:
-                    avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-                    if avatar_path and os.path.exists(avatar_path):
-                        item.setIcon(QIcon(QPixmap(avatar_path).scaled(32, 32)))
+                    self._request_item_avatar(self.friends_requests_sent, item, avatar_url)
                 self.friends_requests_sent.addItem(item)
 
     def search_users(self):
@@ -651,10 +1697,7 @@ class GameLauncherApp(QMainWindow):
             avatar_label = QLabel()
             avatar_url = user.get("avatar_url")
             if avatar_url:
-                avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-                if avatar_path and os.path.exists(avatar_path):
-                    pixmap = QPixmap(avatar_path).scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    avatar_label.setPixmap(pixmap)
+                request_pixmap(avatar_label, avatar_url, 32, 32, avatar_label.setPixmap)
             avatar_label.setFixedSize(36, 36)
             layout.addWidget(avatar_label)
 
@@ -736,21 +1779,109 @@ class GameLauncherApp(QMainWindow):
     def show_friends(self):
         self.refresh_friends_page()
         self.stacked_widget.setCurrentWidget(self.friends_page)
+
+    def _create_downloads_page(self):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(32, 32, 32, 32)
+        layout.setSpacing(16)
+
+        title = QLabel("Descargas")
+        title.setStyleSheet("font-size: 26px; font-weight: bold; color: #cdd6f4;")
+        layout.addWidget(title)
+
+        self.downloads_list = QListWidget()
+        self.downloads_list.setStyleSheet("background: #232634; color: #cdd6f4; border-radius: 6px; font-size: 15px;")
+        layout.addWidget(self.downloads_list)
+        self._download_row_labels = {}  # {id_proyecto: QLabel de estado}
+        return page
+
+    def show_downloads(self):
+        self.refresh_downloads_page()
+        self.stacked_widget.setCurrentWidget(self.downloads_page)
+
+    def _download_row_status(self, project_id):
+        active = self.active_downloads.get(project_id)
+        if active:
+            return f"{active.get('status', 'Descargando...')} {active.get('progress', 0)}% {self._download_speed_text(project_id)}".rstrip()
+        entry = self.download_queue.get(project_id)
+        if entry and entry["paused"]:
+            return "En pausa"
+        return f"En cola ({self.download_queue.position(project_id)}º)"
+
+    def refresh_downloads_page(self):
+        """Reconstruye el panel: primero las descargas en curso y después la cola."""
+        if not hasattr(self, "downloads_list"):
+            return
+        self.downloads_list.clear()
+        self._download_row_labels = {}
+        rows = [(pid, active["project_data"], None) for pid, active in self.active_downloads.items()]
+        rows += [(entry["project_id"], entry["project_data"], entry) for entry in self.download_queue.entries()]
+        if not rows:
+            self.downloads_list.addItem(QListWidgetItem("No hay descargas en curso ni en cola."))
+            return
+        button_style = "background: #45475a; color: #cdd6f4; border-radius: 8px; padding: 6px 10px; font-weight: bold;"
+        for project_id, project_data, entry in rows:
+            widget = QWidget()
+            row_layout = QHBoxLayout(widget)
+            row_layout.setContentsMargins(6, 4, 6, 4)
+            row_layout.setSpacing(10)
+
+            name_label = QLabel(project_data.get("titulo", project_id))
+            name_label.setStyleSheet("font-size: 15px; font-weight: bold; color: #cdd6f4;")
+            row_layout.addWidget(name_label, stretch=1)
+            status_label = QLabel(self._download_row_status(project_id))
+            status_label.setStyleSheet("font-size: 14px; color: #a6adc8;")
+            row_layout.addWidget(status_label)
+            self._download_row_labels[project_id] = status_label
+
+            def add_button(text, slot, style=button_style):
+                button = QPushButton(text)
+                button.setStyleSheet(style)
+                button.clicked.connect(slot)
+                row_layout.addWidget(button)
+
+            if entry is not None:
+                add_button("▲", functools.partial(self.download_queue.move, project_id, -1))
+                add_button("▼", functools.partial(self.download_queue.move, project_id, 1))
+                add_button("Jugar a continuación", functools.partial(self.download_queue.play_next, project_id))
+                if entry["paused"]:
+                    add_button("Reanudar", functools.partial(self.resume_download, project_id))
+                else:
+                    add_button("Pausar", functools.partial(self.download_queue.pause, project_id))
+            elif self.active_downloads[project_id].get("status") not in ("Extrayendo...", "Pausando...", "Cancelando..."):
+                add_button("Pausar", functools.partial(self.pause_download, project_id))
+            if entry is not None or not self.active_downloads[project_id].get("cancelled"):
+                add_button(
+                    "Cancelar", functools.partial(self.cancel_download, project_id),
+                    "background: #f38ba8; color: #fff; border-radius: 8px; padding: 6px 10px; font-weight: bold;"
+                )
+
+            item = QListWidgetItem()
+            item.setSizeHint(widget.sizeHint())
+            self.downloads_list.addItem(item)
+            self.downloads_list.setItemWidget(item, widget)
+
+    def _update_download_row(self, project_id):
+        label = getattr(self, "_download_row_labels", {}).get(project_id)
+        if label is not None:
+            label.setText(self._download_row_status(project_id))
     
     def migrate_installed_games_versions(self):
         """
         Para cada juego instalado, si existe el ejecutable pero NO el version.txt,
         se pone el version.txt con la version del JSON.
         """
-        if not self.projects_data or not self.projects_data.get("proyectos"):
+        if not self.catalog:
             return
-        for project in self.projects_data["proyectos"]:
+        libraries = load_libraries()
+        for project in self.catalog:
             project_id = project.get("id_proyecto")
             exe_name = project.get("nombre_ejecutable")
             version = project.get("version")
             if not project_id or not exe_name or not version:
                 continue
-            for library in load_libraries():
+            for library in libraries:
                 exe_path = os.path.join(library, project_id, exe_name)
                 version_file = os.path.join(library, project_id, "version.txt")
                 if os.path.exists(exe_path) and not os.path.exists(version_file):
@@ -758,6 +1889,7 @@ class GameLauncherApp(QMainWindow):
                         with open(version_file, "w", encoding="utf-8") as f:
                             f.write(str(version))
                         print(f"[DEBUG] Escrito version.txt para {project_id} en {version_file}")
+                        self.catalog.refresh_project(project_id, libraries)
                     except Exception as e:
                         print(f"[DEBUG] Error escribiendo version.txt para {project_id}: {e}")
 
@@ -767,12 +1899,10 @@ class GameLauncherApp(QMainWindow):
         dialog.setWindowTitle("Detalles de la cuenta")
         layout = QVBoxLayout(dialog)
         if avatar_url:
-            avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-            if avatar_path and os.path.exists(avatar_path):
-                avatar_label = QLabel()
-                avatar_label.setPixmap(QPixmap(avatar_path).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                avatar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                layout.addWidget(avatar_label)
+            avatar_label = QLabel()
+            avatar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(avatar_label)
+            request_pixmap(avatar_label, avatar_url, 64, 64, avatar_label.setPixmap)
         layout.addWidget(QLabel(f"<b>Usuario:</b> {username}"))
         close_btn = QPushButton("Cerrar")
         close_btn.clicked.connect(dialog.accept)
@@ -787,20 +1917,10 @@ class GameLauncherApp(QMainWindow):
         os.execl(python, python, *sys.argv)
     
     def check_for_updates(self, show_dialogs=False):
-        UPDATE_INFO_URL = "https://traduction-club.live/api/winapp/launcher_update.json"
         try:
-            info = requests.get(UPDATE_INFO_URL, timeout=10).json()
-            latest_version = info["version"]
-            download_url = info["installer_url"]
+            latest_version, download_url = fetch_launcher_update_info()
             if latest_version > self.get_current_version():
-                reply = QMessageBox.question(
-                    self,
-                    "Actualización disponible",
-                    f"Hay una nueva versión ({latest_version}). ¿Actualizar ahora?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    self.download_and_run_installer(download_url)
+                self.offer_update(latest_version, download_url)
             else:
                 if show_dialogs:
                     QMessageBox.information(
@@ -816,6 +1936,16 @@ class GameLauncherApp(QMainWindow):
                     f"No se pudo buscar actualizaciones: {e}"
                 )
 
+    def offer_update(self, latest_version, download_url):
+        reply = QMessageBox.question(
+            self,
+            "Actualización disponible",
+            f"Hay una nueva versión ({latest_version}). ¿Actualizar ahora?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.download_and_run_installer(download_url)
+
     def get_current_version(self):
         return "1.0"
 
@@ -831,11 +1961,13 @@ class GameLauncherApp(QMainWindow):
         dialog.show()
         QApplication.processEvents()
         try:
-            with requests.get(url, stream=True) as r:
+            with client.get(url, stream=True, retries=0) as r:
                 r.raise_for_status()
                 total = int(r.headers.get("content-length", 0))
                 downloaded = 0
                 with open(installer_path, "wb") as f:
+                    # Sin límite de ancho de banda: esto corre en el hilo de la
+                    # interfaz y consume() lo bloquearía
                     for chunk in r.iter_content(chunk_size=8192):
                         if chunk:
                             f.write(chunk)
@@ -861,6 +1993,25 @@ class GameLauncherApp(QMainWindow):
     def show_settings(self):
         self.stacked_widget.setCurrentWidget(self.settings_page)
 
+    def apply_bandwidth_limit(self):
+        """Aplica el límite global de descarga según haya o no un juego abierto."""
+        limit = int(self.settings.get("bandwidth_limit_kbps", BANDWIDTH_LIMIT_KBPS))
+        if self.games_running:
+            playing = int(self.settings.get("bandwidth_limit_playing_kbps", BANDWIDTH_PLAYING_KBPS))
+            # El límite al jugar nunca sube por encima del normal
+            limit = min(limit, playing) if limit and playing else (limit or playing)
+        if bandwidth.rate != limit * 1024:
+            bandwidth.set_rate(limit * 1024)
+            print(f"Límite de descarga: {f'{limit} KB/s' if limit else 'sin límite'}.")
+
+    def on_game_started(self):
+        self.games_running += 1
+        self.apply_bandwidth_limit()
+
+    def on_game_stopped(self):
+        self.games_running = max(0, self.games_running - 1)
+        self.apply_bandwidth_limit()
+
     def show_about(self):
         self.stacked_widget.setCurrentWidget(self.about_page)
 
@@ -924,6 +2075,7 @@ class GameLauncherApp(QMainWindow):
                 libraries = [lib for lib in libraries if lib != library_path]
                 save_libraries(libraries)
                 self.update_libraries_list()
+                self.catalog.refresh_install_state(libraries)
                 self.populate_sidebar()  # Actualiza la barra lateral
                 QMessageBox.information(self, "Biblioteca eliminada", "Biblioteca y juegos eliminados correctamente.")
         remove_btn.clicked.connect(remove_selected_library)
@@ -953,7 +2105,6 @@ class GameLauncherApp(QMainWindow):
         layout.addWidget(renpy_group)
 
         # --- Overlay toggle ---
-        from PyQt6.QtWidgets import QCheckBox
         overlay_checkbox = QCheckBox("Activar overlay en los juegos (solo funciona en juegos con modo ventana)")
         overlay_checkbox.setChecked(self.settings.get("overlay_enabled", True))
         overlay_checkbox.setStyleSheet("font-size: 16px; color: #cdd6f4;")
@@ -963,6 +2114,71 @@ class GameLauncherApp(QMainWindow):
         overlay_checkbox.stateChanged.connect(on_overlay_toggle)
         layout.addWidget(overlay_checkbox)
 
+        # --- Descargas con varias conexiones ---
+        segmented_checkbox = QCheckBox("Descargar los juegos con varias conexiones (más rápido en conexiones lejanas)")
+        segmented_checkbox.setChecked(self.settings.get("segmented_downloads", False))
+        segmented_checkbox.setStyleSheet("font-size: 16px; color: #cdd6f4;")
+        def on_segmented_toggle(state):
+            self.settings["segmented_downloads"] = bool(state)
+            save_settings(self.settings)
+        segmented_checkbox.stateChanged.connect(on_segmented_toggle)
+        layout.addWidget(segmented_checkbox)
+
+        # --- Instalar extrayendo mientras se descarga ---
+        stream_checkbox = QCheckBox("Instalar mientras se descarga (no guarda el zip, necesita la mitad de espacio)")
+        stream_checkbox.setChecked(self.settings.get("stream_install", False))
+        stream_checkbox.setStyleSheet("font-size: 16px; color: #cdd6f4;")
+        def on_stream_toggle(state):
+            self.settings["stream_install"] = bool(state)
+            save_settings(self.settings)
+        stream_checkbox.stateChanged.connect(on_stream_toggle)
+        layout.addWidget(stream_checkbox)
+
+        # --- Descargas simultáneas ---
+        concurrent_widget = QWidget()
+        concurrent_layout = QHBoxLayout(concurrent_widget)
+        concurrent_layout.setContentsMargins(0, 0, 0, 0)
+        concurrent_label = QLabel("Descargas simultáneas (las demás esperan en la cola):")
+        concurrent_label.setStyleSheet("font-size: 16px; color: #cdd6f4;")
+        concurrent_spin = QSpinBox()
+        concurrent_spin.setRange(1, 8)
+        concurrent_spin.setValue(self.download_queue.max_active)
+        concurrent_spin.setStyleSheet("background: #232634; color: #cdd6f4; border-radius: 6px; font-size: 15px; padding: 4px;")
+        def on_concurrent_changed(value):
+            self.settings["max_concurrent_downloads"] = value
+            save_settings(self.settings)
+            self.download_queue.set_max_active(value)
+        concurrent_spin.valueChanged.connect(on_concurrent_changed)
+        concurrent_layout.addWidget(concurrent_label)
+        concurrent_layout.addWidget(concurrent_spin)
+        concurrent_layout.addStretch()
+        layout.addWidget(concurrent_widget)
+
+        # --- Límite de ancho de banda (normal y mientras se juega) ---
+        for key, default, text in (
+            ("bandwidth_limit_kbps", BANDWIDTH_LIMIT_KBPS, "Límite de descarga en KB/s (0 = sin límite):"),
+            ("bandwidth_limit_playing_kbps", BANDWIDTH_PLAYING_KBPS, "Límite mientras juegas en KB/s (0 = sin límite):"),
+        ):
+            limit_widget = QWidget()
+            limit_layout = QHBoxLayout(limit_widget)
+            limit_layout.setContentsMargins(0, 0, 0, 0)
+            limit_label = QLabel(text)
+            limit_label.setStyleSheet("font-size: 16px; color: #cdd6f4;")
+            limit_spin = QSpinBox()
+            limit_spin.setRange(0, 1000000)
+            limit_spin.setSingleStep(128)
+            limit_spin.setValue(int(self.settings.get(key, default)))
+            limit_spin.setStyleSheet("background: #232634; color: #cdd6f4; border-radius: 6px; font-size: 15px; padding: 4px;")
+            def on_limit_changed(value, key=key):
+                self.settings[key] = value
+                save_settings(self.settings)
+                self.apply_bandwidth_limit()
+            limit_spin.valueChanged.connect(on_limit_changed)
+            limit_layout.addWidget(limit_label)
+            limit_layout.addWidget(limit_spin)
+            limit_layout.addStretch()
+            layout.addWidget(limit_widget)
+
         # --- Botón para buscar actualizaciones ---
         update_btn = QPushButton("Buscar actualizaciones")
         update_btn.setObjectName("updateButton")
@@ -1017,20 +2233,56 @@ class GameLauncherApp(QMainWindow):
             print(f"Error al conectar con Discord RPC: {e}")
     
     def populate_sidebar(self):
+        image_loader.cancel(self.sidebar)
         self.sidebar.clear()
-        if not self.projects_data or not self.projects_data.get("proyectos"):
-            return
-        for project in self.projects_data["proyectos"]:
-            exe_path = self.check_if_game_installed(project)
-            if exe_path:
-                item = QListWidgetItem(project["titulo"])
-                item.setData(Qt.ItemDataRole.UserRole, project["id_proyecto"])
-                icon_path = None
-                if project.get("icon"):
-                    icon_path = download_and_cache_image(project["icon"], project["id_proyecto"] + "_icon")
-                if icon_path and os.path.exists(icon_path):
-                    item.setIcon(QIcon(icon_path))
-                self.sidebar.addItem(item)
+        self.sidebar_items = {}
+        for project in self.catalog.installed_projects():
+            self.sidebar.addItem(self._create_sidebar_item(project))
+        self.update_sidebar_highlight()
+
+    def _create_sidebar_item(self, project):
+        item = QListWidgetItem(project["titulo"])
+        item.setData(Qt.ItemDataRole.UserRole, project["id_proyecto"])
+        if project.get("icon"):
+            if cached_image(project["icon"]):
+                self._request_sidebar_icon(item, project["icon"])
+            else:
+                # El icono llega después por on_image_prefetched
+                self.image_prefetcher.request("icon", project["id_proyecto"], project["icon"])
+        self.sidebar_items[project["id_proyecto"]] = item
+        return item
+
+    def on_image_prefetched(self, kind, project_id, image_path):
+        """Avisa al modelo de la biblioteca o coloca el icono en la barra lateral."""
+        if kind == "cover":
+            self.library_model.cover_ready(project_id, image_path)
+        elif kind == "icon" and image_path:
+            item = self.sidebar_items.get(project_id)
+            project = self.catalog.get(project_id)
+            if item is not None and project:
+                self._request_sidebar_icon(item, project["icon"])
+
+    def _request_sidebar_icon(self, item, icon_url):
+        request_pixmap(self.sidebar, icon_url, None, None, lambda pixmap: item.setIcon(QIcon(pixmap)))
+
+    def _request_item_avatar(self, list_widget, item, avatar_url):
+        """Avatar de una fila de lista; se cancela con image_loader.cancel(list_widget) antes de vaciarla."""
+        request_pixmap(
+            list_widget, avatar_url, 32, 32, lambda pixmap: item.setIcon(QIcon(pixmap)),
+            Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation
+        )
+
+    def update_sidebar_rows(self, project_ids):
+        """Actualiza solo las filas de la barra lateral de los proyectos indicados."""
+        for pid in project_ids:
+            item = self.sidebar_items.pop(pid, None)
+            if item is not None:
+                self.sidebar.takeItem(self.sidebar.row(item))
+        row = 0
+        for project in self.catalog.installed_projects():
+            if project["id_proyecto"] in project_ids:
+                self.sidebar.insertItem(row, self._create_sidebar_item(project))
+            row += 1
         self.update_sidebar_highlight()
 
     def update_sidebar_highlight(self):
@@ -1050,22 +2302,18 @@ class GameLauncherApp(QMainWindow):
 
     def on_sidebar_item_clicked(self, item):
         pid = item.data(Qt.ItemDataRole.UserRole)
-        for project in self.projects_data["proyectos"]:
-            if project["id_proyecto"] == pid:
-                self.show_project_details(project)
-                self.update_sidebar_highlight()
-                break
+        project = self.catalog.get(pid)
+        if project:
+            self.show_project_details(project)
+            self.update_sidebar_highlight()
 
     def on_sidebar_item_double_clicked(self, item):
         pid = item.data(Qt.ItemDataRole.UserRole)
-        for project in self.projects_data["proyectos"]:
-            if project["id_proyecto"] == pid:
-                exe_path = self.check_if_game_installed(project)
-                if exe_path:
-                    self.currently_running_project_id = pid
-                    self.launch_game(exe_path)
-                    self.update_sidebar_highlight()
-                break
+        exe_path = self.catalog.exe_path(pid)
+        if exe_path:
+            self.currently_running_project_id = pid
+            self.launch_game(exe_path)
+            self.update_sidebar_highlight()
 
     def on_game_process_finished(self):
         self.currently_running_project_id = None
@@ -1091,6 +2339,9 @@ class GameLauncherApp(QMainWindow):
                 break
         if removed:
             QMessageBox.information(self, "Desinstalado", "Juego desinstalado correctamente.")
+        self.catalog.refresh_project(project_id)
+        # Los filtros "Instalados" / "Con actualización" dependen de este estado
+        self.apply_library_filter()
         self.show_project_details(project_data)
         self.populate_sidebar()
 
@@ -1104,79 +2355,63 @@ class GameLauncherApp(QMainWindow):
         title.setObjectName("pageTitle") # Para QSS
         layout.addWidget(title)
 
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        self.scroll_content = QWidget()
-        self.library_layout = QVBoxLayout(self.scroll_content)
-        self.library_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        scroll_area.setWidget(self.scroll_content)
-        layout.addWidget(scroll_area)
+        # Buscador y filtros
+        search_widget = QWidget()
+        search_layout = QHBoxLayout(search_widget)
+        search_layout.setContentsMargins(10, 0, 10, 0)
+        search_layout.setSpacing(12)
+        self.library_search_input = QLineEdit()
+        self.library_search_input.setObjectName("librarySearch")
+        self.library_search_input.setPlaceholderText("Buscar por título o descripción...")
+        self.library_search_input.setClearButtonEnabled(True)
+        self.library_search_input.textChanged.connect(self.apply_library_filter)
+        self.library_installed_filter = QCheckBox("Instalados")
+        self.library_installed_filter.stateChanged.connect(self.apply_library_filter)
+        self.library_update_filter = QCheckBox("Con actualización")
+        self.library_update_filter.stateChanged.connect(self.apply_library_filter)
+        search_layout.addWidget(self.library_search_input, stretch=1)
+        search_layout.addWidget(self.library_installed_filter)
+        search_layout.addWidget(self.library_update_filter)
+        layout.addWidget(search_widget)
+
+        self.library_no_results = QLabel("Ningún proyecto coincide con la búsqueda.")
+        self.library_no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.library_no_results.setVisible(False)
+        layout.addWidget(self.library_no_results)
+
+        self.library_message = QLabel("")
+        self.library_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.library_message.setVisible(False)
+        layout.addWidget(self.library_message)
+
+        # Lista virtualizada: solo se pintan las filas visibles
+        self.library_model = LibraryListModel(self.image_prefetcher, self)
+        self.library_view = QListView()
+        self.library_view.setObjectName("libraryList")
+        self.library_view.setModel(self.library_model)
+        self.library_view.setItemDelegate(GameCardDelegate(self.library_view))
+        self.library_view.setUniformItemSizes(True)
+        self.library_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.library_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.library_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.library_view.setMouseTracking(True)
+        self.library_view.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.library_view.clicked.connect(
+            lambda index: self.show_project_details(index.data(LibraryListModel.PROJECT_ROLE))
+        )
+        layout.addWidget(self.library_view)
         
         return page
 
-    def _add_project_to_library(self, project_data):
-        project_id = project_data['id_proyecto']
-        image_path = download_and_cache_image(project_data['imagen_portada'], project_id)
-
-        item_frame = QPushButton()
-        item_frame.setObjectName("gameCard")
-        item_frame.setMinimumHeight(150)
-        item_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        item_frame.clicked.connect(lambda: self.show_project_details(project_data))
-
-        item_layout = QHBoxLayout(item_frame)
-        item_layout.setContentsMargins(18, 10, 18, 10)
-        item_layout.setSpacing(18)
-
-        # Imagen
-        image_label = QLabel()
-        image_label.setFixedSize(192, 108)
-        image_label.setObjectName("gameImage")
-        image_label.setStyleSheet("background: transparent;")
-
-        if image_path:
-            pixmap = QPixmap(image_path)
-            target_size = image_label.size()
-            transparent_pixmap = QPixmap(target_size)
-            transparent_pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(transparent_pixmap)
-            scaled_pixmap = pixmap.scaled(
-                target_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            x = (target_size.width() - scaled_pixmap.width()) // 2
-            y = (target_size.height() - scaled_pixmap.height()) // 2
-            painter.drawPixmap(x, y, scaled_pixmap)
-            painter.end()
-            image_label.setPixmap(transparent_pixmap)
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Contenedor para el texto
-        text_container = QWidget()
-        text_layout = QVBoxLayout(text_container)
-        text_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-
-        title_label = QLabel(project_data['titulo'])
-        title_label.setObjectName("gameTitle")
-
-        desc_label = QLabel(project_data['descripcion'])
-        desc_label.setWordWrap(True)
-        desc_label.setObjectName("gameDescription")
-        desc_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        desc_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        # desc_label.setMaximumHeight(60)
-
-        text_layout.addWidget(title_label)
-        text_layout.addWidget(desc_label)
-
-        item_layout.addWidget(image_label)
-        item_layout.addWidget(text_container, stretch=1)
-
-        self.library_layout.addWidget(item_frame)
+    def apply_library_filter(self):
+        """Filtra las filas del modelo según la búsqueda y los filtros."""
+        matches = self.catalog.search(
+            self.library_search_input.text(),
+            installed_only=self.library_installed_filter.isChecked(),
+            update_only=self.library_update_filter.isChecked(),
+        )
+        self.library_model.set_filter(matches)
+        self.library_no_results.setVisible(bool(self.catalog) and self.library_model.rowCount() == 0)
 
     def _create_details_page(self):
         # --- HEADER: Botón Volver ---
@@ -1204,7 +2439,7 @@ class GameLauncherApp(QMainWindow):
         self.detail_title = QLabel("Título")
         self.detail_title.setObjectName("detailTitle")
         self.detail_image = QLabel()
-        self.detail_image.setFixedSize(640, 360)
+        self.detail_image.setFixedSize(*DETAIL_IMAGE_SIZE)
         self.detail_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.detail_desc = QLabel("Descripción...")
         self.detail_desc.setWordWrap(True)
@@ -1255,10 +2490,14 @@ class GameLauncherApp(QMainWindow):
         self.cancel_button = QPushButton("Cancelar")
         self.cancel_button.setObjectName("cancelButton")
         self.cancel_button.setVisible(False)
+        self.pause_button = QPushButton("Pausar")
+        self.pause_button.setObjectName("pauseButton")
+        self.pause_button.setVisible(False)
         self.uninstall_button = QPushButton("Desinstalar")
         self.uninstall_button.setObjectName("uninstallButton")
         self.uninstall_button.setVisible(False)
         buttons_layout.addWidget(self.install_button)
+        buttons_layout.addWidget(self.pause_button)
         buttons_layout.addWidget(self.cancel_button)
         buttons_layout.addWidget(self.uninstall_button)
 
@@ -1277,16 +2516,7 @@ class GameLauncherApp(QMainWindow):
         return page
 
     def check_if_game_installed(self, project_data):
-        project_id = project_data.get("id_proyecto")
-        exe_name = project_data.get("nombre_ejecutable")
-        if not project_id or not exe_name:
-            return None
-
-        for library in load_libraries():
-            executable_path = os.path.join(library, project_id, exe_name)
-            if os.path.exists(executable_path):
-                return executable_path
-        return None
+        return find_installed_executable(project_data, load_libraries())
     
     def _on_locate_folder_clicked(self):
         if hasattr(self, "_current_exe_path") and self._current_exe_path:
@@ -1325,20 +2555,27 @@ class GameLauncherApp(QMainWindow):
         else:
             self.size_label.setVisible(False)
 
-        image_path = download_and_cache_image(project_data['imagen_portada'], project_data['id_proyecto'])
-        if image_path:
-            pixmap = QPixmap(image_path)
-            self.detail_image.setPixmap(pixmap.scaled(self.detail_image.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-
-        executable_path = self.check_if_game_installed(project_data)
+        # La portada se descarga, decodifica y escala en segundo plano;
+        # cambiar de proyecto descarta la petición anterior
+        image_loader.cancel(self.detail_image)
+        self.detail_image.clear()
+        cover_url = project_data.get('imagen_portada')
+        if cover_url:
+            def load_cover():
+                image_path = download_and_cache_image(cover_url)
+                return load_thumbnail(image_path, *DETAIL_IMAGE_SIZE) if image_path else None
+
+            def show_cover(image):
+                if image is not None:
+                    self.detail_image.setPixmap(QPixmap.fromImage(image))
+
+            image_loader.request(self.detail_image, load_cover, show_cover)
+
+        # Estado de instalación al día para este proyecto (puede haber cambiado en disco)
+        self.catalog.refresh_project(project_data['id_proyecto'])
+        executable_path = self.catalog.exe_path(project_data['id_proyecto'])
         self._current_exe_path = executable_path
-        installed_version = None
-        for library in load_libraries():
-            installed_version = self.get_installed_game_version(project_data['id_proyecto'], library)
-            if installed_version:
-                break
-        remote_version = project_data.get("version")
-        needs_update = installed_version and remote_version and installed_version != remote_version
+        needs_update = self.catalog.needs_update(project_data['id_proyecto'])
         if executable_path:
             self.locate_folder_button.setVisible(True)
         else:
@@ -1355,17 +2592,38 @@ class GameLauncherApp(QMainWindow):
             self.uninstall_button.clicked.disconnect()
         except TypeError:
             pass
+        try:
+            self.pause_button.clicked.disconnect()
+        except TypeError:
+            pass
+        self.pause_button.setVisible(False)
 
         active = self.active_downloads.get(project_data['id_proyecto'])
-        if active:
-            self.install_button.setText("Descargando...")
+        queued = self.download_queue.get(project_data['id_proyecto'])
+        partial = None if active else find_partial_download(project_data['id_proyecto'])
+        if queued and not queued["paused"]:
+            position = self.download_queue.position(project_data['id_proyecto'])
+            self.install_button.setText(f"En cola ({position}º)")
+            self.install_button.setEnabled(False)
+            self.progress_bar.setVisible(False)
+            self.cancel_button.setVisible(True)
+            self.cancel_button.setEnabled(True)
+            self.cancel_button.clicked.connect(lambda: self.cancel_download(project_data['id_proyecto']))
+            self.uninstall_button.setVisible(False)
+        elif active:
+            self.install_button.setText(active.get("status", "Descargando..."))
             self.install_button.setEnabled(False)
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(active.get("progress", 0))
+            self.pause_button.setVisible(active.get("status") not in ("Extrayendo...", "Cancelando..."))
+            self.pause_button.setEnabled(True)
+            self.pause_button.clicked.connect(lambda: self.pause_download(project_data['id_proyecto']))
             self.cancel_button.setVisible(True)
-            self.cancel_button.setEnabled(True)
+            self.cancel_button.setEnabled(not active.get("cancelled"))
             self.cancel_button.clicked.connect(lambda: self.cancel_download(project_data['id_proyecto']))
             self.uninstall_button.setVisible(False)
+        elif partial:
+            self._show_paused_download(project_data, partial[2])
         elif executable_path:
             if needs_update:
                 self.install_button.setText("Actualizar")
@@ -1395,43 +2653,135 @@ class GameLauncherApp(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.details_page)
     
     def update_game(self, project_data):
-        self.start_installation(project_data)
+        # Con manifiesto solo se descargan los archivos que cambiaron
+        self.start_installation(project_data, update=True)
+
+    def _show_paused_download(self, project_data, state):
+        """Botones de una descarga pausada o interrumpida: reanudar o descartarla."""
+        project_id = project_data['id_proyecto']
+        percent = int(state["downloaded"] * 100 / state["size"]) if state.get("size") else 0
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setVisible(True)
+        self.install_button.setText(f"Reanudar ({percent}%)")
+        self.install_button.setEnabled(True)
+        try:
+            self.install_button.clicked.disconnect()
+        except TypeError:
+            pass
+        self.install_button.clicked.connect(lambda: self.start_installation(project_data))
+        self.pause_button.setVisible(False)
+        try:
+            self.cancel_button.clicked.disconnect()
+        except TypeError:
+            pass
+        self.cancel_button.setVisible(True)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.clicked.connect(lambda: self.cancel_download(project_id))
+        self.uninstall_button.setVisible(False)
+
+    def pause_download(self, project_id):
+        active = self.active_downloads.get(project_id)
+        if active:
+            # El worker guarda el .part y avisa con la señal paused
+            active["worker"].pause()
+            active["status"] = "Pausando..."
+            if self.current_project_id_in_detail_view == project_id:
+                self.pause_button.setEnabled(False)
+                self.install_button.setText("Pausando...")
+            self.refresh_downloads_page()
+        else:
+            self.download_queue.pause(project_id)
+
+    def resume_download(self, project_id):
+        self.download_queue.resume(project_id)
+        project = self.catalog.get(project_id)
+        if project and self.current_project_id_in_detail_view == project_id:
+            self.show_project_details(project)
+
+    def on_installation_paused(self, project_id):
+        print(f"Descarga de {project_id} pausada.")
+        active = self.active_downloads.get(project_id)
+        if active:
+            # El hilo aún no terminó: cleanup_download la devuelve a la cola
+            # cuando acabe, y hasta entonces active_downloads lo mantiene vivo
+            active["paused"] = True
+
+    def _requeue_paused(self, project_id, active):
+        project = self.catalog.get(project_id)
+        if project:
+            # Vuelve a la cola en pausa, por delante, para reanudarla desde el panel
+            self.download_queue.enqueue(project, active["library"], active["update"], paused=True, front=True)
+        if self.current_project_id_in_detail_view == project_id:
+            project = self.catalog.get(project_id)
+            partial = find_partial_download(project_id)
+            if project and partial:
+                self._show_paused_download(project, partial[2])
+            elif project:
+                # Actualización pausada: se reanuda con el botón Actualizar
+                self.show_project_details(project)
 
     def cancel_download(self, project_id):
         active = self.active_downloads.get(project_id)
         if active:
-            thread = active["thread"]
-            worker = active["worker"]
-            worker.cancel()
-            thread.quit()
-            thread.wait()
-            project_install_dir = os.path.join(GAMES_INSTALL_DIR, project_id)
-            for f in os.listdir(project_install_dir):
-                if f.endswith(".zip"):
-                    try:
-                        os.remove(os.path.join(project_install_dir, f))
-                    except Exception:
-                        pass
-            self.cleanup_download(project_id)
-            self.progress_bar.setVisible(False)
-            self.install_button.setText("Instalar")
-            self.install_button.setEnabled(True)
-            self.cancel_button.setVisible(False)
+            # No se espera al hilo: puede estar en un reintento o un timeout de
+            # red. cleanup_download descarta lo descargado cuando termine
+            active["worker"].cancel()
+            active["cancelled"] = True
+            active["status"] = "Cancelando..."
+            if self.current_project_id_in_detail_view == project_id:
+                self.install_button.setText("Cancelando...")
+                self.install_button.setEnabled(False)
+                self.pause_button.setVisible(False)
+                self.cancel_button.setEnabled(False)
+            self.refresh_downloads_page()
+            return
+        self._discard_download(project_id)
+
+    def _discard_download(self, project_id):
+        """Quitar la descarga de la cola y borrar lo ya descargado o preparado."""
+        queued = self.download_queue.remove(project_id)
+        if queued and queued["update"]:
+            discard_update(os.path.join(queued["library"], project_id))
+        # Cancelar descarta también lo ya descargado (pausado o no)
+        partial = find_partial_download(project_id)
+        if partial:
+            discard_partial(partial[1])
+        project = self.catalog.get(project_id)
+        if project and self.current_project_id_in_detail_view == project_id:
+            self.show_project_details(project)
 
     def show_library(self):
         """Muestra la página de la biblioteca."""
         self.stacked_widget.setCurrentWidget(self.library_page)
 
-    def start_installation(self, project_data):
+    def start_installation(self, project_data, update=False):
         project_id = project_data['id_proyecto']
         if project_id in self.active_downloads:
             return  # Ya hay una descarga activa
+        if self.download_queue.get(project_id):
+            self.resume_download(project_id)  # Ya está en la cola (quizá en pausa)
+            return
 
-        # Seleccionar biblioteca antes de instalar
+        # Una descarga a medias se reanuda en su biblioteca sin preguntar, y
+        # una actualización va a la biblioteca donde ya está el juego
         libraries = load_libraries()
-        from PyQt6.QtWidgets import QInputDialog
-        items = libraries + ["Agregar nueva ubicación..."]
-        selected, ok = QInputDialog.getItem(self, "Seleccionar biblioteca", "Elige una ubicación para instalar el juego:", items, 0, False)
+        partial = find_partial_download(project_id, libraries)
+        installed_in = [lib for lib in libraries if os.path.isdir(os.path.join(lib, project_id))] if update else []
+        if partial:
+            selected, ok = partial[0], True
+        elif installed_in:
+            selected, ok = installed_in[0], True
+        else:
+            # Seleccionar biblioteca antes de instalar, con el espacio libre de cada una
+            from PyQt6.QtWidgets import QInputDialog
+            labels = {}
+            for library in libraries:
+                free = free_space(library)
+                label = f"{library}  ({format_size(free)} libres)" if free is not None else library
+                labels[label] = library
+            items = list(labels) + ["Agregar nueva ubicación..."]
+            selected, ok = QInputDialog.getItem(self, "Seleccionar biblioteca", "Elige una ubicación para instalar el juego:", items, 0, False)
+            selected = labels.get(selected, selected)
         if not ok:
             return
 
@@ -1449,14 +2799,68 @@ class GameLauncherApp(QMainWindow):
         else:
             library_path = selected
 
-        self.install_button.setEnabled(False)
-        self.install_button.setText("Descargando...")
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(True)
+        if not partial and not installed_in and not self._confirm_free_space(project_data, library_path):
+            return
+
+        # La cola decide cuándo empieza (_launch_download)
+        self.download_queue.enqueue(project_data, library_path, update)
+        if self.download_queue.get(project_id) and self.current_project_id_in_detail_view == project_id:
+            self.show_project_details(project_data)
+
+    def _confirm_free_space(self, project_data, library_path):
+        """
+        Aviso temprano con el tamaño del catálogo (el worker comprueba el
+        tamaño exacto antes de descargar y detiene la instalación si no cabe).
+        """
+        tamano_gb = project_data.get("tamano_gb")
+        free = free_space(library_path)
+        if not tamano_gb or free is None:
+            return True
+        try:
+            download_size = int(float(tamano_gb) * 1024 ** 3)
+        except (TypeError, ValueError):
+            return True
+        # Se supone que lo extraído ocupa como el zip
+        stream = self.settings.get("stream_install", False)
+        required = space_needed(download_size, download_size, stream) + SPACE_MARGIN
+        if required <= free:
+            return True
+        answer = QMessageBox.question(
+            self,
+            "Espacio insuficiente",
+            f"Instalar este juego necesita unos {format_size(required)} y en {library_path} "
+            f"hay {format_size(free)} libres.\n¿Intentar la instalación de todos modos?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        return answer == QMessageBox.StandardButton.Yes
+
+    def _launch_download(self, entry):
+        """Crear el worker de una entrada de la cola que tiene hueco para empezar."""
+        project_data = entry["project_data"]
+        project_id = entry["project_id"]
+        library_path = entry["library"]
+        update = entry["update"]
+        if self.current_project_id_in_detail_view == project_id:
+            self.install_button.setEnabled(False)
+            self.install_button.setText("Descargando...")
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(True)
+            self.uninstall_button.setVisible(False)
+            self.pause_button.setVisible(True)
+            self.pause_button.setEnabled(True)
+            try:
+                self.pause_button.clicked.disconnect()
+            except TypeError:
+                pass
+            self.pause_button.clicked.connect(lambda: self.pause_download(project_id))
 
         # Pasa la ruta de instalación al worker
         thread = QThread()
-        worker = DownloadWorker(project_data, library_path)
+        connections = 1
+        if self.settings.get("segmented_downloads", False):
+            connections = int(self.settings.get("download_connections", DOWNLOAD_CONNECTIONS))
+        stream = self.settings.get("stream_install", False)
+        worker = DownloadWorker(project_data, library_path, connections, stream, update)
         worker.moveToThread(thread)
 
         self.active_downloads[project_id] = {
@@ -1464,17 +2868,27 @@ class GameLauncherApp(QMainWindow):
             "worker": worker,
             "progress": 0,
             "error": "",
-            "exe_path": ""
+            "exe_path": "",
+            "status": "Descargando...",
+            "library": library_path,
+            "update": update,
+            "project_data": project_data
         }
 
         thread.started.connect(worker.run)
         worker.finished.connect(lambda exe_path, pid=project_id: self.on_installation_finished(exe_path, pid))
         worker.error.connect(lambda msg, pid=project_id: self.on_installation_error(msg, pid))
         worker.progress.connect(lambda val, pid=project_id: self.on_installation_progress(val, pid))
+        worker.stats.connect(lambda stats, pid=project_id: self.on_installation_stats(stats, pid))
         worker.status.connect(lambda msg, pid=project_id: self.on_installation_status(msg, pid))
+        worker.paused.connect(lambda pid=project_id: self.on_installation_paused(pid))
 
         worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
+        # Tras un error o una pausa el hilo también termina, para poder reanudar
+        worker.error.connect(thread.quit)
+        worker.paused.connect(thread.quit)
+        # Termine como termine (instalada, error o pausa) el worker se libera con el hilo
+        thread.finished.connect(worker.deleteLater)
         thread.finished.connect(thread.deleteLater)
         thread.finished.connect(lambda pid=project_id: self.cleanup_download(pid))
 
@@ -1492,22 +2906,55 @@ class GameLauncherApp(QMainWindow):
     # --- slots para manejar las señales del worker ---
 
     def on_installation_status(self, msg, project_id):
+        if self.active_downloads.get(project_id, {}).get("cancelled"):
+            return
+        if project_id in self.active_downloads:
+            self.active_downloads[project_id]["status"] = msg
+            self.active_downloads[project_id]["stats"] = None
+            # Cambian también los botones de la fila (no se pausa extrayendo)
+            self.refresh_downloads_page()
         if self.current_project_id_in_detail_view == project_id:
             self.install_button.setText(msg)
+            if msg == "Extrayendo...":
+                # Ya no se puede pausar: la descarga terminó
+                self.pause_button.setVisible(False)
 
     def cleanup_download(self, project_id):
-        if project_id in self.active_downloads:
-            del self.active_downloads[project_id]
+        active = self.active_downloads.pop(project_id, None)
+        if active is not None:
+            if active.get("cancelled"):
+                if active["update"]:
+                    discard_update(os.path.join(active["library"], project_id))
+                self._discard_download(project_id)
+            elif active.get("paused"):
+                self._requeue_paused(project_id, active)
+            self.refresh_downloads_page()
+        # Deja el hueco libre para la siguiente de la cola
+        self.download_queue.job_finished(project_id)
     
     def on_installation_progress(self, value, project_id):
         if project_id in self.active_downloads:
             self.active_downloads[project_id]["progress"] = value
+            self._update_download_row(project_id)
         if self.current_project_id_in_detail_view == project_id:
             self.progress_bar.setValue(value)
             self.progress_bar.setVisible(True)
-            self.install_button.setText("Descargando...")
+            status = self.active_downloads.get(project_id, {}).get("status", "Descargando...")
+            self.install_button.setText(f"{status} {self._download_speed_text(project_id)}".rstrip())
             self.install_button.setEnabled(False)
 
+    def on_installation_stats(self, stats, project_id):
+        # Llega justo antes de progress, que es quien refresca la interfaz
+        if project_id in self.active_downloads:
+            self.active_downloads[project_id]["stats"] = stats
+
+    def _download_speed_text(self, project_id):
+        """Velocidad y tiempo restante, por ejemplo "3.2 MB/s · 1:05"."""
+        stats = self.active_downloads.get(project_id, {}).get("stats")
+        if not stats:
+            return ""
+        return " · ".join(part for part in (format_rate(stats["rate"]), format_eta(stats["eta"])) if part)
+
     def on_installation_finished(self, executable_path, project_id):
         print(f"Instalación finalizada. Ejecutable en: {executable_path}")
         if project_id in self.active_downloads:
@@ -1517,6 +2964,7 @@ class GameLauncherApp(QMainWindow):
             self.install_button.setText("Jugar")
             self.install_button.setEnabled(True)
             self.cancel_button.setVisible(False)
+            self.pause_button.setVisible(False)
 
             self.uninstall_button.setVisible(True)
             self.uninstall_button.setEnabled(True)
@@ -1524,12 +2972,7 @@ class GameLauncherApp(QMainWindow):
                 self.uninstall_button.clicked.disconnect()
             except TypeError:
                 pass
-            current_project = None
-            if self.projects_data and self.projects_data.get("proyectos"):
-                for p in self.projects_data["proyectos"]:
-                    if p["id_proyecto"] == project_id:
-                        current_project = p
-                        break
+            current_project = self.catalog.get(project_id)
             if current_project:
                 self.uninstall_button.clicked.connect(lambda: self.uninstall_game(current_project))
 
@@ -1541,34 +2984,27 @@ class GameLauncherApp(QMainWindow):
             self.locate_folder_button.setVisible(True)
 
         # notificación con icono dinámico
-        project_title = None
-        icon_path = None
-        if self.projects_data and self.projects_data.get("proyectos"):
-            for p in self.projects_data["proyectos"]:
-                if p["id_proyecto"] == project_id:
-                    project_title = p["titulo"]
-                    # descargar y cachear el icono si existe
-                    if p.get("icon"):
-                        icon_path = download_and_cache_image(p["icon"], project_id + "_icon")
-                    break
+        project = self.catalog.get(project_id)
+        project_title = project["titulo"] if project else None
         if project_title:
-            if icon_path and os.path.exists(icon_path):
-                icon = QIcon(icon_path)
+            def notify(pixmap=None):
+                if pixmap is not None and not pixmap.isNull():
+                    icon = QIcon(pixmap)
+                else:
+                    icon = QSystemTrayIcon.MessageIcon.Information
                 self.tray_icon.showMessage(
                     "Instalación completada",
                     f"¡{project_title} está listo para jugar!",
                     icon,
                     5000
                 )
+
+            # el icono se descarga y decodifica en segundo plano
+            if project.get("icon"):
+                request_pixmap(self, project["icon"], None, None, notify)
             else:
-                self.tray_icon.showMessage(
-                    "Instalación completada",
-                    f"¡{project_title} está listo para jugar!",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    5000
-                )
-        
-        project = next((p for p in self.projects_data["proyectos"] if p["id_proyecto"] == project_id), None)
+                notify()
+
         if project and project.get("version"):
             for library in load_libraries():
                 version_file = os.path.join(library, project_id, "version.txt")
@@ -1576,14 +3012,18 @@ class GameLauncherApp(QMainWindow):
                     with open(version_file, "w", encoding="utf-8") as f:
                         f.write(str(project["version"]))
 
+        self.catalog.refresh_project(project_id)
+        self.apply_library_filter()
         self.populate_sidebar()
 
     def on_installation_error(self, message, project_id):
         print(f"Error de instalación: {message}")
-        if project_id in self.active_downloads:
-            self.active_downloads[project_id]["error"] = message
+        if project_id not in self.active_downloads or self.active_downloads[project_id].get("cancelled"):
+            return  # Cancelada: cleanup_download actualiza la interfaz cuando termine el hilo
+        self.active_downloads[project_id]["error"] = message
         if self.current_project_id_in_detail_view == project_id:
             self.progress_bar.setVisible(False)
+            self.pause_button.setVisible(False)
             self.install_button.setText(f"Error: Reintentar")
             self.install_button.setEnabled(True)
 
@@ -1617,6 +3057,9 @@ class GameLauncherApp(QMainWindow):
             self.game_monitor_worker = GameProcessMonitor(process, exe_name)
             self.game_monitor_worker.moveToThread(self.game_monitor_thread)
             self.game_monitor_thread.started.connect(self.game_monitor_worker.run)
+            # Mientras el juego está abierto las descargas bajan al límite "jugando"
+            self.game_monitor_worker.started.connect(self.on_game_started)
+            self.game_monitor_worker.finished.connect(self.on_game_stopped)
             self.game_monitor_worker.finished.connect(self.on_game_process_finished)
             self.game_monitor_worker.finished.connect(self.game_monitor_thread.quit)
             self.game_monitor_worker.finished.connect(self.game_monitor_worker.deleteLater)
@@ -1627,11 +3070,7 @@ class GameLauncherApp(QMainWindow):
             self.install_button.setText("Error al lanzar")
             self.install_button.setEnabled(False)
 
-        project = None
-        for p in self.projects_data["proyectos"]:
-            if self.current_project_id_in_detail_view == p["id_proyecto"]:
-                project = p
-                break
+        project = self.catalog.get(self.current_project_id_in_detail_view)
         if project:
             self.update_my_status("En juego", project["titulo"])
         if self.rpc and project:
@@ -1670,6 +3109,12 @@ class GameLauncherApp(QMainWindow):
                 print(f"Error al actualizar Rich Presence: {e}")
 
     def closeEvent(self, event):
+        self.image_prefetcher.shutdown()
+        image_loader.shutdown()
+        print(f"Caché de pixmaps: {pixmap_cache.stats()}")
+        print(f"Caché de imágenes: {image_cache.shared_fetches} peticiones compartieron una descarga en curso.")
+        client.report()
+        image_cache.flush()
         try:
             self.update_my_status("Desconectado")
         except Exception as e:
@@ -1788,10 +3233,10 @@ class LoginWidget(QWidget):
 
     def get_user_info_from_token(self, token):
         try:
-            resp = requests.get(
+            resp = client.get(
                 "https://traduction-club.live/api/userinfo/",
                 headers={"Authorization": f"Bearer {token}"},
-                timeout=10
+                timeout=10, retries=0
             )
             if resp.status_code == 200:
                 data = resp.json()
@@ -1896,10 +3341,7 @@ class FriendsWindow(QDialog):
                 # Avatar
                 avatar = QLabel()
                 avatar.setFixedSize(36, 36)
-                avatar_path = download_and_cache_image(friend.get("avatar_url"), f"{friend['username']}_avatar")
-                if avatar_path and os.path.exists(avatar_path):
-                    pixmap = QPixmap(avatar_path).scaled(36, 36, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    avatar.setPixmap(pixmap)
+                request_pixmap(avatar, friend.get("avatar_url"), 36, 36, avatar.setPixmap)
                 row_layout.addWidget(avatar)
                 # Nombre y estado
                 info = QLabel(f"{friend['username']}\n{friend.get('status', 'Desconectado')}")
@@ -1965,31 +3407,15 @@ QMainWindow {
 QScrollArea {
     border: none;
 }
-#gameCard {
-    background-color: #313244;
-    border-radius: 8px;
-    border: 1px solid #45475a;
-    text-align: left;
-    padding: 10px;
-    margin: 5px 10px;
-}
-#gameCard:hover {
-    background-color: #45475a;
-    border: 1px solid #89b4fa;
-}
-#gameTitle {
-    color: #cdd6f4;
-    font-size: 16px;
-    font-weight: bold;
+#libraryList {
+    background: transparent;
+    border: none;
+    outline: none;
 }
 #gameDescription, QLabel {
     color: #bac2de;
     font-size: 13px;
 }
-#gameImage {
-    background-color: #11111b;
-    border-radius: 4px;
-}
 #installButton, #backButton {
     background-color: #89b4fa;
     color: #1e1e2e;
@@ -2018,6 +3444,18 @@ QScrollArea {
 #cancelButton:hover {
     background-color: #eba0ac;
 }
+#pauseButton {
+    background-color: #f9e2af;
+    color: #1e1e2e;
+    font-size: 16px;
+    font-weight: bold;
+    border-radius: 8px;
+    padding: 10px;
+    border: none;
+}
+#pauseButton:hover {
+    background-color: #fab387;
+}
 #uninstallButton {
     background-color: #fab387;
     color: #fff;
@@ -2087,18 +3525,32 @@ QListWidget#sidebar::item {
 }
 """
 
+def report_first_paint(start_time):
+    """Imprime el tiempo desde el arranque hasta el primer pintado de la ventana."""
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    print(f"Tiempo hasta el primer pintado: {elapsed_ms:.0f} ms")
+
+def show_launcher_window(start_time):
+    """Abre la ventana con el catálogo en cache y lo revalida en segundo plano."""
+    window = GameLauncherApp(load_local_projects_data())
+    window.first_painted.connect(lambda: report_first_paint(start_time))
+    window.show()
+    window.start_catalog_refresh()
+    return window
+
 def main():
+    start_time = time.perf_counter()
+    windows = []
 
     def on_login_success(user_data):
         token, username, avatar_url = user_data
         save_token(token, username, avatar_url)
         login_widget.close()
-        projects_data = load_projects_data()
-        window = GameLauncherApp(projects_data)
-        window.show()
+        windows.append(show_launcher_window(time.perf_counter()))
     # Crear directorios necesarios
     for dir_path in [IMAGE_CACHE_DIR, GAMES_INSTALL_DIR]:
         os.makedirs(dir_path, exist_ok=True)
+    image_cache.start()
 
     temp_dir = tempfile.gettempdir()
     update_lock_path = os.path.join(temp_dir, "launcher_update.lock")
@@ -2117,9 +3569,7 @@ def main():
         login_widget.login_success.connect(on_login_success)
         sys.exit(app.exec())
     else:
-        projects_data = load_projects_data()
-        window = GameLauncherApp(projects_data)
-        window.show()
+        windows.append(show_launcher_window(start_time))
         sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -16,9 +16,17 @@ import json
 import datetime
 import shutil
 import subprocess
+import functools
+from image_cache import ImageCache
+from image_loader import ImageLoader, load_scaled_image
 
 SCREENSHOTS_DIR = "screenshots"
 
+# Mismo caché de imágenes que el launcher
+image_cache = ImageCache("image_cache")
+# Decodificación y escalado de imágenes fuera del hilo de la interfaz
+image_loader = ImageLoader()
+
 def load_user_info():
     if os.path.exists("user_token.json"):
         with open("user_token.json", "r") as f:
@@ -26,25 +34,8 @@ def load_user_info():
             return data.get("username"), data.get("avatar_url")
     return None, None
 
-def download_and_cache_image(image_url, cache_name):
-    if not image_url:
-        return None
-    filename = f"{cache_name}_{os.path.basename(image_url)}"
-    safe_filename = "".join(c for c in filename if c.isalnum() or c in ['.', '_', '-']).rstrip()
-    image_path = os.path.join("image_cache", safe_filename)
-    if os.path.exists(image_path):
-        return image_path
-    try:
-        import requests
-        response = requests.get(image_url, stream=True, timeout=15)
-        response.raise_for_status()
-        with open(image_path, 'wb') as f:
-            for chunk in response.iter_content(8192):
-                f.write(chunk)
-        return image_path
-    except Exception as e:
-        print(f"Error al descargar avatar: {e}")
-        return None
+def download_and_cache_image(image_url):
+    return image_cache.fetch(image_url)
 
 def find_game_window(exe_name):
     hwnds = []
@@ -208,11 +199,11 @@ class Overlay(QWidget):
         self.avatar_label.setGeometry(0, 0, 48, 48)
         self.avatar_label.setStyleSheet("border-radius: 24px; background: #232634;")
         if avatar_url:
-            os.makedirs("image_cache", exist_ok=True)
-            avatar_path = download_and_cache_image(avatar_url, f"{username}_avatar")
-            if avatar_path and os.path.exists(avatar_path):
-                pixmap = QPixmap(avatar_path).scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.avatar_label.setPixmap(pixmap)
+            image_loader.request(
+                self.avatar_label,
+                lambda: load_scaled_image(download_and_cache_image(avatar_url), 48, 48),
+                lambda image: self._set_label_image(self.avatar_label, image),
+            )
         self.name_label = QLabel(self.account_widget)
         self.name_label.setGeometry(56, 0, 180, 48)
         self.name_label.setStyleSheet("color: #cdd6f4; font-size: 18px; font-weight: bold; background: transparent;")
@@ -317,8 +308,17 @@ class Overlay(QWidget):
             self.gallery_pixmap.setText("No hay capturas.")
             return
         img_path = os.path.join(SCREENSHOTS_DIR, self.gallery_files[self.gallery_index])
-        pix = QPixmap(img_path).scaled(480, 270, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.gallery_pixmap.setPixmap(pix)
+        # Al pasar rápido de captura solo se muestra la última pedida
+        image_loader.cancel(self.gallery_pixmap)
+        image_loader.request(
+            self.gallery_pixmap,
+            lambda: load_scaled_image(img_path, 480, 270),
+            lambda image: self._set_label_image(self.gallery_pixmap, image),
+        )
+
+    def _set_label_image(self, label, image):
+        if image is not None:
+            label.setPixmap(QPixmap.fromImage(image))
 
     def gallery_prev(self):
         if self.gallery_files:
@@ -416,7 +416,17 @@ class Overlay(QWidget):
         self.show_screenshot_notice(screenshot_path)
 
     def show_screenshot_notice(self, screenshot_path):
-        pixmap = QPixmap(screenshot_path).scaled(80, 45, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        image_loader.cancel(self.screenshot_notice)
+        image_loader.request(
+            self.screenshot_notice,
+            lambda: load_scaled_image(screenshot_path, 80, 45),
+            functools.partial(self._show_screenshot_notice, screenshot_path),
+        )
+
+    def _show_screenshot_notice(self, screenshot_path, image):
+        if image is None:
+            return
+        pixmap = QPixmap.fromImage(image)
         text = "¡Captura guardada!"
         html = f'<div style="display:flex;align-items:center;"><img src="{screenshot_path}" width="80" height="45" style="margin-right:12px;"/><p>Hola Mundo</p><span style="color:white;font-size:18px;font-weight:bold;">¡Captura guardada¡</span></div>'
         self.screenshot_notice.setText("")
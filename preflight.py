@@ -0,0 +1,100 @@
+import os
+import shutil
+import zipfile
+from http_client import client
+from zip_install import HTTPRangeFile, probe_remote_zip
+
+# =============================================================================
+# COMPROBACIÓN DE ESPACIO ANTES DE INSTALAR
+# =============================================================================
+#
+# Antes de descargar se lee el directorio central del zip remoto con
+# peticiones Range (unos pocos KB al final del archivo) para saber el tamaño
+# exacto descomprimido. Con eso y el tamaño del zip se calcula el espacio
+# que hace falta en la biblioteca y la instalación se rechaza al principio
+# en lugar de fallar con el disco lleno a mitad de camino.
+
+# Margen que se deja libre además de lo que ocupa la instalación
+SPACE_MARGIN = 256 * 1024 * 1024
+
+
+class InsufficientSpace(Exception):
+    """No cabe la instalación en la biblioteca elegida."""
+
+    def __init__(self, path, required, free):
+        super().__init__(
+            f"Espacio insuficiente en {path}: hacen falta {format_size(required)} "
+            f"y hay {format_size(free)} libres."
+        )
+        self.path = path
+        self.required = required
+        self.free = free
+
+
+def format_size(size):
+    if size >= 1024 ** 3:
+        return f"{size / 1024 ** 3:.1f} GB"
+    return f"{size / 1024 ** 2:.0f} MB"
+
+
+def free_space(path):
+    """Bytes libres en el disco de path (o de su carpeta existente más cercana)."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    try:
+        return shutil.disk_usage(path).free
+    except OSError:
+        return None
+
+
+def remote_zip_size(url, session=None):
+    """
+    Tamaño del zip remoto y tamaño total descomprimido, leyendo solo su
+    directorio central. Lanza RangeNotSupported si el servidor no acepta Range.
+    """
+    session = session or client
+    remote = probe_remote_zip(url, session)
+    validator = remote["etag"] or remote["last_modified"]
+    with HTTPRangeFile(url, remote["size"], validator, session) as remote_file:
+        with zipfile.ZipFile(remote_file) as zip_ref:
+            uncompressed = sum(info.file_size for info in zip_ref.infolist())
+    return remote["size"], uncompressed
+
+
+def installed_size(path, skip_prefix=None):
+    """
+    Bytes de los archivos que ya hay en path. Los de primer nivel que
+    empiezan por skip_prefix (el zip a medias y su sidecar) no cuentan.
+    """
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            if skip_prefix and root == path and name.startswith(skip_prefix):
+                continue
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def space_needed(download_size, uncompressed, stream=False, downloaded=0):
+    """
+    Espacio que falta por ocupar: el zip (menos lo ya descargado) más lo
+    extraído. Instalando mientras se descarga el zip no llega a disco.
+    """
+    if stream:
+        return uncompressed
+    return max(0, download_size - downloaded) + uncompressed
+
+
+def check_space(path, required):
+    """Lanza InsufficientSpace si required (más el margen) no cabe en path."""
+    free = free_space(path)
+    if free is not None and required + SPACE_MARGIN > free:
+        raise InsufficientSpace(path, required + SPACE_MARGIN, free)
+    return free
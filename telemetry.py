@@ -0,0 +1,155 @@
+import json
+import time
+import threading
+
+# =============================================================================
+# TELEMETRÍA DE DESCARGAS E INSTALACIONES
+# =============================================================================
+#
+# Cada instalación lleva un TransferTelemetry: los hilos de descarga le pasan
+# los bytes con update() (barato, sin señales) y la interfaz recibe una foto
+# con velocidad y tiempo restante a ritmo fijo, no por bloque. Al terminar se
+# añade una línea a INSTALL_LOG_FILE con lo que tardó cada fase.
+
+INSTALL_LOG_FILE = "install_log.jsonl"
+# Cada cuánto se envía el progreso a la interfaz
+UI_UPDATE_INTERVAL = 0.25
+# Peso de la última muestra en la media móvil de la velocidad
+RATE_SMOOTHING = 0.3
+
+
+class TransferTelemetry:
+    """
+    Velocidad (media móvil exponencial), tiempo restante y tiempo por fase
+    de una instalación. update() se puede llamar desde cualquier hilo.
+    clock permite cambiar el reloj (por defecto time.monotonic).
+    """
+
+    def __init__(self, project_id, mode, clock=time.monotonic):
+        self.project_id = project_id
+        self.mode = mode
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.started = clock()
+        self.phase = None
+        self._phase_started = None
+        self.phases = {}  # {fase: segundos}
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.transferred = 0  # bytes descargados en esta sesión, contados desde el primer bloque
+        self._phase_offset = None
+        self._sample_time = None
+        self._sample_bytes = 0
+        self.rate = None
+        self._last_emit = 0.0
+        self.begin("connect")
+
+    def begin(self, phase):
+        """
+        Cerrar la fase actual y empezar otra: "connect", "transfer", "verify"
+        o "extract". El contador de bytes vuelve a cero.
+        """
+        with self._lock:
+            self._begin(phase)
+
+    def _begin(self, phase):
+        # Con el lock ya tomado
+        now = self._clock()
+        if self.phase is not None:
+            self.phases[self.phase] = self.phases.get(self.phase, 0.0) + now - self._phase_started
+        if self.phase in ("connect", "transfer") and self._phase_offset is not None:
+            self.transferred += max(0, self.bytes_done - self._phase_offset)
+        self.phase = phase
+        self._phase_started = now
+        self._phase_offset = None
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self._sample_time = None
+        self.rate = None
+
+    def update(self, done, total):
+        """
+        Bytes llevados y total de la fase. Devuelve True cuando toca avisar
+        a la interfaz (como mucho cada UI_UPDATE_INTERVAL segundos).
+        """
+        with self._lock:
+            if self.phase == "connect":
+                # Primer byte recibido: termina la conexión y empieza la transferencia
+                self._begin("transfer")
+            now = self._clock()
+            if self._phase_offset is None:
+                # Al reanudar, done empieza en lo que ya había: no cuenta como velocidad
+                self._phase_offset = done
+                self._sample_time = now
+                self._sample_bytes = done
+            self.bytes_done = done
+            self.bytes_total = total
+            elapsed = now - self._sample_time
+            if elapsed >= UI_UPDATE_INTERVAL:
+                sample = (done - self._sample_bytes) / elapsed
+                self.rate = sample if self.rate is None else RATE_SMOOTHING * sample + (1 - RATE_SMOOTHING) * self.rate
+                self._sample_time = now
+                self._sample_bytes = done
+            if now - self._last_emit >= UI_UPDATE_INTERVAL or (total and done >= total):
+                self._last_emit = now
+                return True
+            return False
+
+    def snapshot(self):
+        with self._lock:
+            eta = None
+            if self.rate and self.bytes_total:
+                eta = max(0.0, (self.bytes_total - self.bytes_done) / self.rate)
+            percent = int(self.bytes_done * 100 / self.bytes_total) if self.bytes_total else 0
+            return {
+                "phase": self.phase,
+                "done": self.bytes_done,
+                "total": self.bytes_total,
+                "percent": percent,
+                "rate": self.rate,
+                "eta": eta,
+            }
+
+    def finish(self, outcome, **extra):
+        """Cerrar la última fase y devolver el registro de la instalación."""
+        self.begin(None)
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "project_id": self.project_id,
+            "mode": self.mode,
+            "outcome": outcome,
+            "seconds": round(self._clock() - self.started, 3),
+            "bytes": self.transferred,
+            "phases": {phase: round(seconds, 3) for phase, seconds in self.phases.items() if phase},
+        }
+        transfer = self.phases.get("transfer")
+        if transfer:
+            record["avg_rate"] = round(self.transferred / transfer)
+        record.update(extra)
+        return record
+
+
+def append_install_log(record, path=INSTALL_LOG_FILE):
+    """Añadir el registro de una instalación al log local (una línea JSON)."""
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except (IOError, OSError) as e:
+        print(f"No se pudo escribir el log de instalaciones: {e}")
+
+
+def format_rate(rate):
+    if not rate:
+        return ""
+    if rate >= 1024 * 1024:
+        return f"{rate / (1024 * 1024):.1f} MB/s"
+    return f"{rate / 1024:.0f} KB/s"
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return ""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}:{seconds % 60:02d}"
@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# Las pruebas de la interfaz corren sin pantalla
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _scripted(self):
+        """Responder con la siguiente respuesta preparada para la ruta, si la hay."""
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        if server.response_delay:
+            time.sleep(server.response_delay)
+        queued = server.scripted.get(self.path)
+        if not queued:
+            return False
+        status, headers = queued.pop(0)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self._scripted():
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_GET(self):
+        server = self.server
+        if self._scripted():
+            return
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        start, end, status = 0, len(body) - 1, 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and server.ranges and (not if_range or if_range == etag):
+            first, _, last = range_header.split("=", 1)[1].partition("-")
+            start = int(first)
+            end = min(int(last), len(body) - 1) if last else len(body) - 1
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        self.end_headers()
+        try:
+            for pos in range(start, end + 1, server.chunk_size):
+                self.wfile.write(body[pos:min(pos + server.chunk_size, end + 1)])
+                if server.delay:
+                    time.sleep(server.delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def send_response(self, code, message=None):
+        self.server.statuses.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, *args):
+        pass
+
+
+class FileServer(ThreadingHTTPServer):
+    """
+    Servidor local con Range, ETag, If-Range e If-None-Match; ranges=False
+    desactiva los rangos. requests y statuses anotan cada petición y respuesta.
+    scripted[ruta] es una lista de (status, cabeceras) que se sirven antes
+    que el archivo, y response_delay retrasa cada respuesta.
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files = {}
+        self.requests = []
+        self.statuses = []
+        self.scripted = {}
+        self.response_delay = 0
+        self.ranges = True
+        self.chunk_size = 64 * 1024
+        self.delay = 0
+
+    def handle_error(self, request, client_address):
+        # Los clientes que pausan o cancelan cortan la conexión a mitad
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture
+def file_server():
+    server = FileServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,19 @@
+from catalog_cache import read_catalog_cache, read_catalog_cache_header, write_catalog_cache
+
+
+def test_round_trip_keeps_catalog_and_validators(tmp_path):
+    path = str(tmp_path / "proyectos_cache.bin")
+    data = {"version_catalogo": 7, "proyectos": [{"id_proyecto": "p1", "titulo": "Uno"}]}
+    assert write_catalog_cache(data, {"etag": '"abc"'}, path)
+
+    header = read_catalog_cache_header(path)
+    assert header["version_catalogo"] == 7 and header["etag"] == '"abc"'
+    assert read_catalog_cache(path) == (header, data)
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    path = tmp_path / "proyectos_cache.bin"
+    path.write_bytes(b"no es un cache")
+    assert read_catalog_cache(str(path)) == (None, None)
+    assert read_catalog_cache_header(str(path)) is None
+    assert read_catalog_cache(str(tmp_path / "no_existe.bin")) == (None, None)
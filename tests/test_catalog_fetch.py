@@ -0,0 +1,116 @@
+import json
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+import launcher_pyqt6 as launcher
+from catalog_cache import read_catalog_cache_header
+
+CATALOG = {
+    "version_catalogo": 3,
+    "proyectos": [
+        {"id_proyecto": "p1", "titulo": "Uno", "version": "1"},
+        {"id_proyecto": "p2", "titulo": "Dos", "version": "1"},
+    ],
+}
+
+
+@pytest.fixture
+def catalog_server(file_server, tmp_path, monkeypatch):
+    # El cache del catálogo se guarda en el directorio actual
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(launcher, "JSON_URL", file_server.url("/proyectos.json"))
+    monkeypatch.setattr(launcher, "JSON_DELTA_URL", file_server.url("/proyectos_delta.json"))
+    file_server.files["/proyectos.json"] = json.dumps(CATALOG).encode("utf-8")
+    return file_server
+
+
+def catalog_requests(server):
+    return [headers for path, headers in server.requests if path == "/proyectos.json"]
+
+
+def test_unchanged_catalog_is_revalidated_with_304(catalog_server):
+    assert launcher.load_projects_data() == CATALOG
+    etag = read_catalog_cache_header(launcher.LOCAL_CACHE_FILE)["etag"]
+    assert etag
+
+    assert launcher.load_projects_data() == CATALOG
+    assert catalog_requests(catalog_server)[-1]["If-None-Match"] == etag
+    assert catalog_server.statuses[-1] == 304
+
+
+def test_changed_catalog_replaces_cache_and_validators(catalog_server):
+    launcher.load_projects_data()
+    old_etag = read_catalog_cache_header(launcher.LOCAL_CACHE_FILE)["etag"]
+
+    changed = dict(CATALOG, version_catalogo=4, proyectos=CATALOG["proyectos"][:1])
+    catalog_server.files["/proyectos.json"] = json.dumps(changed).encode("utf-8")
+    assert launcher.load_projects_data() == changed
+    header = read_catalog_cache_header(launcher.LOCAL_CACHE_FILE)
+    assert header["version_catalogo"] == 4
+    assert header["etag"] and header["etag"] != old_etag
+
+
+def test_network_failure_falls_back_to_cache(catalog_server, monkeypatch):
+    launcher.load_projects_data()
+    monkeypatch.setattr(launcher, "JSON_URL", "http://127.0.0.1:9/proyectos.json")
+    monkeypatch.setattr(launcher, "JSON_DELTA_URL", "http://127.0.0.1:9/proyectos_delta.json")
+    monkeypatch.setattr(launcher.client, "retries", 0)
+    assert launcher.load_projects_data() == CATALOG
+
+
+def test_apply_catalog_delta_adds_replaces_and_removes():
+    cached = {"version_catalogo": 3, "proyectos": [
+        {"id_proyecto": "p1", "titulo": "Uno"},
+        {"id_proyecto": "p2", "titulo": "Dos"},
+        {"id_proyecto": "p3", "titulo": "Tres"},
+    ]}
+    delta = {
+        "version_base": 3, "version_catalogo": 4,
+        "agregados": [{"id_proyecto": "p4", "titulo": "Cuatro"}, {"id_proyecto": "p1", "titulo": "Repetido"}],
+        "modificados": [{"id_proyecto": "p2", "titulo": "Dos v2"}, {"id_proyecto": "p5", "titulo": "Cinco"}],
+        "eliminados": ["p3"],
+    }
+    data = launcher.apply_catalog_delta(cached, delta)
+    assert data["version_catalogo"] == 4
+    assert [(p["id_proyecto"], p["titulo"]) for p in data["proyectos"]] == [
+        ("p1", "Uno"), ("p2", "Dos v2"), ("p5", "Cinco"), ("p4", "Cuatro"),
+    ]
+    # El cache original no se modifica
+    assert len(cached["proyectos"]) == 3
+
+
+def test_unchanged_catalog_does_not_ask_for_a_delta(catalog_server):
+    launcher.load_projects_data()
+    catalog_server.requests.clear()
+    launcher.load_projects_data()
+    assert [path for path, _ in catalog_server.requests] == ["/proyectos.json"]
+
+
+def test_changed_catalog_uses_delta_and_keeps_validators(catalog_server):
+    launcher.load_projects_data()
+    delta = {
+        "version_base": 3, "version_catalogo": 4,
+        "agregados": [{"id_proyecto": "p3", "titulo": "Tres", "version": "1"}],
+        "modificados": [], "eliminados": ["p1"],
+    }
+    expected = launcher.apply_catalog_delta(CATALOG, delta)
+    catalog_server.files["/proyectos.json"] = json.dumps(expected).encode("utf-8")
+    catalog_server.files["/proyectos_delta.json?desde=3"] = json.dumps(delta).encode("utf-8")
+
+    assert launcher.load_projects_data() == expected
+    header = read_catalog_cache_header(launcher.LOCAL_CACHE_FILE)
+    assert header["version_catalogo"] == 4 and header["etag"]
+    # Con los validadores guardados la siguiente revalidación vuelve a ser un 304
+    catalog_server.requests.clear()
+    assert launcher.load_projects_data() == expected
+    assert catalog_server.statuses[-1] == 304
+    assert [path for path, _ in catalog_server.requests] == ["/proyectos.json"]
+
+
+def test_changed_catalog_without_delta_endpoint_reads_the_full_json(catalog_server):
+    launcher.load_projects_data()
+    changed = dict(CATALOG, version_catalogo=4, proyectos=CATALOG["proyectos"][1:])
+    catalog_server.files["/proyectos.json"] = json.dumps(changed).encode("utf-8")
+    catalog_server.requests.clear()
+    assert launcher.load_projects_data() == changed
+    assert [path for path, _ in catalog_server.requests] == ["/proyectos.json", "/proyectos_delta.json?desde=3"]
@@ -0,0 +1,92 @@
+import os
+import hashlib
+import pytest
+import delta_update
+from delta_update import (
+    apply_update, plan_update, save_installed_manifest, load_installed_manifest, STAGING_DIR
+)
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def entry(data):
+    return {"tamano": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+@pytest.fixture
+def game_dir(tmp_path):
+    game = tmp_path / "juego"
+    write(str(game / "juego.exe"), b"exe v1")
+    write(str(game / "datos" / "nivel1.dat"), b"nivel 1")
+    write(str(game / "datos" / "viejo.dat"), b"ya no existe")
+    write(str(game / "partida.sav"), b"del usuario")
+    return str(game)
+
+
+def manifest_v2(files_url=None):
+    manifest = {
+        "version": "2",
+        "archivos": {
+            "juego.exe": entry(b"exe v2"),
+            "datos/nivel1.dat": entry(b"nivel 1"),
+            "datos/nivel2.dat": entry(b"nivel 2"),
+        },
+    }
+    if files_url:
+        manifest["url_archivos"] = files_url
+    return manifest
+
+
+def test_plan_lists_only_changed_and_new_files(game_dir):
+    plan = plan_update(game_dir, manifest_v2())
+    assert sorted(plan["changed"]) == ["datos/nivel2.dat", "juego.exe"]
+    assert plan["bytes"] == len(b"exe v2") + len(b"nivel 2")
+    # Sin manifiesto instalado no se sabe qué es del usuario: no se borra nada
+    assert plan["removed"] == []
+
+
+def test_plan_removes_files_dropped_from_the_installed_manifest(game_dir):
+    save_installed_manifest(game_dir, {
+        "version": "1",
+        "archivos": {
+            "juego.exe": entry(b"exe v1"),
+            "datos/nivel1.dat": entry(b"nivel 1"),
+            "datos/viejo.dat": entry(b"ya no existe"),
+            "version.txt": entry(b"1"),
+        },
+    })
+    plan = plan_update(game_dir, manifest_v2(), load_installed_manifest(game_dir))
+    assert plan["removed"] == ["datos/viejo.dat"]
+
+
+def test_plan_trusts_recorded_hashes_of_untouched_files(game_dir, monkeypatch):
+    v1 = {"version": "1", "archivos": {"juego.exe": entry(b"exe v1"), "datos/nivel1.dat": entry(b"nivel 1")}}
+    save_installed_manifest(game_dir, v1)
+    installed = load_installed_manifest(game_dir)
+
+    def no_hashing(path):
+        raise AssertionError(f"{path} no debería leerse")
+
+    monkeypatch.setattr(delta_update, "file_sha256", no_hashing)
+    plan = plan_update(game_dir, manifest_v2(), installed)
+    assert sorted(plan["changed"]) == ["datos/nivel2.dat", "juego.exe"]
+
+
+def test_apply_update_downloads_changed_files_only(game_dir, file_server):
+    file_server.files["/v2/juego.exe"] = b"exe v2"
+    file_server.files["/v2/datos/nivel2.dat"] = b"nivel 2"
+    plan = apply_update(manifest_v2(file_server.url("/v2/")), game_dir)
+
+    assert sorted(path for path, _ in file_server.requests) == ["/v2/datos/nivel2.dat", "/v2/juego.exe"]
+    assert sorted(plan["changed"]) == ["datos/nivel2.dat", "juego.exe"]
+    with open(os.path.join(game_dir, "juego.exe"), "rb") as f:
+        assert f.read() == b"exe v2"
+    with open(os.path.join(game_dir, "datos", "nivel2.dat"), "rb") as f:
+        assert f.read() == b"nivel 2"
+    assert os.path.exists(os.path.join(game_dir, "partida.sav"))
+    assert not os.path.exists(os.path.join(game_dir, STAGING_DIR))
+    assert load_installed_manifest(game_dir)["version"] == "2"
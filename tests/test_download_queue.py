@@ -0,0 +1,46 @@
+from download_queue import DownloadQueue
+
+
+def project(project_id):
+    return {"id_proyecto": project_id}
+
+
+def started(queue):
+    ids = []
+    queue.start_requested.connect(lambda entry: ids.append(entry["project_id"]))
+    return ids
+
+
+def test_runs_at_most_max_active_and_fills_freed_slots():
+    queue = DownloadQueue(2)
+    ids = started(queue)
+    for project_id in ("a", "b", "c"):
+        queue.enqueue(project(project_id), "lib")
+    assert ids == ["a", "b"]
+    assert queue.position("c") == 1
+    queue.job_finished("a")
+    assert ids == ["a", "b", "c"]
+
+
+def test_paused_entries_wait_until_resumed():
+    queue = DownloadQueue(1)
+    ids = started(queue)
+    queue.enqueue(project("a"), "lib")
+    queue.enqueue(project("b"), "lib", paused=True, front=True)
+    queue.enqueue(project("c"), "lib")
+    queue.job_finished("a")
+    assert ids == ["a", "c"]
+    queue.job_finished("c")
+    assert ids == ["a", "c"]
+    queue.resume("b")
+    assert ids == ["a", "c", "b"]
+
+
+def test_play_next_jumps_ahead_of_normal_entries():
+    queue = DownloadQueue(1)
+    ids = started(queue)
+    for project_id in ("a", "b", "c"):
+        queue.enqueue(project(project_id), "lib")
+    queue.play_next("c")
+    queue.job_finished("a")
+    assert ids == ["a", "c"]
@@ -0,0 +1,160 @@
+import os
+import hashlib
+import pytest
+import downloader
+from downloader import (
+    download_file, download_resumable, load_partial_state, part_path, DownloadStopped, IntegrityError
+)
+
+BLOCK_SIZE = 16 * 1024  # menor que DOWNLOAD_CHUNK_SIZE: un trozo trae varios bloques
+
+
+def block_hashes(data, block_size=BLOCK_SIZE):
+    return [hashlib.sha256(data[pos:pos + block_size]).hexdigest() for pos in range(0, len(data), block_size)]
+
+
+@pytest.fixture
+def body():
+    return os.urandom(320 * 1024)
+
+
+def test_block_mismatch_keeps_only_verified_prefix(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    dest = str(tmp_path / "game.zip")
+    hashes = block_hashes(body)
+    bad = hashes[:5] + ["0" * 64] + hashes[6:]
+    with pytest.raises(IntegrityError):
+        download_resumable(file_server.url("/game.zip"), dest,
+                           expected={"block_size": BLOCK_SIZE, "block_sha256": bad})
+    with open(part_path(dest), "rb") as f:
+        assert f.read() == body[:5 * BLOCK_SIZE]
+
+    download_resumable(file_server.url("/game.zip"), dest,
+                       expected={"block_size": BLOCK_SIZE, "block_sha256": hashes})
+    with open(dest, "rb") as f:
+        assert f.read() == body
+    assert file_server.requests[-1][1]["Range"] == f"bytes={5 * BLOCK_SIZE}-"
+
+
+def test_segmented_block_mismatch_resumes_at_damaged_block(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    dest = str(tmp_path / "game.zip")
+    hashes = block_hashes(body)
+    bad = hashes[:5] + ["0" * 64] + hashes[6:]
+    with pytest.raises(IntegrityError):
+        download_file(file_server.url("/game.zip"), dest, preallocate=True,
+                      expected={"block_size": BLOCK_SIZE, "block_sha256": bad})
+    state = load_partial_state(dest)
+    assert state["segments"] == [[5 * BLOCK_SIZE, len(body) - 1]]
+    with open(part_path(dest), "rb") as f:
+        assert f.read(5 * BLOCK_SIZE) == body[:5 * BLOCK_SIZE]
+
+    download_file(file_server.url("/game.zip"), dest,
+                  expected={"block_size": BLOCK_SIZE, "block_sha256": hashes})
+    with open(dest, "rb") as f:
+        assert f.read() == body
+
+
+def pause_after(limit):
+    """should_stop que pausa cuando ya se han recibido limit bytes."""
+    received = [0]
+
+    def progress(downloaded, total):
+        received[0] = downloaded
+
+    return progress, lambda: "pause" if received[0] >= limit else None
+
+
+def test_pause_keeps_part_and_resume_uses_range(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    url = file_server.url("/game.zip")
+    dest = str(tmp_path / "game.zip")
+    progress, should_stop = pause_after(128 * 1024)
+    with pytest.raises(DownloadStopped) as stopped:
+        download_resumable(url, dest, progress, should_stop)
+    assert stopped.value.reason == "pause"
+    state = load_partial_state(dest)
+    assert state["url"] == url and state["size"] == len(body)
+    offset = state["downloaded"]
+    assert 0 < offset < len(body)
+
+    download_resumable(url, dest, expected={"size": len(body), "sha256": hashlib.sha256(body).hexdigest()})
+    with open(dest, "rb") as f:
+        assert f.read() == body
+    headers = file_server.requests[-1][1]
+    assert headers["Range"] == f"bytes={offset}-"
+    assert headers["If-Range"] == state["etag"]
+    assert load_partial_state(dest) is None
+
+
+def test_resume_without_range_support_downloads_from_scratch(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    url = file_server.url("/game.zip")
+    dest = str(tmp_path / "game.zip")
+    progress, should_stop = pause_after(128 * 1024)
+    with pytest.raises(DownloadStopped):
+        download_resumable(url, dest, progress, should_stop)
+
+    file_server.ranges = False
+    download_resumable(url, dest, expected={"sha256": hashlib.sha256(body).hexdigest()})
+    with open(dest, "rb") as f:
+        assert f.read() == body
+
+
+def test_resume_of_changed_file_starts_over(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    url = file_server.url("/game.zip")
+    dest = str(tmp_path / "game.zip")
+    progress, should_stop = pause_after(128 * 1024)
+    with pytest.raises(DownloadStopped):
+        download_resumable(url, dest, progress, should_stop)
+
+    # Nueva versión en el servidor: If-Range no coincide y llega el archivo entero
+    new_body = os.urandom(len(body))
+    file_server.files["/game.zip"] = new_body
+    download_resumable(url, dest)
+    with open(dest, "rb") as f:
+        assert f.read() == new_body
+
+
+def test_size_mismatch_discards_partial(file_server, body, tmp_path):
+    file_server.files["/game.zip"] = body
+    dest = str(tmp_path / "game.zip")
+    with pytest.raises(IntegrityError):
+        download_resumable(file_server.url("/game.zip"), dest, expected={"size": len(body) + 1})
+    assert not os.path.exists(part_path(dest))
+    assert load_partial_state(dest) is None
+
+
+def test_segmented_download_without_range_support_uses_one_connection(file_server, body, tmp_path):
+    file_server.ranges = False
+    file_server.files["/game.zip"] = body
+    dest = str(tmp_path / "game.zip")
+    download_file(file_server.url("/game.zip"), dest, connections=4)
+    with open(dest, "rb") as f:
+        assert f.read() == body
+
+
+def test_preallocated_single_connection_hashes_while_writing(file_server, body, tmp_path, monkeypatch):
+    file_server.files["/game.zip"] = body
+    url = file_server.url("/game.zip")
+    dest = str(tmp_path / "game.zip")
+    expected = {"size": len(body), "sha256": hashlib.sha256(body).hexdigest()}
+
+    def no_second_read(path):
+        raise AssertionError("el zip no debería leerse otra vez para hashearlo")
+
+    monkeypatch.setattr(downloader, "file_sha256", no_second_read)
+    phases = []
+    progress, should_stop = pause_after(128 * 1024)
+    with pytest.raises(DownloadStopped):
+        download_file(url, dest, progress=progress, should_stop=should_stop, expected=expected,
+                      on_phase=phases.append, preallocate=True)
+    # Al reanudar, lo que ya estaba en el .part entra en el hash antes que lo nuevo
+    download_file(url, dest, expected=expected, on_phase=phases.append, preallocate=True)
+    with open(dest, "rb") as f:
+        assert f.read() == body
+    assert "verify" not in phases
+
+    with pytest.raises(IntegrityError):
+        download_file(url, str(tmp_path / "otro.zip"), expected=dict(expected, sha256="0" * 64), preallocate=True)
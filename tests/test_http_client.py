@@ -0,0 +1,59 @@
+import time
+from types import SimpleNamespace
+import pytest
+import requests
+import http_client
+from http_client import HTTPClient
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Esperas de backoff anotadas en lugar de dormidas."""
+    waited = []
+    monkeypatch.setattr(http_client, "time", SimpleNamespace(perf_counter=time.perf_counter, sleep=waited.append))
+    return waited
+
+
+def test_server_errors_are_retried_until_success(file_server, sleeps):
+    file_server.files["/catalogo.json"] = b"{}"
+    file_server.scripted["/catalogo.json"] = [(500, {}), (503, {})]
+    client = HTTPClient(retries=3)
+    response = client.get(file_server.url("/catalogo.json"))
+    assert response.status_code == 200
+    assert file_server.statuses == [500, 503, 200]
+    assert len(sleeps) == 2
+    stats = client.stats()["127.0.0.1:%d/catalogo.json" % file_server.server_address[1]]
+    assert (stats["count"], stats["errors"], stats["retries"]) == (3, 2, 2)
+
+
+def test_retry_after_is_honoured(file_server, sleeps):
+    file_server.files["/catalogo.json"] = b"{}"
+    file_server.scripted["/catalogo.json"] = [(429, {"Retry-After": "3"})]
+    response = HTTPClient(retries=3).get(file_server.url("/catalogo.json"))
+    assert response.status_code == 200
+    assert sleeps == [3]
+
+
+def test_no_retries_returns_the_first_response(file_server, sleeps):
+    file_server.files["/catalogo.json"] = b"{}"
+    file_server.scripted["/catalogo.json"] = [(503, {})]
+    response = HTTPClient(retries=3).get(file_server.url("/catalogo.json"), retries=0)
+    assert response.status_code == 503
+    assert len(file_server.requests) == 1
+    assert sleeps == []
+
+
+def test_post_is_retried_only_when_the_server_did_not_process_it(file_server, sleeps):
+    file_server.scripted["/estado/"] = [(503, {}), (500, {})]
+    client = HTTPClient(retries=3)
+    # 503: el servidor no la procesó y se repite; 500 puede haberla procesado
+    assert client.post(file_server.url("/estado/"), json={}).status_code == 500
+    assert file_server.statuses == [503, 500]
+
+
+def test_post_is_not_retried_on_read_timeout(file_server, sleeps):
+    file_server.response_delay = 0.5
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        HTTPClient(retries=3).post(file_server.url("/estado/"), json={}, timeout=0.1)
+    assert len(file_server.requests) == 1
+    assert sleeps == []
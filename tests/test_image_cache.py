@@ -0,0 +1,133 @@
+import os
+import time
+import threading
+import pytest
+from image_cache import ImageCache, ImageCacheIndex, INDEX_FILENAME, BLOBS_DIRNAME
+
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tiempo de espera agotado"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cinco archivos de 100 bytes, del más antiguo (0) al más reciente (4)."""
+    now = time.time()
+    for i in range(5):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - 100 + i, now - 100 + i))
+    return tmp_path
+
+
+def test_eviction_by_size_removes_least_recently_used(cache_dir):
+    index = ImageCacheIndex(str(cache_dir), max_bytes=450, max_entries=100)
+    index.start()
+    # 500 bytes > 450: se baja al 90% (405) quitando el más antiguo
+    wait_until(lambda: not (cache_dir / "0.png").exists())
+    assert all((cache_dir / f"{i}.png").exists() for i in range(1, 5))
+
+    index.touch(str(cache_dir / "1.png"))
+    (cache_dir / "5.png").write_bytes(b"x" * 100)
+    index.add(str(cache_dir / "5.png"))
+    # El 1 se acaba de usar: ahora el más antiguo es el 2
+    wait_until(lambda: not (cache_dir / "2.png").exists())
+    assert (cache_dir / "1.png").exists()
+    assert (cache_dir / INDEX_FILENAME).exists()
+
+
+def test_eviction_by_entry_count(cache_dir):
+    index = ImageCacheIndex(str(cache_dir), max_bytes=10 ** 6, max_entries=4)
+    index.start()
+    # 5 > 4: se baja a int(4 * 0.9) = 3 entradas
+    wait_until(lambda: len([p for p in cache_dir.iterdir() if p.suffix == ".png"]) == 3)
+    assert sorted(p.name for p in cache_dir.iterdir() if p.suffix == ".png") == ["2.png", "3.png", "4.png"]
+
+
+def test_nothing_is_evicted_before_the_scan(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"x" * 100)
+    index = ImageCacheIndex(str(tmp_path), max_bytes=10, max_entries=100)
+    # Sin start() no hay índice completo: no se sabe qué es lo menos usado
+    index.add(str(tmp_path / "a.png"))
+    time.sleep(0.1)
+    assert (tmp_path / "a.png").exists()
+
+
+def image_requests(server, path):
+    return [headers for request_path, headers in server.requests if request_path == path]
+
+
+def test_identical_images_share_one_blob(file_server, tmp_path):
+    file_server.files["/avatar_a.png"] = b"avatar por defecto"
+    file_server.files["/avatar_b.png"] = b"avatar por defecto"
+    cache = ImageCache(str(tmp_path))
+    path_a = cache.fetch(file_server.url("/avatar_a.png"))
+    path_b = cache.fetch(file_server.url("/avatar_b.png"))
+    assert path_a == path_b
+    assert os.listdir(tmp_path / BLOBS_DIRNAME) == [os.path.basename(path_a)]
+
+    # Dentro del intervalo de revalidación no se vuelve a pedir
+    assert cache.fetch(file_server.url("/avatar_a.png")) == path_a
+    assert len(image_requests(file_server, "/avatar_a.png")) == 1
+
+
+def test_expired_entry_is_revalidated_in_background(file_server, tmp_path):
+    file_server.files["/portada.png"] = b"portada v1"
+    url = file_server.url("/portada.png")
+    cache = ImageCache(str(tmp_path), revalidate_interval=0)
+    path = cache.fetch(url)
+
+    # Sin cambios: 304 y la misma ruta
+    assert cache.lookup(url) == path
+    wait_until(lambda: len(image_requests(file_server, "/portada.png")) == 2)
+    assert image_requests(file_server, "/portada.png")[-1]["If-None-Match"]
+    wait_until(lambda: file_server.statuses[-1:] == [304])
+
+    # Cambió en el servidor: la siguiente revalidación trae el blob nuevo
+    file_server.files["/portada.png"] = b"portada v2"
+    wait_until(lambda: cache.lookup(url) != path)
+    with open(cache.lookup(url), "rb") as f:
+        assert f.read() == b"portada v2"
+
+
+def test_concurrent_fetches_share_one_download(file_server, tmp_path):
+    file_server.files["/icono.png"] = b"icono"
+    file_server.response_delay = 0.3
+    url = file_server.url("/icono.png")
+    cache = ImageCache(str(tmp_path))
+    barrier = threading.Barrier(8)
+    results = []
+
+    def fetch():
+        barrier.wait()
+        results.append(cache.fetch(url))
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(image_requests(file_server, "/icono.png")) == 1
+    assert len(set(results)) == 1 and results[0]
+    assert cache.shared_fetches == 7
+
+
+def test_failed_download_is_shared_and_retried_later(file_server, tmp_path):
+    file_server.response_delay = 0.3
+    url = file_server.url("/no_existe.png")
+    cache = ImageCache(str(tmp_path))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.fetch(url))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [None] * 4
+    assert len(image_requests(file_server, "/no_existe.png")) == 1
+    # El fallo no queda en caché: una petición posterior vuelve a intentarlo
+    file_server.response_delay = 0
+    file_server.files["/no_existe.png"] = b"ya existe"
+    assert cache.fetch(url)
@@ -0,0 +1,118 @@
+import io
+import os
+import time
+import zipfile
+import threading
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtTest import QTest
+import launcher_pyqt6 as launcher
+
+
+def wait_until(condition, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tiempo de espera agotado"
+        QTest.qWait(20)
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app, tmp_path, monkeypatch):
+    # Sin red: el catálogo sale del constructor y los avisos de arranque fallan
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(launcher, "load_projects_data", lambda: None)
+    monkeypatch.setattr(launcher, "fetch_launcher_update_info", lambda: (_ for _ in ()).throw(OSError("sin red")))
+    monkeypatch.setattr(launcher, "post_user_status", lambda status, game=None: None)
+    window = launcher.GameLauncherApp({"version_catalogo": 1, "proyectos": []})
+    yield window
+    wait_until(lambda: window.catalog_thread is None and window.startup_thread is None)
+    for project_id in list(window.active_downloads):
+        window.cancel_download(project_id)
+    wait_until(lambda: not window.active_downloads)
+    window.hide()
+    window.deleteLater()
+    QTest.qWait(50)
+
+
+def test_window_opens_and_background_startup_finishes(window):
+    painted = []
+    window.first_painted.connect(lambda: painted.append(True))
+    window.show()
+    window.start_catalog_refresh()
+    wait_until(lambda: painted)
+    wait_until(lambda: window.catalog_thread is None and window.startup_thread is None)
+    assert window.isVisible()
+    # Una sola página de cada tipo en la pila
+    assert window.stacked_widget.count() == 6
+    assert window.stacked_widget.currentWidget() is window.library_page
+
+
+
+def test_startup_status_is_posted_off_the_gui_thread(window, monkeypatch):
+    posted = []
+    monkeypatch.setattr(launcher, "post_user_status",
+                        lambda status, game=None: posted.append((status, threading.current_thread())))
+    window.show()
+    wait_until(lambda: posted and window.startup_thread is None)
+    assert posted[0][0] == "Conectado"
+    assert posted[0][1] is not threading.main_thread()
+
+def slow_game(window, file_server):
+    """Proyecto cuyo zip se sirve despacio, ya en el catálogo de la ventana."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_ref:
+        zip_ref.writestr("juego.exe", os.urandom(2 * 1024 * 1024))
+    file_server.files["/juego.zip"] = buffer.getvalue()
+    file_server.chunk_size = 16 * 1024
+    file_server.delay = 0.01
+    project = {
+        "id_proyecto": "p1", "titulo": "Juego", "version": "1",
+        "url_descarga": file_server.url("/juego.zip"), "nombre_ejecutable": "juego.exe",
+    }
+    window.apply_projects_data({"version_catalogo": 2, "proyectos": [project]})
+    window.show()
+    return project
+
+
+def test_pause_and_resume_download(window, file_server, tmp_path):
+    project = slow_game(window, file_server)
+    library = str(tmp_path / "biblioteca")
+    window.download_queue.enqueue(project, library)
+    assert "p1" in window.active_downloads
+    wait_until(lambda: window.active_downloads["p1"]["progress"] > 0)
+    window.pause_download("p1")
+    wait_until(lambda: "p1" not in window.active_downloads)
+    assert window.download_queue.get("p1")["paused"]
+    state = launcher.find_partial_download("p1", [library])[2]
+    assert 0 < state["downloaded"] < state["size"]
+
+    window.resume_download("p1")
+    wait_until(lambda: "p1" not in window.active_downloads and not window.download_queue.get("p1"))
+    assert os.path.exists(os.path.join(library, "p1", "juego.exe"))
+
+
+def test_cancel_does_not_wait_for_the_worker(window, file_server, tmp_path):
+    project = slow_game(window, file_server)
+    library = str(tmp_path / "biblioteca")
+    window.download_queue.enqueue(project, library)
+    wait_until(lambda: window.active_downloads["p1"]["progress"] > 0)
+    thread = window.active_downloads["p1"]["thread"]
+    # El servidor deja de responder: el worker está bloqueado en la red
+    file_server.delay = 0.5
+
+    start = time.monotonic()
+    window.cancel_download("p1")
+    assert time.monotonic() - start < 0.2
+    assert thread.isRunning()
+    assert window.active_downloads["p1"]["status"] == "Cancelando..."
+
+    wait_until(lambda: "p1" not in window.active_downloads)
+    assert window.download_queue.get("p1") is None
+    assert launcher.find_partial_download("p1", [library]) is None
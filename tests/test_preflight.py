@@ -0,0 +1,57 @@
+import io
+import os
+import zipfile
+import pytest
+import preflight
+from preflight import (
+    InsufficientSpace, SPACE_MARGIN, check_space, installed_size, remote_zip_size, space_needed
+)
+from zip_install import RangeNotSupported
+
+
+def test_space_needed_counts_zip_and_extracted_files():
+    assert space_needed(100, 300) == 400
+    # Lo ya descargado del zip no vuelve a ocupar
+    assert space_needed(100, 300, downloaded=40) == 360
+    # Instalando mientras se descarga el zip no llega a disco
+    assert space_needed(100, 300, stream=True) == 300
+
+
+def test_check_space_rejects_when_margin_does_not_fit(monkeypatch, tmp_path):
+    monkeypatch.setattr(preflight, "free_space", lambda path: SPACE_MARGIN + 1000)
+    assert check_space(str(tmp_path), 1000) == SPACE_MARGIN + 1000
+    with pytest.raises(InsufficientSpace) as error:
+        check_space(str(tmp_path), 1001)
+    assert error.value.required == SPACE_MARGIN + 1001
+
+
+def test_installed_size_skips_the_partial_zip(tmp_path):
+    (tmp_path / "juego.exe").write_bytes(b"x" * 10)
+    (tmp_path / "datos").mkdir()
+    (tmp_path / "datos" / "juego.zip.dat").write_bytes(b"x" * 5)
+    (tmp_path / "juego.zip.part").write_bytes(b"x" * 100)
+    (tmp_path / "juego.zip.part.json").write_bytes(b"{}")
+    assert installed_size(str(tmp_path), "juego.zip") == 15
+
+
+def make_zip():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr("juego.exe", b"a" * 50000)
+        zip_ref.writestr("datos/nivel.dat", os.urandom(20000))
+    return buffer.getvalue()
+
+
+def test_remote_zip_size_reads_the_central_directory(file_server):
+    data = make_zip()
+    file_server.files["/juego.zip"] = data
+    assert remote_zip_size(file_server.url("/juego.zip")) == (len(data), 70000)
+    # Solo se piden rangos, nunca el zip entero
+    assert all("Range" in headers for _, headers in file_server.requests)
+
+
+def test_remote_zip_size_needs_range_support(file_server):
+    file_server.ranges = False
+    file_server.files["/juego.zip"] = make_zip()
+    with pytest.raises(RangeNotSupported):
+        remote_zip_size(file_server.url("/juego.zip"))
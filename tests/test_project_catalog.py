@@ -0,0 +1,119 @@
+import os
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+from launcher_pyqt6 import ProjectCatalog
+
+
+def make_data(*projects):
+    return {"version_catalogo": 1, "proyectos": list(projects)}
+
+
+def project(pid, titulo, version="1", **extra):
+    return {"id_proyecto": pid, "titulo": titulo, "version": version,
+            "nombre_ejecutable": "Juego.exe", **extra}
+
+
+def install(library, pid, version):
+    folder = os.path.join(library, pid)
+    os.makedirs(folder, exist_ok=True)
+    open(os.path.join(folder, "Juego.exe"), "wb").close()
+    with open(os.path.join(folder, "version.txt"), "w", encoding="utf-8") as f:
+        f.write(version)
+
+
+@pytest.fixture
+def library(tmp_path):
+    return str(tmp_path / "juegos")
+
+
+def test_lookup_and_title_order(library):
+    catalog = ProjectCatalog(make_data(project("b", "beta"), project("a", "Alfa"),
+                                       {"titulo": "sin id"}), [library])
+    assert len(catalog) == 2
+    assert "a" in catalog and "x" not in catalog
+    assert catalog.get("b")["titulo"] == "beta"
+    assert catalog.get("x") is None
+    assert [p["id_proyecto"] for p in catalog.by_title] == ["a", "b"]
+
+
+def test_installed_and_update_views(library):
+    install(library, "a", "1")
+    install(library, "b", "0.9")
+    catalog = ProjectCatalog(make_data(project("a", "A"), project("b", "B"), project("c", "C")),
+                             [library])
+    assert [p["id_proyecto"] for p in catalog.installed_projects()] == ["a", "b"]
+    assert catalog.exe_path("a") == os.path.join(library, "a", "Juego.exe")
+    assert catalog.installed_version("b") == "0.9"
+    assert catalog.needs_update("b") and not catalog.needs_update("a")
+    assert [p["id_proyecto"] for p in catalog.update_available_projects()] == ["b"]
+
+
+def test_refresh_project_after_install_and_uninstall(library):
+    catalog = ProjectCatalog(make_data(project("a", "A", version="2")), [library])
+    assert catalog.exe_path("a") is None
+
+    install(library, "a", "1")
+    catalog.refresh_project("a", [library])
+    assert catalog.exe_path("a") and catalog.needs_update("a")
+
+    os.remove(os.path.join(library, "a", "Juego.exe"))
+    catalog.refresh_project("a", [library])
+    assert catalog.exe_path("a") is None
+    assert not catalog.needs_update("a")
+    assert catalog.installed_version("a") is None
+
+
+def test_updated_reports_changes_and_keeps_state(library):
+    install(library, "a", "1")
+    install(library, "b", "1")
+    old = ProjectCatalog(make_data(project("a", "A"), project("b", "B"), project("c", "C")),
+                         [library])
+    # Si se recalculara el estado de "a", dejaría de verse instalado
+    os.remove(os.path.join(library, "a", "Juego.exe"))
+
+    new, added, changed, removed = old.updated(
+        make_data(project("a", "A"), project("b", "B", version="2"), project("d", "D")),
+        [library])
+    assert (added, changed, removed) == ({"d"}, {"b"}, {"c"})
+    assert new.exe_path("a") == old.exe_path("a")
+    assert new.needs_update("b")
+    assert "c" not in new
+
+
+def test_search_matches_word_prefixes_without_accents(library):
+    catalog = ProjectCatalog(make_data(
+        project("a", "Canción del Mar", descripcion="Novela visual"),
+        project("b", "Mar Abierto"),
+        project("c", "Marciano", descripcion="Aventura")), [library])
+    assert catalog.search("") is None
+    assert catalog.search("   ") is None
+    assert catalog.search("mar") == {"a", "b", "c"}
+    assert catalog.search("CANCION") == {"a"}
+    # Todas las palabras deben coincidir, en titulo o descripcion
+    assert catalog.search("mar nov") == {"a"}
+    assert catalog.search("mar zz") == set()
+    assert catalog.search("ar") == set()  # solo prefijos, no subcadenas
+    assert catalog.search("av") == {"c"}
+    # El cache de prefijos no debe alterarse con las intersecciones
+    assert catalog.search("mar") == {"a", "b", "c"}
+
+
+def test_search_filters(library):
+    install(library, "a", "1")
+    install(library, "b", "0.9")
+    catalog = ProjectCatalog(make_data(project("a", "Mar"), project("b", "Marea"),
+                                       project("c", "Marciano")), [library])
+    assert catalog.search("", installed_only=True) == {"a", "b"}
+    assert catalog.search("", update_only=True) == {"b"}
+    assert catalog.search("marc", installed_only=True) == set()
+    assert catalog.search("mar", installed_only=True, update_only=True) == {"b"}
+
+
+def test_search_after_update_drops_removed_projects(library):
+    old = ProjectCatalog(make_data(project("a", "Mar"), project("b", "Marea")), [library])
+    new, _, _, removed = old.updated(make_data(project("a", "Lago"), project("c", "Marino")),
+                                     [library])
+    assert removed == {"b"}
+    assert new.search("mar") == {"c"}
+    assert new.search("lago") == {"a"}
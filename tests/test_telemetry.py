@@ -0,0 +1,107 @@
+import json
+import pytest
+
+from telemetry import TransferTelemetry, append_install_log, format_rate, format_eta
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_rate_is_an_exponential_moving_average(clock):
+    telemetry = TransferTelemetry("p1", "zip", clock=clock)
+    clock.now += 2
+    assert telemetry.update(0, 1000)  # primer byte: termina "connect"
+    assert telemetry.snapshot()["phase"] == "transfer"
+    assert telemetry.snapshot()["rate"] is None
+
+    clock.now += 1
+    assert telemetry.update(100, 1000)
+    assert telemetry.rate == pytest.approx(100)
+
+    clock.now += 1
+    assert telemetry.update(300, 1000)
+    # 0.3 * 200 B/s + 0.7 * 100 B/s
+    snap = telemetry.snapshot()
+    assert snap["rate"] == pytest.approx(130)
+    assert snap["eta"] == pytest.approx(700 / 130)
+    assert (snap["done"], snap["total"], snap["percent"]) == (300, 1000, 30)
+
+
+def test_updates_are_throttled_except_at_the_end(clock):
+    telemetry = TransferTelemetry("p1", "zip", clock=clock)
+    assert telemetry.update(0, 1000)
+    clock.now += 0.1
+    assert not telemetry.update(500, 1000)
+    # Sin una muestra completa la velocidad no cambia
+    assert telemetry.rate is None
+    clock.now += 0.1
+    assert telemetry.update(1000, 1000)
+
+
+def test_resumed_bytes_do_not_count_as_speed(clock):
+    telemetry = TransferTelemetry("p1", "zip", clock=clock)
+    telemetry.update(5000, 10000)
+    clock.now += 1
+    telemetry.update(6000, 10000)
+    assert telemetry.rate == pytest.approx(1000)
+    assert telemetry.snapshot()["eta"] == pytest.approx(4)
+    assert telemetry.finish("ok")["bytes"] == 1000
+
+
+def test_finish_accounts_time_per_phase(clock):
+    telemetry = TransferTelemetry("p1", "zip", clock=clock)
+    clock.now += 2
+    telemetry.update(0, 1000)
+    clock.now += 3
+    telemetry.update(1000, 1000)
+    telemetry.begin("verify")
+    clock.now += 1
+    telemetry.begin("extract")
+    telemetry.update(0, 50)
+    clock.now += 4
+    telemetry.update(50, 50)
+
+    record = telemetry.finish("ok", library="D:/Juegos")
+    assert record["project_id"] == "p1"
+    assert record["mode"] == "zip"
+    assert record["outcome"] == "ok"
+    assert record["seconds"] == 10
+    assert record["phases"] == {"connect": 2, "transfer": 3, "verify": 1, "extract": 4}
+    # Los bytes extraídos no cuentan como transferidos
+    assert record["bytes"] == 1000
+    assert record["avg_rate"] == 333
+    assert record["library"] == "D:/Juegos"
+
+
+def test_append_install_log(tmp_path):
+    path = tmp_path / "install_log.jsonl"
+    append_install_log({"project_id": "p1", "outcome": "ok"}, path=str(path))
+    append_install_log({"project_id": "p2", "outcome": "error", "error": "sin espacio en el disco"},
+                       path=str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["project_id"] for line in lines] == ["p1", "p2"]
+    assert "sin espacio" in lines[1]
+
+
+def test_append_install_log_ignores_write_errors(tmp_path, capsys):
+    append_install_log({"project_id": "p1"}, path=str(tmp_path))  # es un directorio
+    assert "No se pudo escribir" in capsys.readouterr().out
+
+
+def test_formatting():
+    assert format_rate(None) == ""
+    assert format_rate(512 * 1024) == "512 KB/s"
+    assert format_rate(3.5 * 1024 * 1024) == "3.5 MB/s"
+    assert format_eta(None) == ""
+    assert format_eta(75) == "1:15"
+    assert format_eta(3725) == "1h 02m"
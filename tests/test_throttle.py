@@ -0,0 +1,47 @@
+import time
+import threading
+
+from throttle import TokenBucket, MIN_BURST
+
+RATE = 1024 * 1024  # 1 MB/s; ráfaga = MIN_BURST (256 KB)
+CHUNK = 16 * 1024
+
+
+def consume_all(bucket, threads, per_thread):
+    def worker():
+        for _ in range(per_thread // CHUNK):
+            bucket.consume(CHUNK)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.monotonic()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return time.monotonic() - start
+
+
+def test_unlimited_does_not_block():
+    assert consume_all(TokenBucket(0), 4, 4 * 1024 * 1024) < 0.5
+
+
+def test_rate_is_for_the_total_across_threads():
+    bucket = TokenBucket(RATE)
+    assert bucket._burst == max(MIN_BURST, RATE // 4)
+    total = 4 * 512 * 1024
+    elapsed = consume_all(bucket, 4, 512 * 1024)
+    # El cubo empieza vacío: 2 MB a 1 MB/s son ~2 s, sin importar los hilos
+    expected = total / RATE
+    assert expected * 0.9 <= elapsed <= expected + 0.75
+
+
+def test_set_rate_applies_to_running_transfers():
+    bucket = TokenBucket(RATE)
+    timer = threading.Timer(0.2, bucket.set_rate, args=(0,))
+    timer.start()
+    try:
+        # A 1 MB/s tardaría 8 s; al quitar el límite termina enseguida
+        elapsed = consume_all(bucket, 2, 4 * 1024 * 1024)
+    finally:
+        timer.cancel()
+    assert elapsed < 2
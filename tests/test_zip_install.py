@@ -0,0 +1,122 @@
+import io
+import os
+import zipfile
+import pytest
+from downloader import DownloadStopped, load_partial_state, sidecar_path
+from zip_install import extract_archive, stream_install, RangeNotSupported
+
+ENTRY_SIZE = 200 * 1024
+
+
+def make_zip(count, size=ENTRY_SIZE):
+    """Zip sin comprimir con count entradas de datos aleatorios."""
+    entries = {f"datos/{i}.dat": os.urandom(size) for i in range(count)}
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_ref:
+        for name, data in entries.items():
+            zip_ref.writestr(name, data)
+    return buffer.getvalue(), entries
+
+
+def assert_extracted(dest, entries):
+    for name, data in entries.items():
+        with open(os.path.join(dest, *name.split("/")), "rb") as f:
+            assert f.read() == data
+
+
+def stop_after(reason, limit):
+    """progress y should_stop que piden reason cuando se han leído limit bytes."""
+    read = [0]
+
+    def progress(done, total):
+        read[0] = done
+
+    return progress, lambda: reason if read[0] >= limit else None
+
+
+@pytest.fixture
+def install_dir(tmp_path):
+    dest = tmp_path / "juego"
+    dest.mkdir()
+    return str(dest)
+
+
+def test_stream_install_resumes_from_the_sidecar(file_server, install_dir):
+    data, entries = make_zip(4)
+    file_server.files["/juego.zip"] = data
+    url = file_server.url("/juego.zip")
+    state_path = os.path.join(install_dir, "juego.zip")
+
+    progress, should_stop = stop_after("pause", 2 * ENTRY_SIZE)
+    with pytest.raises(DownloadStopped):
+        stream_install(url, state_path, install_dir, progress, should_stop)
+    state = load_partial_state(state_path)
+    assert state["mode"] == "stream"
+    assert 0 < len(state["done"]) < len(entries)
+
+    inodes = {name: os.stat(os.path.join(install_dir, *name.split("/"))).st_ino for name in state["done"]}
+
+    stream_install(url, state_path, install_dir)
+    assert_extracted(install_dir, entries)
+    assert not os.path.exists(sidecar_path(state_path))
+    # Las entradas ya extraídas no se vuelven a escribir
+    for name, inode in inodes.items():
+        assert os.stat(os.path.join(install_dir, *name.split("/"))).st_ino == inode
+
+
+def test_cancelling_a_fresh_stream_install_leaves_nothing(file_server, install_dir):
+    data, _ = make_zip(4)
+    file_server.files["/juego.zip"] = data
+    state_path = os.path.join(install_dir, "juego.zip")
+    progress, should_stop = stop_after("cancel", 2 * ENTRY_SIZE)
+    with pytest.raises(DownloadStopped):
+        stream_install(file_server.url("/juego.zip"), state_path, install_dir, progress, should_stop)
+    assert not os.path.exists(sidecar_path(state_path))
+    assert not any(files for _, _, files in os.walk(install_dir))
+
+
+def test_stream_install_needs_range_support(file_server, install_dir):
+    file_server.ranges = False
+    file_server.files["/juego.zip"] = make_zip(1)[0]
+    with pytest.raises(RangeNotSupported):
+        stream_install(file_server.url("/juego.zip"), os.path.join(install_dir, "juego.zip"), install_dir)
+
+
+@pytest.fixture
+def local_zip(tmp_path):
+    data, entries = make_zip(8, 1024 * 1024)
+    path = tmp_path / "juego.zip"
+    path.write_bytes(data)
+    return str(path), entries
+
+
+def test_parallel_extraction_reports_progress(local_zip, install_dir):
+    zip_path, entries = local_zip
+    seen = []
+    extract_archive(zip_path, install_dir, workers=4, progress=lambda done, total: seen.append((done, total)))
+    assert_extracted(install_dir, entries)
+    total = sum(len(data) for data in entries.values())
+    assert max(seen) == (total, total)
+
+
+def test_cancel_removes_files_of_a_fresh_extraction(local_zip, install_dir):
+    zip_path, _ = local_zip
+    progress, should_stop = stop_after("cancel", 3 * 1024 * 1024)
+    with pytest.raises(DownloadStopped) as stopped:
+        extract_archive(zip_path, install_dir, workers=4, progress=progress,
+                        should_stop=should_stop, remove_on_cancel=True)
+    assert stopped.value.reason == "cancel"
+    assert not any(files for _, _, files in os.walk(install_dir))
+
+
+def test_pause_keeps_finished_files_and_no_temporaries(local_zip, install_dir):
+    zip_path, entries = local_zip
+    progress, should_stop = stop_after("pause", 3 * 1024 * 1024)
+    with pytest.raises(DownloadStopped) as stopped:
+        extract_archive(zip_path, install_dir, workers=4, progress=progress,
+                        should_stop=should_stop, remove_on_cancel=True)
+    # El motivo real manda sobre el "stop" con que se paran los demás hilos
+    assert stopped.value.reason == "pause"
+    names = [name for _, _, files in os.walk(install_dir) for name in files]
+    assert names and len(names) < len(entries)
+    assert not [name for name in names if name.endswith(".extracting")]
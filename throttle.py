@@ -0,0 +1,64 @@
+import time
+import threading
+
+# =============================================================================
+# LÍMITE DE ANCHO DE BANDA COMPARTIDO
+# =============================================================================
+#
+# Todas las transferencias grandes (descargas de juegos, instalación por
+# rangos) pasan sus bloques por el mismo cubo de tokens, así el límite es
+# para el total y no por conexión. Las imágenes de la interfaz no se
+# limitan: son pequeñas y se notaría en la navegación. Tampoco el
+# instalador del launcher: se descarga en el hilo de la interfaz, donde
+# consume() la dejaría congelada.
+
+# Ráfaga máxima en segundos de tasa: lo que se puede gastar de golpe tras
+# estar parado sin saltarse el límite medio
+BURST_SECONDS = 0.25
+MIN_BURST = 64 * 1024
+
+
+class TokenBucket:
+    """
+    Cubo de tokens (bytes) con tasa ajustable en caliente. consume(n)
+    bloquea al hilo que llama hasta que esos bytes caben en el límite; con
+    tasa 0 no limita nada. Cada hilo reserva sus bytes y duerme fuera del
+    lock, así el ancho de banda se reparte entre todas las conexiones.
+    """
+
+    def __init__(self, rate=0):
+        self._lock = threading.Lock()
+        self._rate = 0
+        self._burst = MIN_BURST
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self.set_rate(rate)
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def set_rate(self, rate):
+        """Bytes por segundo; 0 o None para quitar el límite."""
+        with self._lock:
+            self._rate = max(0, int(rate or 0))
+            self._burst = max(MIN_BURST, int(self._rate * BURST_SECONDS))
+            self._tokens = min(self._tokens, self._burst)
+            self._last = time.monotonic()
+
+    def consume(self, n):
+        with self._lock:
+            if not self._rate:
+                return
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            # Los tokens pueden quedar en negativo: es la espera que le toca a este hilo
+            self._tokens -= n
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Límite global que comparten todas las descargas
+bandwidth = TokenBucket()
@@ -0,0 +1,363 @@
+import os
+import io
+import time
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from throttle import bandwidth
+from http_client import client
+from downloader import (
+    DownloadStopped, DOWNLOAD_TIMEOUT, load_partial_state, save_partial_state, discard_partial,
+    check_expected_size
+)
+
+# =============================================================================
+# EXTRACCIÓN DE ENTRADAS ZIP
+# =============================================================================
+
+# Tamaño de los bloques al descomprimir y escribir
+EXTRACT_BUFFER_SIZE = 256 * 1024
+# Hilos de extracción (zlib y la escritura a disco liberan el GIL)
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def safe_member_path(dest_dir, name):
+    """Ruta de destino de una entrada sin salir de dest_dir (como zipfile.extract)."""
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.path.sep) if part not in ("", os.path.curdir, os.path.pardir)]
+    return os.path.join(dest_dir, *parts)
+
+
+def extract_member(zip_ref, info, dest_dir, on_bytes=None, should_stop=None):
+    """
+    Extraer una entrada en bloques grandes, escribiendo a un temporal que se
+    renombra al final: un archivo a medias nunca reemplaza al bueno.
+    on_bytes(n) recibe los bytes descomprimidos escritos; should_stop() se
+    consulta por bloque y detiene la extracción con DownloadStopped.
+    """
+    target = safe_member_path(dest_dir, info.filename)
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return target
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_path = target + ".extracting"
+    try:
+        with zip_ref.open(info) as source, open(tmp_path, "wb", buffering=EXTRACT_BUFFER_SIZE) as f:
+            while True:
+                reason = should_stop() if should_stop else None
+                if reason:
+                    raise DownloadStopped(reason)
+                block = source.read(EXTRACT_BUFFER_SIZE)
+                if not block:
+                    break
+                f.write(block)
+                if on_bytes:
+                    on_bytes(len(block))
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def extract_archive(zip_path, dest_dir, workers=EXTRACT_WORKERS, progress=None,
+                    should_stop=None, remove_on_cancel=False):
+    """
+    Extraer un zip local repartiendo las entradas entre varios hilos, cada uno
+    con su propio ZipFile. Las entradas grandes van primero para que ningún
+    hilo se quede con la última al final. progress(bytes escritos, total)
+    se llama por bloque. should_stop() detiene todos los hilos con
+    DownloadStopped; con remove_on_cancel se borran los archivos ya extraídos
+    si el motivo es "cancel".
+    """
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        members = zip_ref.infolist()
+    total = sum(info.file_size for info in members)
+    # Las carpetas se crean antes, en orden, para no competir entre hilos
+    for info in members:
+        if info.is_dir():
+            os.makedirs(safe_member_path(dest_dir, info.filename), exist_ok=True)
+    files = sorted((info for info in members if not info.is_dir()), key=lambda info: -info.file_size)
+
+    lock = threading.Lock()
+    stop = threading.Event()
+    local = threading.local()
+    handles = []
+    written = [0]
+    extracted = []
+
+    def on_bytes(n):
+        with lock:
+            written[0] += n
+            current = written[0]
+        if progress:
+            progress(current, total)
+
+    def check_stop():
+        reason = should_stop() if should_stop else None
+        if reason:
+            stop.set()
+            return reason
+        return "stop" if stop.is_set() else None
+
+    def extract(info):
+        if stop.is_set():
+            return
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(zip_path)
+            with lock:
+                handles.append(zip_ref)
+        try:
+            extract_member(zip_ref, info, dest_dir, on_bytes, check_stop)
+        except BaseException:
+            stop.set()
+            raise
+        with lock:
+            extracted.append(info.filename)
+
+    error = None
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="zip-extract") as executor:
+        futures = [executor.submit(extract, info) for info in files]
+        for future in futures:
+            try:
+                future.result()
+            except DownloadStopped as e:
+                # El primer motivo real (pause / cancel) manda sobre el "stop" de los demás hilos
+                if error is None or getattr(error, "reason", None) == "stop":
+                    error = e
+            except Exception as e:
+                if error is None or isinstance(error, DownloadStopped):
+                    error = e
+    for zip_ref in handles:
+        zip_ref.close()
+    if error is not None:
+        if isinstance(error, DownloadStopped) and error.reason == "cancel" and remove_on_cancel:
+            _remove_extracted(dest_dir, extracted)
+        raise error
+    return dest_dir
+
+
+# =============================================================================
+# INSTALACIÓN EXTRAYENDO MIENTRAS SE DESCARGA
+# =============================================================================
+#
+# El zip remoto se lee con peticiones Range a través de HTTPRangeFile, que
+# zipfile ve como un archivo local con seek. Las entradas se extraen en el
+# orden en que están en el archivo, así que tras leer el directorio central
+# (al final del zip) el resto es una única lectura secuencial. El zip nunca
+# se guarda en disco: cada byte se escribe una sola vez, ya descomprimido.
+#
+# El progreso se guarda en el mismo sidecar que las descargas reanudables
+# ("<zip>.part.json", con "mode": "stream" y la lista de entradas ya
+# extraídas), así que pausar y reanudar funciona igual.
+
+# Saltos hacia delante menores que esto se leen y descartan en lugar de
+# abrir otra petición
+RANGE_SKIP_LIMIT = 1024 * 1024
+STREAM_STATE_INTERVAL = 1.0
+
+
+class RangeNotSupported(Exception):
+    """El servidor no acepta Range: hay que descargar el zip completo."""
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """
+    Archivo remoto de solo lectura con seek, respaldado por peticiones Range.
+    Mantiene una respuesta abierta y la reutiliza mientras las lecturas sean
+    secuenciales.
+    """
+
+    def __init__(self, url, size, validator=None, session=None, on_bytes=None):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.validator = validator
+        self.on_bytes = on_bytes
+        self._session = session or client
+        self._pos = 0
+        self._response = None
+        self._stream_pos = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def _open_stream(self):
+        self._close_stream()
+        headers = {"Range": f"bytes={self._pos}-"}
+        if self.validator:
+            headers["If-Range"] = self.validator
+        response = self._session.get(self.url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        if response.status_code != 206:
+            response.close()
+            raise requests.exceptions.ContentDecodingError(
+                "El archivo cambió en el servidor durante la instalación."
+            )
+        self._response = response
+        self._stream_pos = self._pos
+
+    def _close_stream(self):
+        if self._response is not None:
+            self._response.close()
+        self._response = None
+        self._stream_pos = None
+
+    def _read_stream(self, n):
+        data = self._response.raw.read(n)
+        if not data:
+            raise requests.exceptions.ConnectionError("Conexión cerrada antes de tiempo.")
+        bandwidth.consume(len(data))
+        self._stream_pos += len(data)
+        if self.on_bytes:
+            self.on_bytes(len(data))
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = self.size - self._pos
+        n = min(n, self.size - self._pos)
+        if n <= 0:
+            return b""
+        gap = self._pos - self._stream_pos if self._stream_pos is not None else -1
+        if not 0 <= gap <= RANGE_SKIP_LIMIT:
+            self._open_stream()
+        else:
+            while self._stream_pos < self._pos:
+                self._read_stream(self._pos - self._stream_pos)
+        chunks = []
+        while n > 0:
+            data = self._read_stream(n)
+            chunks.append(data)
+            n -= len(data)
+            self._pos += len(data)
+        return b"".join(chunks)
+
+    def close(self):
+        self._close_stream()
+        super().close()
+
+
+def _remove_extracted(dest_dir, names):
+    # Primero los archivos y después las carpetas, de la más profunda a la raíz
+    for name in sorted(names, key=lambda n: (n.endswith("/"), -n.count("/"))):
+        path = safe_member_path(dest_dir, name)
+        try:
+            if name.endswith("/"):
+                os.rmdir(path)
+            else:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def probe_remote_zip(url, session):
+    """Tamaño y validadores del zip remoto, o RangeNotSupported."""
+    with session.get(url, headers={"Range": "bytes=0-0"}, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        content_range = response.headers.get("Content-Range", "")
+        total = content_range.rsplit("/", 1)[-1]
+        if response.status_code != 206 or not total.isdigit():
+            raise RangeNotSupported(url)
+        return {
+            "url": url,
+            "size": int(total),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+
+def stream_install(url, state_path, dest_dir, progress=None, should_stop=None, expected=None):
+    """
+    Extraer el zip remoto en dest_dir sin guardarlo en disco.
+
+    state_path es la ruta que tendría el zip descargado (su sidecar guarda el
+    progreso). progress(bytes leídos, total) y should_stop() funcionan como
+    en downloader.download_file. Lanza RangeNotSupported si el servidor no
+    permite leer el zip por rangos, para volver a la instalación en dos fases.
+    De expected solo se comprueba el tamaño: el zip no se guarda entero para
+    hashearlo, pero zipfile verifica el CRC de cada entrada al extraerla.
+    """
+    remote = probe_remote_zip(url, client)
+    check_expected_size(expected, remote["size"])
+    state = load_partial_state(state_path)
+    same_file = state and state.get("mode") == "stream" and all(
+        state.get(key) == remote[key] for key in ("url", "size", "etag", "last_modified")
+    )
+    if not same_file:
+        discard_partial(state_path)
+        # Instalación nueva si la carpeta no tiene nada más que este sidecar
+        fresh = not [name for name in os.listdir(dest_dir) if not name.startswith(os.path.basename(state_path))]
+        state = dict(remote, mode="stream", done=[], downloaded=0, fresh=fresh)
+    else:
+        print(f"Reanudando instalación de {url} ({len(state['done'])} archivos ya extraídos).")
+    done = set(state["done"])
+    counter = {"read": state["downloaded"], "saved_at": 0.0}
+
+    def on_bytes(n):
+        counter["read"] += n
+        if progress:
+            progress(min(counter["read"], remote["size"]), remote["size"])
+
+    def save_state(force=False):
+        now = time.monotonic()
+        if force or now - counter["saved_at"] >= STREAM_STATE_INTERVAL:
+            counter["saved_at"] = now
+            save_partial_state(state_path, dict(state, done=sorted(done), downloaded=counter["read"]))
+
+    save_state(force=True)
+    validator = remote["etag"] or remote["last_modified"]
+    cancelled = False
+    with HTTPRangeFile(url, remote["size"], validator, client, on_bytes) as remote_file:
+        try:
+            with zipfile.ZipFile(remote_file) as zip_ref:
+                # En el orden del archivo la lectura es secuencial
+                members = sorted(zip_ref.infolist(), key=lambda info: info.header_offset)
+                for info in members:
+                    if info.filename in done:
+                        continue
+                    extract_member(zip_ref, info, dest_dir, should_stop=should_stop)
+                    done.add(info.filename)
+                    save_state()
+        except DownloadStopped as e:
+            if e.reason == "cancel":
+                cancelled = True
+                if state.get("fresh"):
+                    # Cancelar una instalación nueva no deja archivos sueltos
+                    _remove_extracted(dest_dir, done)
+            raise
+        finally:
+            if cancelled:
+                # Ni el sidecar: la siguiente instalación empieza de cero
+                discard_partial(state_path)
+            else:
+                save_state(force=True)
+    discard_partial(state_path)
+    return dest_dir